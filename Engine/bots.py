@@ -0,0 +1,289 @@
+"""
+Bot-Strategien für Skyjo.
+
+Jede Strategie führt den kompletten Zug des aktuellen Spielers einer Round über
+Round.apply aus und benötigt daher kein pygame. Gameplay_Automated und der Simulator
+verwenden dieselben Funktionen.
+"""
+from Engine.rules import Move, FLIP, DRAW, SWAP, ROWS, COLS, CARD_COUNTS
+from GameLog import BOTS
+
+# Durchschnittlicher Wert einer verdeckten Karte (etwa 5,07)
+EXPECTED_HIDDEN = sum(value * count for value, count in CARD_COUNTS.items()) / sum(CARD_COUNTS.values())
+FINISH_MARGIN = 10  # Vorsprung in Punkten, mit dem der schwere Bot eine Runde beendet
+FINISH_PATIENCE = 120  # Züge, nach denen der geforderte Vorsprung auf 0 gesunken ist
+LAST_TURN_TAKE_GAIN = 2  # Mindestgewinn, ab dem er im letzten Zug die Stack-Karte nimmt
+
+
+def is_low(value):
+    """Karten von -2 bis 4 lohnen sich zum Tauschen."""
+    return -2 <= value <= 4
+
+
+def automated_initial_turn(game_round):
+    """
+    Deckt für den aktuellen Spieler in der Anfangsrunde zwei zufällige Karten auf.
+
+    Input:
+    - game_round: Die laufende Round.
+    """
+    hand = game_round.current_hand
+    for index in game_round.rng.sample(hand.hidden_indices(), k=2):
+        game_round.apply(Move(FLIP, index))
+
+
+def swap_low_card(game_round):
+    """
+    Tauscht die oberste Stack-Karte gegen eine zufällige offene Karte von 5 bis 12,
+    sonst gegen eine zufällige verdeckte Karte.
+    """
+    hand = game_round.current_hand
+    open_cards = [index for index in hand.open_indices() if 5 <= hand.values[index] <= 12]
+    candidates = open_cards or hand.hidden_indices()
+    game_round.apply(Move(SWAP, game_round.rng.choice(candidates)))
+
+
+def open_random_hidden_card(game_round):
+    """
+    Deckt eine zufällige verdeckte Karte des aktuellen Spielers auf.
+    """
+    hidden_cards = game_round.current_hand.hidden_indices()
+    game_round.apply(Move(FLIP, game_round.rng.choice(hidden_cards)))
+
+
+def get_highest_visible_card_index(hand):
+    """
+    Ermittelt den Index der höchsten offenen Karte in der Hand.
+
+    Input:
+    - hand: Die Hand des Spielers.
+
+    Output:
+    - Index der höchsten offenen Karte.
+    """
+    return max(hand.open_indices(), key=lambda index: hand.values[index])
+
+
+def get_card_index_to_swap(game_round, value_top_card):
+    """
+    Findet die offene Karte, deren Wert der Stack-Karte am nächsten liegt.
+
+    Input:
+    - game_round: Die laufende Round.
+    - value_top_card: Der Wert der obersten Stack-Karte.
+
+    Output:
+    - Der Index der Karte zum Tauschen.
+    """
+    hand = game_round.current_hand
+    open_cards = hand.open_indices()
+    if open_cards:
+        return min(open_cards, key=lambda index: abs(hand.values[index] - value_top_card))
+    return game_round.rng.choice(hand.hidden_indices())
+
+
+def automated_player_turn_easy(game_round):
+    """
+    Einfacher Bot: nimmt niedrige Stack-Karten, zieht sonst vom Deck und deckt bei hohen Karten auf.
+    """
+    if is_low(game_round.stack_top):
+        BOTS.debug("Player %d (Easy): takes low stack card %s", game_round.current_player + 1, game_round.stack_top)
+        swap_low_card(game_round)
+        return
+
+    game_round.apply(Move(DRAW))
+    if is_low(game_round.stack_top):
+        BOTS.debug("Player %d (Easy): keeps drawn card %s", game_round.current_player + 1, game_round.stack_top)
+        swap_low_card(game_round)
+    else:
+        BOTS.debug("Player %d (Easy): discards %s, flips a card", game_round.current_player + 1, game_round.stack_top)
+        open_random_hidden_card(game_round)
+
+
+def automated_player_turn_medium(game_round):
+    """
+    Mittlerer Bot: wie der einfache Bot, behält bei hohen Karten aber die Karten des
+    vorherigen Spielers im Blick und ersetzt kurz vor Schluss die höchste Karte.
+    """
+    if is_low(game_round.stack_top):
+        BOTS.debug("Player %d (Medium): takes low stack card %s", game_round.current_player + 1, game_round.stack_top)
+        swap_low_card(game_round)
+        return
+
+    game_round.apply(Move(DRAW))
+    value_top_card = game_round.stack_top
+    if is_low(value_top_card):
+        BOTS.debug("Player %d (Medium): keeps drawn card %s", game_round.current_player + 1, value_top_card)
+        swap_low_card(game_round)
+        return
+
+    hand = game_round.current_hand
+    open_values = [hand.values[index] for index in hand.open_indices()]
+
+    # Nur noch eine verdeckte Karte: höchste Karte ersetzen statt die Runde aufzudecken
+    if hand.hidden_count() <= 1:
+        BOTS.debug("Player %d (Medium): last hidden card, replaces highest card with %s",
+                   game_round.current_player + 1, value_top_card)
+        game_round.apply(Move(SWAP, get_highest_visible_card_index(hand)))
+        return
+
+    prev_player = (game_round.current_player - 1) % game_round.player_count
+    prev_hand = game_round.hands[prev_player]
+    prev_values = [prev_hand.values[index] for index in prev_hand.open_indices()]
+    has_negative = any(value < 0 for value in open_values)
+
+    if value_top_card in open_values and not has_negative \
+            and value_top_card in prev_values:
+        BOTS.debug("Player %d (Medium): pairs %s seen at previous player", game_round.current_player + 1, value_top_card)
+        game_round.apply(Move(SWAP, get_card_index_to_swap(game_round, value_top_card)))
+    else:
+        BOTS.debug("Player %d (Medium): discards %s, flips a card", game_round.current_player + 1, value_top_card)
+        open_random_hidden_card(game_round)
+
+
+def best_swap(hand, value):
+    """
+    Bewertet jede Position der Hand für eine Karte mit dem angegebenen Wert und wählt die
+    mit dem größten erwarteten Punktegewinn. Offene Karten zählen mit ihrem Wert, verdeckte
+    mit dem Durchschnitt des Decks; vervollständigt die Karte eine Spalte, zählt die ganze
+    Spalte als gewonnen.
+
+    Input:
+    - hand: Die Hand des Spielers.
+    - value: Der Wert der Karte, die getauscht werden könnte.
+
+    Output:
+    - (Gewinn, Index) der besten Position; Index ist None, wenn kein Tausch gewinnt.
+    """
+    open_bits = hand.visible & ~hand.elim
+    best_gain, best_index = 0, None
+    for col in range(COLS):
+        column = [col + row * COLS for row in range(ROWS)]
+        if hand.elim >> col & 1:
+            continue
+        matching = [index for index in column if open_bits >> index & 1 and hand.values[index] == value]
+        for index in column:
+            is_open = open_bits >> index & 1
+            current = hand.values[index] if is_open else EXPECTED_HIDDEN
+            gain = current - value
+            if len(matching) == 2 and index not in matching:
+                gain = current + 2 * value  # Dreierreihe: die ganze Spalte fällt weg
+            if gain > best_gain:
+                best_gain, best_index = gain, index
+    return best_gain, best_index
+
+
+def may_finish(game_round, index):
+    """
+    Prüft, ob der schwere Bot seine letzte verdeckte Karte aufdecken darf. Wer die Runde
+    beendet und nicht die wenigsten Punkte hat, zahlt doppelt; deshalb nur, wenn die eigene
+    Hand danach voraussichtlich um FINISH_MARGIN Punkte unter allen anderen liegt. Der
+    Abstand schrumpft mit der Länge der Runde, damit auch Tische nur mit schweren Bots enden.
+
+    Input:
+    - game_round: Die laufende Round.
+    - index: Position, an die die Stack-Karte gelegt würde, oder None zum Aufdecken.
+
+    Output:
+    - True, wenn der Zug die Runde nicht beendet oder der Bot dabei weit genug vorne liegt.
+    """
+    hand = game_round.current_hand
+    hidden = hand.hidden_indices()
+    if game_round.last_turn_active or len(hidden) != 1 or (index is not None and index != hidden[0]):
+        return True
+    margin = FINISH_MARGIN * max(0.0, 1 - game_round.turns_played / FINISH_PATIENCE)
+    own = hand.score() + (game_round.stack_top if index is not None else EXPECTED_HIDDEN)
+    others = [other.score() + other.hidden_count() * EXPECTED_HIDDEN
+              for player, other in enumerate(game_round.hands) if player != game_round.current_player]
+    return own + margin <= min(others)
+
+
+def swap_low_card_hard(game_round):
+    """
+    Tauscht die oberste Stack-Karte gegen die höchste offene Karte von 5 bis 12, sonst gegen
+    eine zufällige verdeckte Karte. Würde das die Runde ohne Vorsprung beenden, ersetzt der
+    Bot stattdessen seine höchste offene Karte.
+    """
+    hand = game_round.current_hand
+    high_cards = [index for index in hand.open_indices() if hand.values[index] >= 5]
+    if high_cards:
+        index = max(high_cards, key=lambda index: hand.values[index])
+    else:
+        index = game_round.rng.choice(hand.hidden_indices())
+        if not may_finish(game_round, index):
+            index = get_highest_visible_card_index(hand)
+    game_round.apply(Move(SWAP, index))
+
+
+def play_last_turn_hard(game_round):
+    """
+    Letzter Zug, nachdem ein anderer Spieler alle Karten aufgedeckt hat: jede Verbesserung
+    zählt, verdeckte Karten werden gleich mit ihrem Wert gewertet.
+    """
+    hand = game_round.current_hand
+    gain, index = best_swap(hand, game_round.stack_top)
+    if gain < LAST_TURN_TAKE_GAIN:
+        game_round.apply(Move(DRAW))
+        gain, index = best_swap(hand, game_round.stack_top)
+    if index is None:
+        BOTS.debug("Player %d (Hard): last turn, discards %s", game_round.current_player + 1, game_round.stack_top)
+        open_random_hidden_card(game_round)
+    else:
+        BOTS.debug("Player %d (Hard): last turn, places %s (gain %.1f)", game_round.current_player + 1,
+                   game_round.stack_top, gain)
+        game_round.apply(Move(SWAP, index))
+
+
+def automated_player_turn_hard(game_round):
+    """
+    Schwerer Bot: spielt wie der mittlere Bot, ersetzt mit niedrigen Karten aber gezielt die
+    höchste offene Karte und beendet die Runde nur mit Vorsprung (siehe may_finish), damit
+    er die doppelten Punkte des ersten Spielers vermeidet. Im letzten Zug nimmt er jede
+    Verbesserung mit.
+    """
+    if game_round.last_turn_active:
+        play_last_turn_hard(game_round)
+        return
+
+    if is_low(game_round.stack_top):
+        BOTS.debug("Player %d (Hard): takes low stack card %s", game_round.current_player + 1, game_round.stack_top)
+        swap_low_card_hard(game_round)
+        return
+
+    game_round.apply(Move(DRAW))
+    value_top_card = game_round.stack_top
+    if is_low(value_top_card):
+        BOTS.debug("Player %d (Hard): keeps drawn card %s", game_round.current_player + 1, value_top_card)
+        swap_low_card_hard(game_round)
+        return
+
+    hand = game_round.current_hand
+    if hand.hidden_count() <= 1 and not may_finish(game_round, None):
+        BOTS.debug("Player %d (Hard): not ahead, replaces highest card with %s",
+                   game_round.current_player + 1, value_top_card)
+        game_round.apply(Move(SWAP, get_highest_visible_card_index(hand)))
+        return
+
+    BOTS.debug("Player %d (Hard): discards %s, flips a card", game_round.current_player + 1, value_top_card)
+    open_random_hidden_card(game_round)
+
+
+BOT_TURNS = {
+    "Easy": automated_player_turn_easy,
+    "Medium": automated_player_turn_medium,
+    "Hard": automated_player_turn_hard,
+}
+
+
+def play_bot_turn(game_round, difficulty):
+    """
+    Führt den Zug des aktuellen Spielers mit der angegebenen Schwierigkeit aus.
+
+    Input:
+    - game_round: Die laufende Round.
+    - difficulty: "Easy", "Medium" oder "Hard".
+    """
+    turn = BOT_TURNS.get(difficulty)
+    if turn is None:
+        raise ValueError("Unbekannter Schwierigkeitsgrad")
+    turn(game_round)
@@ -0,0 +1,517 @@
+"""
+Headless Regel-Engine für Skyjo.
+
+Das Modul enthält die komplette Rundenlogik (Austeilen, Aufdecken, Tauschen, Dreierreihen,
+letzte Runde, Wertung) sowie ein Match über mehrere Runden. Es importiert kein pygame, damit
+Runden ohne Fenster simuliert werden können. Die Gameplay-States zeichnen nur noch den
+Zustand einer Round und übersetzen Mausklicks in Züge.
+"""
+import random
+from array import array
+from collections import namedtuple
+
+ROWS = 3
+COLS = 4
+HAND_SIZE = ROWS * COLS
+ALL_VISIBLE = (1 << HAND_SIZE) - 1
+# Bitmaske jeder Spalte (Positionen col, col + 4, col + 8)
+COLUMN_MASKS = [sum(1 << (row * COLS + col) for row in range(ROWS)) for col in range(COLS)]
+GAME_OVER_SCORE = 100
+
+# Zusammensetzung des Decks (Wert -> Anzahl), insgesamt 150 Karten
+CARD_COUNTS = {**{value: 10 for value in range(1, 13)}, -1: 10, 0: 15, -2: 5}
+
+# Zugarten
+FLIP = "flip"  # Verdeckte Handkarte aufdecken
+DRAW = "draw"  # Oberste Karte des Decks offen auf den Stack legen
+SWAP = "swap"  # Oberste Stack-Karte gegen eine Handkarte tauschen
+
+# Phasen einer Runde
+PHASE_INITIAL = "initial"  # Jeder Spieler deckt zwei Karten auf
+PHASE_TURN = "turn"  # Reguläre Spielzüge
+PHASE_OVER = "over"  # Runde beendet, alle Karten aufgedeckt
+
+Move = namedtuple("Move", ["action", "index"], defaults=[None])
+
+
+def generate_deck():
+    """
+    Erzeugt die Werte aller 150 Karten in fester Reihenfolge.
+
+    Output:
+    - Eine Liste von Kartenwerten (int).
+    """
+    cards = []
+    for value, count in CARD_COUNTS.items():
+        cards.extend([value] * count)
+    return cards
+
+
+def new_seed():
+    """
+    Erzeugt einen neuen Seed für ein Match aus der Zufallsquelle des Betriebssystems.
+
+    Output:
+    - Ein 64-Bit-Seed (int).
+    """
+    return random.SystemRandom().getrandbits(64)
+
+
+def apply_first_finisher_penalty(round_score, first_to_finish):
+    """
+    Verdoppelt die Punkte des Spielers, der zuerst alle Karten aufgedeckt hat,
+    falls er nicht die niedrigste Punktzahl der Runde hat.
+
+    Input:
+    - round_score: Liste der Punktzahlen der Runde (wird verändert).
+    - first_to_finish: 0-basierter Index des Spielers oder None.
+
+    Output:
+    - Die angepasste Liste der Punktzahlen.
+    """
+    if first_to_finish is not None and round_score:
+        if round_score[first_to_finish] != min(round_score):
+            round_score[first_to_finish] *= 2
+    return round_score
+
+
+class CardView:
+    """
+    Leichte Sicht auf eine Position einer Hand für die Anzeige. Die Daten liegen in der Hand.
+    """
+    __slots__ = ("hand", "index")
+
+    def __init__(self, hand, index):
+        """
+        Input:
+        - hand: Die Hand, zu der die Karte gehört.
+        - index: Position der Karte in der Hand.
+        """
+        self.hand = hand
+        self.index = index
+
+    @property
+    def value(self):
+        return self.hand.values[self.index]
+
+    @property
+    def visible(self):
+        return bool(self.hand.visible >> self.index & 1)
+
+    @property
+    def elim(self):
+        return bool(self.hand.elim >> self.index & 1)
+
+    @property
+    def highlighted(self):
+        return bool(self.hand.highlighted >> self.index & 1)
+
+    @highlighted.setter
+    def highlighted(self, value):
+        self.hand.set_highlighted(self.index, value)
+
+
+class Hand:
+    """
+    Kompakte Hand aus 12 Karten (3 Zeilen x 4 Spalten, zeilenweise). Die Werte liegen in
+    einem array('b'), Sichtbarkeit, Elimination und Hervorhebung als Bitmasken
+    (Bit i = Position i).
+
+    Die Punktzahl der offenen, nicht eliminierten Karten wird bei jedem Aufdecken, Tauschen
+    und Eliminieren mitgeführt. Für die Dreierreihen-Prüfung merkt sich die Hand nur die
+    Spalten, die sich seit der letzten Prüfung geändert haben.
+    """
+    __slots__ = ("values", "visible", "elim", "highlighted", "total", "changed_columns")
+
+    def __init__(self, values):
+        """
+        Erstellt eine Hand aus 12 verdeckten Karten.
+
+        Input:
+        - values: Die Werte der ausgeteilten Karten.
+        """
+        self.values = array("b", values)
+        self.visible = 0
+        self.elim = 0
+        self.highlighted = 0
+        self.total = 0
+        self.changed_columns = 0
+
+    def __getitem__(self, index):
+        if not 0 <= index < HAND_SIZE:
+            raise IndexError("Kartenposition außerhalb der Hand")
+        return CardView(self, index)
+
+    def __len__(self):
+        return HAND_SIZE
+
+    def __iter__(self):
+        return (CardView(self, index) for index in range(HAND_SIZE))
+
+    def flip(self, index):
+        """
+        Deckt die Karte an der angegebenen Position auf.
+
+        Input:
+        - index: Position der Karte in der Hand.
+        """
+        bit = 1 << index
+        if not self.visible & bit:
+            self.visible |= bit
+            self.total += self.values[index]
+            self.changed_columns |= 1 << (index % COLS)
+
+    def swap(self, index, value):
+        """
+        Ersetzt die Karte an der angegebenen Position durch eine offene Karte.
+
+        Input:
+        - index: Position der Karte in der Hand.
+        - value: Der Wert der neuen Karte.
+
+        Output:
+        - Der Wert der ersetzten Karte.
+        """
+        bit = 1 << index
+        old_value = self.values[index]
+        if self.visible & ~self.elim & bit:
+            self.total -= old_value
+        self.values[index] = value
+        self.visible |= bit
+        self.elim &= ~bit
+        self.highlighted &= ~bit
+        self.total += value
+        self.changed_columns |= 1 << (index % COLS)
+        return old_value
+
+    def set_highlighted(self, index, highlighted):
+        """
+        Setzt oder entfernt die Hervorhebung einer Karte.
+
+        Input:
+        - index: Position der Karte in der Hand.
+        - highlighted: True zum Hervorheben.
+        """
+        if highlighted:
+            self.highlighted |= 1 << index
+        else:
+            self.highlighted &= ~(1 << index)
+
+    def hidden_indices(self):
+        """Gibt die Positionen aller verdeckten Karten zurück."""
+        visible = self.visible
+        return [index for index in range(HAND_SIZE) if not visible >> index & 1]
+
+    def open_indices(self):
+        """Gibt die Positionen aller aufgedeckten, nicht eliminierten Karten zurück."""
+        open_bits = self.visible & ~self.elim
+        return [index for index in range(HAND_SIZE) if open_bits >> index & 1]
+
+    def hidden_count(self):
+        """Gibt die Anzahl der verdeckten Karten zurück."""
+        return HAND_SIZE - bin(self.visible).count("1")
+
+    def all_visible(self):
+        """Gibt True zurück, wenn alle Karten der Hand aufgedeckt sind."""
+        return self.visible == ALL_VISIBLE
+
+    def reveal_all(self):
+        """Deckt alle verdeckten Karten auf."""
+        for index in self.hidden_indices():
+            self.total += self.values[index]
+        self.visible = ALL_VISIBLE
+
+    def check_three_in_a_row(self):
+        """
+        Eliminiert alle Spalten mit drei gleichen, aufgedeckten Karten. Geprüft werden nur
+        Spalten, die sich seit der letzten Prüfung geändert haben.
+
+        Output:
+        - Liste der Spaltenindizes, die durch diesen Aufruf eliminiert wurden.
+        """
+        eliminated = []
+        open_bits = self.visible & ~self.elim
+        values = self.values
+        for col, mask in enumerate(COLUMN_MASKS):
+            if not self.changed_columns >> col & 1:
+                continue
+            if open_bits & mask == mask and values[col] == values[col + COLS] == values[col + 2 * COLS]:
+                self.elim |= mask
+                self.total -= 3 * values[col]
+                eliminated.append(col)
+        self.changed_columns = 0
+        return eliminated
+
+    def eliminate(self, mask):
+        """
+        Übernimmt eliminierte Positionen von außen, z.B. aus dem Zustand des Servers.
+
+        Input:
+        - mask: Bitmaske aller eliminierten Positionen.
+        """
+        removed = mask & self.visible & ~self.elim  # Offene Karten, die jetzt nicht mehr zählen
+        for index in range(HAND_SIZE):
+            if removed >> index & 1:
+                self.total -= self.values[index]
+        self.elim = mask
+
+    def score(self):
+        """
+        Gibt die Punktzahl der Hand aus allen offenen, nicht eliminierten Karten zurück.
+
+        Output:
+        - Die Punktzahl (int).
+        """
+        return self.total
+
+    def opening_sum(self):
+        """
+        Summe der ersten zwei aufgedeckten Karten, nach der der Startspieler bestimmt wird.
+
+        Output:
+        - Die Summe oder None, falls weniger als zwei Karten aufgedeckt sind.
+        """
+        visible_values = [self.values[index] for index in range(HAND_SIZE) if self.visible >> index & 1]
+        if len(visible_values) < 2:
+            return None
+        return visible_values[0] + visible_values[1]
+
+
+class Round:
+    def __init__(self, player_count, rng=None):
+        """
+        Erstellt eine neue Runde: mischt das Deck, teilt aus und legt die erste Karte auf den Stack.
+
+        Input:
+        - player_count: Anzahl der Spieler.
+        - rng: random.Random des Matches (Standard: neuer Generator mit zufälligem Seed).
+        """
+        self.player_count = player_count
+        self.rng = rng if rng is not None else random.Random(new_seed())
+        self.deck = array("b", generate_deck())
+        self.rng.shuffle(self.deck)
+        self.hands = self.deal()
+        self.stack = array("b", [self.deck.pop()])
+
+        self.phase = PHASE_INITIAL
+        self.current_player = 0
+        self.cards_turned = 0
+        self.deck_action_taken = False
+        self.starting_player = None
+        self.first_to_finish = None
+        self.last_turn_active = False
+        self.last_turn_player = None
+        self.turn_counter = 0
+        self.turns_played = 0
+
+    def deal(self):
+        """
+        Teilt jedem Spieler reihum 12 Karten aus.
+
+        Output:
+        - Eine Liste mit einer Hand pro Spieler.
+        """
+        values = [[] for _ in range(self.player_count)]
+        for _ in range(HAND_SIZE):
+            for player_values in values:
+                player_values.append(self.deck.pop())
+        return [Hand(player_values) for player_values in values]
+
+    @property
+    def stack_top(self):
+        """Wert der obersten Karte des Stacks oder None."""
+        return self.stack[-1] if self.stack else None
+
+    @property
+    def current_hand(self):
+        """Hand des Spielers, der am Zug ist."""
+        return self.hands[self.current_player]
+
+    def legal_moves(self):
+        """
+        Ermittelt alle erlaubten Züge des aktuellen Spielers.
+
+        Output:
+        - Eine Liste von Move-Tupeln.
+        """
+        if self.phase == PHASE_OVER:
+            return []
+
+        hand = self.current_hand
+        moves = [Move(FLIP, index) for index in hand.hidden_indices()]
+        if self.phase == PHASE_INITIAL:
+            return moves
+
+        if not self.deck_action_taken and (self.deck or len(self.stack) > 1):
+            moves.append(Move(DRAW))
+        if self.stack:
+            moves.extend(Move(SWAP, index) for index in range(HAND_SIZE) if not hand.elim >> index & 1)
+        return moves
+
+    def apply(self, move):
+        """
+        Führt einen Zug des aktuellen Spielers aus.
+
+        Input:
+        - move: Ein Move-Tupel aus legal_moves().
+        """
+        if move not in self.legal_moves():
+            raise ValueError(f"Ungültiger Zug {move} in Phase '{self.phase}'")
+
+        if self.phase == PHASE_INITIAL:
+            self.current_hand.flip(move.index)
+            self.cards_turned += 1
+            if self.cards_turned >= 2:
+                self.cards_turned = 0
+                self.current_player = (self.current_player + 1) % self.player_count
+                if self.current_player == 0:
+                    self.determine_starting_player()
+        elif move.action == DRAW:
+            self.draw_from_deck()
+        elif move.action == SWAP:
+            self.stack.append(self.current_hand.swap(move.index, self.stack.pop()))
+            self.finish_turn()
+        elif move.action == FLIP:
+            self.current_hand.flip(move.index)
+            self.finish_turn()
+
+    def draw_from_deck(self):
+        """
+        Legt die oberste Karte des Decks offen auf den Stack. Ist das Deck leer,
+        wird der Stack bis auf die oberste Karte neu gemischt.
+        """
+        if not self.deck:
+            top = self.stack.pop()
+            self.deck, self.stack = self.stack, array("b", [top])
+            self.rng.shuffle(self.deck)
+        self.stack.append(self.deck.pop())
+        self.deck_action_taken = True
+
+    def determine_starting_player(self):
+        """
+        Bestimmt den Startspieler anhand der höchsten Summe der ersten zwei aufgedeckten Karten
+        und beendet die Anfangsrunde.
+        """
+        highest_sum = None
+        starting_player = 0
+        for i, hand in enumerate(self.hands):
+            card_sum = hand.opening_sum()
+            if card_sum is not None and (highest_sum is None or card_sum > highest_sum):
+                highest_sum = card_sum
+                starting_player = i
+
+        self.starting_player = starting_player
+        self.current_player = starting_player
+        self.phase = PHASE_TURN
+
+    def finish_turn(self):
+        """
+        Prüft nach einem Zug auf Dreierreihen und aufgedeckte Hände und beendet den Zug.
+        """
+        hand = self.current_hand
+        hand.check_three_in_a_row()
+        if hand.all_visible():
+            if self.first_to_finish is None:
+                self.first_to_finish = self.current_player
+            self.start_last_turn()
+        self.end_turn()
+
+    def start_last_turn(self):
+        """
+        Aktiviert die letzte Runde, nachdem ein Spieler alle Karten aufgedeckt hat.
+        """
+        if not self.last_turn_active:
+            self.last_turn_active = True
+            self.last_turn_player = self.current_player
+            self.turn_counter = 0
+
+    def end_turn(self):
+        """
+        Wechselt zum nächsten Spieler oder beendet die Runde, wenn alle ihren letzten Zug gemacht haben.
+        """
+        self.turns_played += 1
+        if self.last_turn_active:
+            self.turn_counter += 1
+            if self.turn_counter >= self.player_count:
+                self.round_over()
+                return
+
+        self.current_player = (self.current_player + 1) % self.player_count
+        self.deck_action_taken = False
+
+    def round_over(self):
+        """
+        Beendet die Runde und deckt alle verdeckten Karten auf.
+        """
+        for hand in self.hands:
+            hand.reveal_all()
+        self.phase = PHASE_OVER
+
+    def scores(self):
+        """
+        Berechnet die Punktzahl jeder Hand.
+
+        Output:
+        - Eine Liste der Punktzahlen (int) pro Spieler.
+        """
+        return [hand.score() for hand in self.hands]
+
+
+class Match:
+    def __init__(self, player_count, seed=None, target_score=GAME_OVER_SCORE):
+        """
+        Erstellt ein Match über mehrere Runden, bis ein Spieler die Zielpunktzahl erreicht.
+        Alle Runden und Bot-Entscheidungen verwenden einen eigenen random.Random mit dem
+        Seed des Matches, sodass ein Match mit demselben Seed exakt nachgespielt werden kann.
+
+        Input:
+        - player_count: Anzahl der Spieler.
+        - seed: Seed des Matches (Standard: neuer Seed aus new_seed()).
+        - target_score: Punktzahl, ab der das Match endet.
+        """
+        self.player_count = player_count
+        self.seed = seed if seed is not None else new_seed()
+        self.rng = random.Random(self.seed)
+        self.metadata = {'seed': self.seed, 'player_count': player_count, 'target_score': target_score}
+        self.target_score = target_score
+        self.round = None
+        self.round_scores = []
+        self.total_scores = [0] * player_count
+
+    def new_round(self):
+        """
+        Startet eine neue Runde.
+
+        Output:
+        - Die neue Round.
+        """
+        self.round = Round(self.player_count, rng=self.rng)
+        return self.round
+
+    def finish_round(self):
+        """
+        Wertet die beendete Runde inklusive Verdopplung für den ersten Spieler aus.
+
+        Output:
+        - Die Punktzahlen der Runde.
+        """
+        if self.round is None or self.round.phase != PHASE_OVER:
+            raise ValueError("Die aktuelle Runde ist noch nicht beendet")
+        round_score = apply_first_finisher_penalty(self.round.scores(), self.round.first_to_finish)
+        self.round_scores.append(round_score)
+        for i, score in enumerate(round_score):
+            self.total_scores[i] += score
+        return round_score
+
+    def is_over(self):
+        """Gibt True zurück, wenn ein Spieler die Zielpunktzahl erreicht hat."""
+        return any(score >= self.target_score for score in self.total_scores)
+
+    def winner(self):
+        """
+        Bestimmt den Spieler mit der niedrigsten Gesamtpunktzahl.
+
+        Output:
+        - 0-basierter Index des Gewinners.
+        """
+        return self.total_scores.index(min(self.total_scores))
@@ -0,0 +1,260 @@
+"""
+Monte-Carlo-Simulator zum Vergleich der Bot-Schwierigkeitsgrade.
+
+Spielt komplette Matches bis 100 Punkte zwischen den Bot-Strategien aus Engine.bots,
+verteilt auf alle CPU-Kerne, und gibt Gewinnquoten, durchschnittliche Rundenlänge
+und Punkteverteilungen aus.
+
+Aufruf:
+    python -m Engine.simulate --bots Easy,Medium,Hard --games 100000
+"""
+import argparse
+import multiprocessing
+import random
+import time
+from collections import Counter
+
+from Engine.rules import Match, PHASE_INITIAL, PHASE_OVER, new_seed
+from Engine.bots import BOT_TURNS, automated_initial_turn, play_bot_turn
+
+
+def play_round(game_round, difficulties):
+    """
+    Spielt eine Runde komplett mit Bots durch.
+
+    Input:
+    - game_round: Die neue Round.
+    - difficulties: Schwierigkeitsgrad pro Spieler.
+    """
+    while game_round.phase == PHASE_INITIAL:
+        automated_initial_turn(game_round)
+    while game_round.phase != PHASE_OVER:
+        play_bot_turn(game_round, difficulties[game_round.current_player])
+
+
+def play_match(difficulties, seed=None):
+    """
+    Spielt ein komplettes Match bis 100 Punkte.
+
+    Input:
+    - difficulties: Schwierigkeitsgrad pro Spieler, z.B. ["Easy", "Hard"].
+    - seed: Seed des Matches; mit demselben Seed verläuft das Match identisch.
+
+    Output:
+    - Das beendete Match und die Anzahl der Züge pro Runde.
+    """
+    match = Match(len(difficulties), seed=seed)
+    round_lengths = []
+    while not match.is_over():
+        game_round = match.new_round()
+        play_round(game_round, difficulties)
+        match.finish_round()
+        round_lengths.append(game_round.turns_played)
+    return match, round_lengths
+
+
+def new_stats(player_count):
+    """
+    Erstellt leere Statistiken für eine Simulation.
+
+    Output:
+    - Ein Dictionary mit Zählern pro Spieler.
+    """
+    return {
+        'games': 0,
+        'rounds': 0,
+        'turns': 0,
+        'wins': [0] * player_count,
+        'final_scores': [Counter() for _ in range(player_count)],
+        'round_scores': [Counter() for _ in range(player_count)],
+    }
+
+
+def merge_stats(total, part):
+    """
+    Addiert die Statistiken eines Teilergebnisses auf die Gesamtstatistik.
+
+    Input:
+    - total: Gesamtstatistik (wird verändert).
+    - part: Teilergebnis eines Workers.
+    """
+    total['games'] += part['games']
+    total['rounds'] += part['rounds']
+    total['turns'] += part['turns']
+    for i in range(len(total['wins'])):
+        total['wins'][i] += part['wins'][i]
+        total['final_scores'][i].update(part['final_scores'][i])
+        total['round_scores'][i].update(part['round_scores'][i])
+    return total
+
+
+def run_batch(job):
+    """
+    Spielt eine Anzahl Matches in einem Worker-Prozess.
+
+    Input:
+    - job: Tupel aus (difficulties, games, seed). Jeder Auftrag hat einen eigenen Seed,
+      aus dem die Seeds seiner Matches gezogen werden.
+
+    Output:
+    - Statistiken der gespielten Matches.
+    """
+    difficulties, games, seed = job
+    seeds = random.Random(seed)
+    stats = new_stats(len(difficulties))
+    for _ in range(games):
+        match, round_lengths = play_match(difficulties, seed=seeds.getrandbits(64))
+        stats['games'] += 1
+        stats['rounds'] += len(round_lengths)
+        stats['turns'] += sum(round_lengths)
+        stats['wins'][match.winner()] += 1
+        for i, score in enumerate(match.total_scores):
+            stats['final_scores'][i][score] += 1
+        for round_score in match.round_scores:
+            for i, score in enumerate(round_score):
+                stats['round_scores'][i][score] += 1
+    return stats
+
+
+def split_games(games, chunks):
+    """
+    Teilt die Anzahl der Matches möglichst gleichmäßig auf.
+
+    Output:
+    - Liste der Matchanzahlen pro Auftrag (ohne Nullen).
+    """
+    base, rest = divmod(games, chunks)
+    return [base + (1 if i < rest else 0) for i in range(chunks) if base or i < rest]
+
+
+def simulate(difficulties, games, processes=None, chunk_size=500, seed=None):
+    """
+    Simuliert Matches parallel auf allen CPU-Kernen.
+
+    Input:
+    - difficulties: Schwierigkeitsgrad pro Spieler.
+    - games: Anzahl der Matches.
+    - processes: Anzahl der Worker-Prozesse (Standard: alle Kerne).
+    - chunk_size: Matches pro Auftrag an einen Worker.
+    - seed: Basis-Seed der Simulation (Standard: neuer Seed). Bei gleichem Seed und gleicher
+      chunk_size ist das Ergebnis unabhängig von der Anzahl der Prozesse identisch.
+
+    Output:
+    - Die zusammengefassten Statistiken.
+    """
+    processes = processes or multiprocessing.cpu_count()
+    chunks = max(1, games // chunk_size)
+    seeds = random.Random(seed if seed is not None else new_seed())
+    jobs = [(difficulties, count, seeds.getrandbits(64)) for count in split_games(games, chunks)]
+
+    stats = new_stats(len(difficulties))
+    if processes == 1:
+        for job in jobs:
+            merge_stats(stats, run_batch(job))
+        return stats
+
+    with multiprocessing.Pool(processes) as pool:
+        for part in pool.imap_unordered(run_batch, jobs):
+            merge_stats(stats, part)
+    return stats
+
+
+def percentile(counter, fraction):
+    """
+    Bestimmt ein Perzentil aus einem Histogramm.
+
+    Input:
+    - counter: Counter mit Wert -> Häufigkeit.
+    - fraction: Gesuchter Anteil zwischen 0 und 1.
+
+    Output:
+    - Der Wert des Perzentils oder None bei leerem Histogramm.
+    """
+    total = sum(counter.values())
+    if not total:
+        return None
+    threshold = fraction * total
+    seen = 0
+    for value in sorted(counter):
+        seen += counter[value]
+        if seen >= threshold:
+            return value
+    return max(counter)
+
+
+def mean(counter):
+    """Mittelwert eines Histogramms."""
+    total = sum(counter.values())
+    return sum(value * count for value, count in counter.items()) / total if total else 0.0
+
+
+def format_report(difficulties, stats, elapsed):
+    """
+    Formatiert die Ergebnisse der Simulation als Text.
+
+    Output:
+    - Der Bericht als String.
+    """
+    games = stats['games']
+    rounds = stats['rounds']
+    lines = [
+        f"Matches: {games}  Runden: {rounds}  Dauer: {elapsed:.1f}s "
+        f"({games / elapsed if elapsed else 0:.0f} Matches/s)",
+        f"Runden pro Match: {rounds / games if games else 0:.2f}  "
+        f"Züge pro Runde: {stats['turns'] / rounds if rounds else 0:.2f}",
+        "",
+        f"{'Spieler':<18}{'Siege':>8}{'Quote':>8}{'Ø Ende':>9}{'p50':>6}{'p95':>6}"
+        f"{'Ø Runde':>9}{'p5':>5}{'p50':>5}{'p95':>5}",
+    ]
+    for i, difficulty in enumerate(difficulties):
+        final_scores = stats['final_scores'][i]
+        round_scores = stats['round_scores'][i]
+        lines.append(
+            f"{f'Bot {i + 1} ({difficulty})':<18}{stats['wins'][i]:>8}"
+            f"{stats['wins'][i] / games if games else 0:>8.1%}"
+            f"{mean(final_scores):>9.1f}{percentile(final_scores, 0.5):>6}{percentile(final_scores, 0.95):>6}"
+            f"{mean(round_scores):>9.1f}{percentile(round_scores, 0.05):>5}"
+            f"{percentile(round_scores, 0.5):>5}{percentile(round_scores, 0.95):>5}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    """
+    Liest die Kommandozeilenargumente.
+
+    Output:
+    - Namespace mit bots, games, processes, chunk_size und seed.
+    """
+    parser = argparse.ArgumentParser(description="Simuliert Skyjo-Matches zwischen Bots.")
+    parser.add_argument("--bots", default="Easy,Medium,Hard",
+                        help="Kommagetrennte Schwierigkeitsgrade, ein Eintrag pro Spieler (2-4)")
+    parser.add_argument("--games", type=int, default=1000, help="Anzahl der Matches")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Anzahl der Worker-Prozesse (Standard: alle Kerne)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Matches pro Worker-Auftrag")
+    parser.add_argument("--seed", type=int, default=None, help="Seed für reproduzierbare Ergebnisse")
+    args = parser.parse_args(argv)
+
+    args.bots = [name.strip().capitalize() for name in args.bots.split(",") if name.strip()]
+    unknown = [name for name in args.bots if name not in BOT_TURNS]
+    if unknown:
+        parser.error(f"Unbekannter Schwierigkeitsgrad: {', '.join(unknown)}")
+    if not 2 <= len(args.bots) <= 4:
+        parser.error("Es werden 2 bis 4 Bots benötigt")
+    if args.games < 1:
+        parser.error("--games muss mindestens 1 sein")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    seed = args.seed if args.seed is not None else new_seed()
+    print(f"Seed: {seed}")
+    start = time.perf_counter()
+    stats = simulate(args.bots, args.games, processes=args.processes, chunk_size=args.chunk_size, seed=seed)
+    print(format_report(args.bots, stats, time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Vektorisierte Rundensimulation mit NumPy.
+
+Statt einzelner Round-Objekte werden N Tische gleichzeitig als Arrays gehalten:
+- hands: int8-Matrix der Form (N, Spieler, 3, 4)
+- visible / elim: uint16-Bitmasken pro Hand (Bit i = Position i, zeilenweise)
+- decks: gemischte Decks (N, 150) mit einem Zeiger pro Tisch
+- discard: Ablagestapel unter der obersten Stack-Karte (N, 150) mit einer Länge pro Tisch
+
+Ein Aufruf von step() führt für jeden noch laufenden Tisch den Zug des aktuellen Spielers
+aus, inklusive Dreierreihen-Prüfung und letzter Runde. Gespielt wird eine Schwellen-Strategie:
+niedrige Karten ersetzen die höchste offene Karte, die Schwelle ist einstellbar.
+
+Aufruf:
+    python -m Engine.vectorized --tables 100000 --players 4
+"""
+import argparse
+import time
+
+import numpy as np
+
+from Engine.rules import ROWS, COLS, HAND_SIZE, ALL_VISIBLE, COLUMN_MASKS, generate_deck
+
+DECK = np.array(generate_deck(), dtype=np.int8)
+SLOT_BITS = (1 << np.arange(HAND_SIZE)).astype(np.uint16)
+COLUMN_BITS = np.array(COLUMN_MASKS, dtype=np.uint16)
+EMPTY = np.iinfo(np.int8).min
+
+
+def bits_to_mask(bits):
+    """
+    Wandelt Bitmasken in boolesche Arrays um.
+
+    Input:
+    - bits: uint16-Array beliebiger Form.
+
+    Output:
+    - Bool-Array mit zusätzlicher letzter Achse der Länge 12.
+    """
+    return (bits[..., None] & SLOT_BITS) != 0
+
+
+class VectorizedRounds:
+    def __init__(self, tables, player_count, rng=None, threshold=4):
+        """
+        Mischt N Decks, teilt aus und spielt die Anfangsrunde (zwei zufällige Karten je Spieler).
+
+        Input:
+        - tables: Anzahl der Tische N.
+        - player_count: Spieler pro Tisch.
+        - rng: numpy.random.Generator (Standard: neuer, zufällig initialisierter Generator).
+        - threshold: Höchster Kartenwert, der als niedrig gilt; Skalar oder ein Wert pro Spieler.
+        """
+        self.tables = tables
+        self.player_count = player_count
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.threshold = np.broadcast_to(np.asarray(threshold, dtype=np.int8), (player_count,))
+        self.table_index = np.arange(tables)
+
+        self.decks = self.rng.permuted(np.tile(DECK, (tables, 1)), axis=1)
+        dealt = HAND_SIZE * player_count
+        # Reihum austeilen: Karte k geht an Spieler k % P auf Position k // P
+        self.hands = np.ascontiguousarray(
+            self.decks[:, :dealt].reshape(tables, HAND_SIZE, player_count).transpose(0, 2, 1)
+        ).reshape(tables, player_count, ROWS, COLS)
+        self.stack_top = self.decks[:, dealt].copy()
+        self.deck_pos = np.full(tables, dealt + 1, dtype=np.int16)
+        self.discard = np.zeros((tables, DECK.size), dtype=np.int8)
+        self.discard_count = np.zeros(tables, dtype=np.int16)
+
+        self.visible = np.zeros((tables, player_count), dtype=np.uint16)
+        self.elim = np.zeros((tables, player_count), dtype=np.uint16)
+        self.first_to_finish = np.full(tables, -1, dtype=np.int8)
+        self.last_turn_counter = np.full(tables, -1, dtype=np.int8)
+        self.done = np.zeros(tables, dtype=bool)
+        self.turns = np.zeros(tables, dtype=np.int32)
+
+        self.initial_turn()
+
+    def initial_turn(self):
+        """
+        Deckt für jeden Spieler zwei zufällige Karten auf und bestimmt den Startspieler
+        anhand der höchsten Summe der beiden Karten.
+        """
+        order = self.rng.random((self.tables, self.player_count, HAND_SIZE)).argsort(axis=-1)[..., :2]
+        self.visible = (SLOT_BITS[order[..., 0]] | SLOT_BITS[order[..., 1]]).astype(np.uint16)
+
+        flat = self.hands.reshape(self.tables, self.player_count, HAND_SIZE)
+        opening = np.take_along_axis(flat, order, axis=-1).sum(axis=-1, dtype=np.int16)
+        self.current = opening.argmax(axis=1).astype(np.int8)
+
+    def draw_cards(self, tables):
+        """
+        Zieht für die angegebenen Tische die nächste Karte vom Deck; die bisherige oberste
+        Stack-Karte wandert auf den Ablagestapel. Ist ein Deck leer, wird wie in
+        Round.draw_from_deck nur der Ablagestapel gemischt und zum neuen Deck, Karten in
+        den Händen und die oberste Stack-Karte bleiben liegen.
+
+        Input:
+        - tables: Indizes der Tische.
+
+        Output:
+        - Die gezogenen Kartenwerte.
+        """
+        empty = tables[self.deck_pos[tables] >= DECK.size]
+        if empty.size:
+            # Zufällige Reihenfolge der abgelegten Karten, leere Plätze nach vorne sortieren;
+            # das neue Deck belegt so die letzten discard_count Positionen der Zeile
+            count = self.discard_count[empty]
+            keys = self.rng.random((empty.size, DECK.size))
+            keys[np.arange(DECK.size) >= count[:, None]] = -1.0
+            order = keys.argsort(axis=1)
+            self.decks[empty] = np.take_along_axis(self.discard[empty], order, axis=1)
+            self.deck_pos[empty] = DECK.size - count
+            self.discard_count[empty] = 0
+
+        self.discard[tables, self.discard_count[tables]] = self.stack_top[tables]
+        self.discard_count[tables] += 1
+        cards = self.decks[tables, self.deck_pos[tables]]
+        self.deck_pos[tables] += 1
+        return cards
+
+    def step(self):
+        """
+        Führt für jeden laufenden Tisch einen Zug des aktuellen Spielers aus.
+
+        Output:
+        - Anzahl der Tische, die danach noch laufen.
+        """
+        tables = self.table_index[~self.done]
+        if not tables.size:
+            return 0
+
+        player = self.current[tables].astype(np.intp)
+        hand = self.hands[tables, player].reshape(-1, HAND_SIZE)
+        visible = self.visible[tables, player]
+        elim = self.elim[tables, player]
+        threshold = self.threshold[player]
+        rows = np.arange(tables.size)
+
+        open_cards = bits_to_mask(visible & ~elim)
+        has_open = open_cards.any(axis=1)
+        highest_index = np.where(open_cards, hand, EMPTY).argmax(axis=1)
+        highest = hand[rows, highest_index]
+
+        # Stack-Karte nehmen, wenn sie niedrig ist und die höchste offene Karte unterbietet
+        top = self.stack_top[tables]
+        take = has_open & (top <= threshold) & (top < highest)
+
+        # Sonst eine Karte vom Deck ziehen und erneut entscheiden
+        draw = ~take
+        top = top.copy()
+        top[draw] = self.draw_cards(tables[draw])
+        swap = take | (draw & has_open & (top <= threshold) & (top < highest))
+        flip = ~swap
+
+        # Tauschen: Stack-Karte auf die höchste offene Position, alte Karte auf den Stack
+        slot = highest_index.copy()
+        # Aufdecken: zufällige verdeckte Karte, die gezogene Karte bleibt auf dem Stack
+        noise = self.rng.random((tables.size, HAND_SIZE))
+        noise[bits_to_mask(visible)] = -1.0
+        slot[flip] = noise[flip].argmax(axis=1)
+
+        new_top = top.copy()
+        new_top[swap] = hand[rows[swap], slot[swap]]
+        hand[rows[swap], slot[swap]] = top[swap]
+        visible = visible | SLOT_BITS[slot]
+
+        # Dreierreihen: Spalten mit drei gleichen, offenen, nicht eliminierten Karten
+        grid = hand.reshape(-1, ROWS, COLS)
+        same = (grid[:, 0] == grid[:, 1]) & (grid[:, 1] == grid[:, 2])
+        column_open = ((visible & ~elim)[:, None] & COLUMN_BITS) == COLUMN_BITS
+        elim = elim | np.bitwise_or.reduce(np.where(same & column_open, COLUMN_BITS, 0), axis=1).astype(np.uint16)
+
+        self.hands[tables, player] = grid
+        self.visible[tables, player] = visible
+        self.elim[tables, player] = elim
+        self.stack_top[tables] = new_top
+        self.turns[tables] += 1
+
+        self.end_turn(tables, player, visible == ALL_VISIBLE)
+        return int((~self.done).sum())
+
+    def end_turn(self, tables, player, finished):
+        """
+        Startet bei aufgedeckten Händen die letzte Runde, zählt die letzten Züge und
+        beendet Tische, an denen alle Spieler ihren letzten Zug gemacht haben.
+
+        Input:
+        - tables: Indizes der Tische.
+        - player: Aktueller Spieler pro Tisch.
+        - finished: Ob die Hand des aktuellen Spielers komplett aufgedeckt ist.
+        """
+        first = finished & (self.first_to_finish[tables] < 0)
+        self.first_to_finish[tables[first]] = player[first]
+
+        counter = self.last_turn_counter[tables]
+        counter[finished & (counter < 0)] = 0
+        active = counter >= 0
+        counter[active] += 1
+        self.last_turn_counter[tables] = counter
+
+        over = active & (counter >= self.player_count)
+        self.done[tables[over]] = True
+        self.visible[tables[over]] = ALL_VISIBLE
+        self.current[tables] = (player + 1) % self.player_count
+
+    def run(self, max_turns=10_000):
+        """
+        Spielt alle Tische bis zum Rundenende.
+
+        Input:
+        - max_turns: Sicherheitsgrenze für die Anzahl der Schritte.
+
+        Output:
+        - Die Punktzahlen der Runde (N, Spieler) inklusive Verdopplung für den ersten Spieler.
+        """
+        for _ in range(max_turns):
+            if not self.step():
+                break
+        return self.scores()
+
+    def scores(self):
+        """
+        Summiert alle offenen, nicht eliminierten Karten jeder Hand und verdoppelt die Punkte
+        des ersten Spielers, der alle Karten aufgedeckt hat, falls er nicht die niedrigste
+        Punktzahl hat.
+
+        Output:
+        - int16-Array der Form (N, Spieler).
+        """
+        flat = self.hands.reshape(self.tables, self.player_count, HAND_SIZE).astype(np.int16)
+        counted = bits_to_mask(self.visible & ~self.elim)
+        scores = np.where(counted, flat, 0).sum(axis=-1, dtype=np.int16)
+
+        finished = self.table_index[self.first_to_finish >= 0]
+        finisher = self.first_to_finish[finished].astype(np.intp)
+        finisher_score = scores[finished, finisher]
+        penalty = finisher_score != scores[finished].min(axis=1)
+        scores[finished[penalty], finisher[penalty]] *= 2
+        return scores
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vektorisierte Simulation vieler Skyjo-Runden.")
+    parser.add_argument("--tables", type=int, default=100_000, help="Anzahl gleichzeitiger Tische")
+    parser.add_argument("--players", type=int, default=4, help="Spieler pro Tisch (2-4)")
+    parser.add_argument("--threshold", type=int, default=4, help="Höchster Kartenwert, der genommen wird")
+    parser.add_argument("--seed", type=int, default=None, help="Startwert des Zufallsgenerators")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rounds = VectorizedRounds(args.tables, args.players, rng=np.random.default_rng(args.seed),
+                              threshold=args.threshold)
+    scores = rounds.run()
+    elapsed = time.perf_counter() - start
+
+    print(f"Runden: {args.tables}  Dauer: {elapsed:.2f}s ({args.tables / elapsed:.0f} Runden/s)")
+    print(f"Züge pro Runde: {rounds.turns.mean():.2f}  Ø Punkte pro Spieler: "
+          + ", ".join(f"{value:.1f}" for value in scores.mean(axis=0)))
+
+
+if __name__ == "__main__":
+    main()
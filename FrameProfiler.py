@@ -0,0 +1,312 @@
+"""
+Frame-Profiler für die Hauptschleife.
+
+Main.run misst in jedem Frame die Dauer der vier Phasen Ereignisse, Update, Zeichnen und
+Anzeigen (flip/update) und übergibt sie zusammen mit dem Namen des aktiven Zustands
+(Game.state_name) an record(). Als Arbeitszeit eines Frames zählt die Summe der Phasen ohne
+das Warten in clock.tick; liegt sie über dem Budget (1/60 s), wird der Frame als zu langsam
+markiert.
+
+Mit F3 wird ein HUD ein- und ausgeblendet, das p50/p95/p99 der letzten WINDOW Frames zeigt.
+Mehr führt der Profiler im normalen Spiel nicht. Erst mit "python Main.py --profile-trace
+frames.csv" (oder .json) wird jeder Frame in eine Datei geschrieben und pro Zustand ein
+Histogramm geführt, dessen Aufschlüsselung beim Beenden im Log erscheint.
+"""
+import csv
+import json
+import time
+from array import array
+from collections import deque
+
+import pygame
+
+from GameAssets import get_font
+from GameLog import FRAMES
+
+FRAME_BUDGET = 1 / 60  # Sekunden Arbeitszeit pro Frame bei 60 FPS
+WINDOW = 300  # Frames im gleitenden Fenster des HUD (5 Sekunden bei 60 FPS)
+PHASES = ("events", "update", "draw", "flip")
+STATE_BUCKET = 0.0001  # Breite eines Histogramm-Fachs der Aufschlüsselung pro Zustand (0,1 ms)
+STATE_BUCKETS = 1000  # Fächer bis 100 ms; längere Frames landen im letzten Fach
+HUD_KEY = pygame.K_F3
+HUD_REFRESH = 0.25  # Sekunden zwischen zwei Aktualisierungen des HUD-Textes
+HUD_FONT_SIZE = 20
+HUD_MARGIN = 8
+HUD_COLOR = (230, 230, 230)
+HUD_ALERT_COLOR = (255, 90, 90)
+HUD_BACKGROUND = (0, 0, 0)
+TRACE_FIELDS = ["frame", "time_ms", "state", *(f"{phase}_ms" for phase in PHASES), "work_ms", "interval_ms",
+                "over_budget"]
+
+
+def percentile(sorted_values, fraction):
+    """
+    Bestimmt ein Perzentil nach der Nearest-Rank-Methode.
+
+    Input:
+    - sorted_values: Aufsteigend sortierte Messwerte.
+    - fraction: Anteil zwischen 0 und 1, z.B. 0.95.
+
+    Output:
+    - Der Messwert des Perzentils oder None ohne Messwerte.
+    """
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(fraction * len(sorted_values) + 0.999999) - 1))
+    return sorted_values[index]
+
+
+class StateTimings:
+    def __init__(self):
+        """
+        Gesammelte Zeiten aller Frames eines Zustands für die Aufschlüsselung beim Beenden.
+        Die Arbeitszeiten landen in einem Histogramm mit festen Fächern, damit der Speicher
+        auch in langen Sitzungen gleich bleibt; die Perzentile sind auf STATE_BUCKET genau.
+        """
+        self.buckets = array('I', bytes(4 * STATE_BUCKETS))  # Anzahl der Frames pro Fach
+        self.frames = 0
+        self.max_work = 0.0
+        self.phase_sums = [0.0] * len(PHASES)
+        self.over_budget = 0
+
+    def add(self, work, phases, over):
+        """
+        Trägt einen Frame ein.
+
+        Input:
+        - work: Arbeitszeit des Frames in Sekunden.
+        - phases: Dauer der Phasen in Sekunden (Reihenfolge wie PHASES).
+        - over: Ob der Frame über dem Budget lag.
+        """
+        self.buckets[min(int(work / STATE_BUCKET), STATE_BUCKETS - 1)] += 1
+        self.frames += 1
+        self.max_work = max(self.max_work, work)
+        for index, value in enumerate(phases):
+            self.phase_sums[index] += value
+        if over:
+            self.over_budget += 1
+
+    def percentile(self, fraction):
+        """
+        Bestimmt ein Perzentil der Arbeitszeit nach der Nearest-Rank-Methode aus dem Histogramm.
+
+        Input:
+        - fraction: Anteil zwischen 0 und 1, z.B. 0.95.
+
+        Output:
+        - Die Obergrenze des Fachs, in dem das Perzentil liegt (höchstens das Maximum), in Sekunden.
+        """
+        rank = max(1, int(fraction * self.frames + 0.999999))
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                if index == STATE_BUCKETS - 1:
+                    return self.max_work  # Das letzte Fach hat keine Obergrenze
+                return min((index + 1) * STATE_BUCKET, self.max_work)
+        return self.max_work
+
+    def summary(self):
+        """
+        Fasst die Zeiten des Zustands zusammen.
+
+        Output:
+        - Dictionary mit Anzahl der Frames, zu langsamen Frames, Perzentilen, Maximum und
+          mittlerer Dauer jeder Phase in Millisekunden.
+        """
+        frames = self.frames
+        summary = {'frames': frames, 'over_budget': self.over_budget}
+        for name, fraction in (('p50_ms', 0.5), ('p95_ms', 0.95), ('p99_ms', 0.99)):
+            summary[name] = round(self.percentile(fraction) * 1000, 3)
+        summary['max_ms'] = round(self.max_work * 1000, 3)
+        for phase, total in zip(PHASES, self.phase_sums):
+            summary[f'{phase}_mean_ms'] = round(total / frames * 1000, 3)
+        return summary
+
+
+class FrameProfiler:
+    def __init__(self, budget=FRAME_BUDGET, window=WINDOW, trace_path=None):
+        """
+        Erstellt den Profiler. Ohne trace_path wird nur das gleitende Fenster für das HUD
+        geführt; die Aufschlüsselung pro Zustand gibt es nur zusammen mit dem Trace.
+
+        Input:
+        - budget: Erlaubte Arbeitszeit pro Frame in Sekunden.
+        - window: Anzahl der Frames, über die das HUD Perzentile bildet.
+        - trace_path: Datei für den Frame-Trace; endet sie auf .json, wird beim Schließen JSON
+          geschrieben, sonst wird laufend CSV geschrieben.
+        """
+        self.budget = budget
+        self.window = deque(maxlen=window)  # (Arbeitszeit, Phasenzeiten, zu langsam) der letzten Frames
+        self.states = {}  # Name des Zustands -> StateTimings, nur mit Trace
+        self.frame = 0
+        self.started = time.perf_counter()
+
+        self.hud_visible = False
+        self.hud_lines = []  # (Text, Farbe) der aktuellen HUD-Zeilen
+        self.hud_updated = 0.0
+        self.hud_rect = pygame.Rect(0, 0, 0, 0)
+
+        self.trace_path = trace_path
+        self.trace_file = None
+        self.trace_writer = None
+        self.trace_frames = None  # Gesammelte Frames für den JSON-Trace
+        if trace_path is not None:
+            if trace_path.lower().endswith(".json"):
+                self.trace_frames = []
+            else:
+                self.trace_file = open(trace_path, "w", newline="", encoding="utf-8")
+                self.trace_writer = csv.writer(self.trace_file)
+                self.trace_writer.writerow(TRACE_FIELDS)
+
+    def record(self, state_name, phases, interval):
+        """
+        Trägt die Zeiten eines Frames ein.
+
+        Input:
+        - state_name: Name des Zustands, der den Frame gezeichnet hat.
+        - phases: Dauer von Ereignissen, Update, Zeichnen und Anzeigen in Sekunden (Reihenfolge wie PHASES).
+        - interval: Abstand zum vorherigen Frame in Sekunden (Rückgabe von clock.tick).
+
+        Output:
+        - True, wenn die Arbeitszeit des Frames über dem Budget lag.
+        """
+        work = sum(phases)
+        over = work > self.budget
+        self.frame += 1
+        self.window.append((work, phases, over))
+        if over:
+            FRAMES.debug("Frame %d in %s over budget: %.2f ms", self.frame, state_name, work * 1000)
+
+        if self.trace_path is not None:
+            timings = self.states.get(state_name)
+            if timings is None:
+                timings = self.states[state_name] = StateTimings()
+            timings.add(work, phases, over)
+            row = [self.frame, round((time.perf_counter() - self.started) * 1000, 3), state_name,
+                   *(round(value * 1000, 3) for value in phases), round(work * 1000, 3),
+                   round(interval * 1000, 3), int(over)]
+            if self.trace_writer is not None:
+                self.trace_writer.writerow(row)
+            else:
+                self.trace_frames.append(dict(zip(TRACE_FIELDS, row)))
+        return over
+
+    def toggle_hud(self):
+        """
+        Blendet das HUD ein oder aus.
+
+        Output:
+        - Der Bereich, den das HUD bisher belegt hat; beim Ausblenden muss er neu gezeichnet werden.
+        """
+        self.hud_visible = not self.hud_visible
+        self.hud_updated = 0.0  # Beim Einblenden sofort aktuelle Werte zeigen
+        return self.hud_rect.copy()
+
+    def rolling_stats(self):
+        """
+        Berechnet die Kennzahlen des gleitenden Fensters.
+
+        Output:
+        - Dictionary mit p50/p95/p99 der Arbeitszeit, mittlerer Dauer jeder Phase (alles in
+          Sekunden) und der Anzahl zu langsamer Frames, oder None ohne Frames.
+        """
+        if not self.window:
+            return None
+        work = sorted(entry[0] for entry in self.window)
+        frames = len(self.window)
+        stats = {name: percentile(work, fraction) for name, fraction in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99))}
+        for index, phase in enumerate(PHASES):
+            stats[phase] = sum(entry[1][index] for entry in self.window) / frames
+        stats['frames'] = frames
+        stats['over_budget'] = sum(1 for entry in self.window if entry[2])
+        return stats
+
+    def update_hud_lines(self, state_name, fps):
+        """
+        Erzeugt die Zeilen des HUD aus dem gleitenden Fenster.
+
+        Input:
+        - state_name: Name des aktiven Zustands.
+        - fps: Aktuelle Bildrate laut clock.get_fps().
+        """
+        stats = self.rolling_stats()
+        if stats is None:
+            self.hud_lines = [(f"{state_name}  -- FPS", HUD_COLOR)]
+            return
+        last_over = self.window[-1][2]
+        over_color = HUD_ALERT_COLOR if stats['over_budget'] else HUD_COLOR
+        self.hud_lines = [
+            (f"{state_name}  {fps:.0f} FPS", HUD_ALERT_COLOR if last_over else HUD_COLOR),
+            (f"work p50 {stats['p50'] * 1000:.1f}  p95 {stats['p95'] * 1000:.1f}  "
+             f"p99 {stats['p99'] * 1000:.1f} ms", HUD_ALERT_COLOR if stats['p99'] > self.budget else HUD_COLOR),
+            ("  ".join(f"{phase} {stats[phase] * 1000:.1f}" for phase in PHASES) + " ms", HUD_COLOR),
+            (f"over {self.budget * 1000:.1f} ms: {stats['over_budget']}/{stats['frames']} frames", over_color),
+        ]
+
+    def draw_hud(self, surface, state_name, fps):
+        """
+        Zeichnet das HUD in die linke obere Ecke. Der Text wird höchstens alle HUD_REFRESH
+        Sekunden neu erzeugt, damit er lesbar bleibt und das HUD selbst kaum Zeit kostet.
+
+        Input:
+        - surface: Die Oberfläche, auf der gezeichnet wird.
+        - state_name: Name des aktiven Zustands.
+        - fps: Aktuelle Bildrate laut clock.get_fps().
+
+        Output:
+        - Der gezeichnete Bereich für pygame.display.update.
+        """
+        now = time.perf_counter()
+        if now - self.hud_updated >= HUD_REFRESH:
+            self.hud_updated = now
+            self.update_hud_lines(state_name, fps)
+
+        font = get_font(None, HUD_FONT_SIZE)
+        rendered = [font.render(text, True, color) for text, color in self.hud_lines]
+        width = max(image.get_width() for image in rendered) + 2 * HUD_MARGIN
+        height = sum(image.get_height() for image in rendered) + 2 * HUD_MARGIN
+        # Den Bereich des vorherigen HUD mit abdecken, falls es schmaler geworden ist
+        rect = pygame.Rect(0, 0, max(width, self.hud_rect.width), max(height, self.hud_rect.height))
+        surface.fill(HUD_BACKGROUND, rect)
+        y = HUD_MARGIN
+        for image in rendered:
+            surface.blit(image, (HUD_MARGIN, y))
+            y += image.get_height()
+        self.hud_rect = pygame.Rect(0, 0, width, height)
+        return rect
+
+    def summary(self):
+        """
+        Schlüsselt die Zeiten aller bisherigen Frames nach Zustand auf.
+
+        Output:
+        - Dictionary Name des Zustands -> Zusammenfassung (siehe StateTimings.summary), sortiert
+          nach p95 absteigend.
+        """
+        summaries = {name: timings.summary() for name, timings in self.states.items()}
+        return dict(sorted(summaries.items(), key=lambda item: item[1]['p95_ms'], reverse=True))
+
+    def close(self):
+        """
+        Schreibt die Aufschlüsselung pro Zustand ins Log und schließt den Trace. Der JSON-Trace
+        enthält neben den Frames auch das Budget und die Aufschlüsselung. Ohne Trace gibt es
+        nichts zu tun.
+        """
+        if self.trace_path is None:
+            return
+        summary = self.summary()
+        for name, values in summary.items():
+            FRAMES.info("%-20s %6d frames, %5d over budget, p50 %.2f / p95 %.2f / p99 %.2f / max %.2f ms",
+                        name, values['frames'], values['over_budget'], values['p50_ms'], values['p95_ms'],
+                        values['p99_ms'], values['max_ms'])
+
+        if self.trace_file is not None:
+            self.trace_file.close()
+            self.trace_file = self.trace_writer = None
+        elif self.trace_frames is not None:
+            with open(self.trace_path, "w", encoding="utf-8") as file:
+                json.dump({'budget_ms': round(self.budget * 1000, 3), 'states': summary,
+                           'frames': self.trace_frames}, file)
+            self.trace_frames = None
+        FRAMES.info("Frame trace written to %s", self.trace_path)
@@ -1,8 +1,80 @@
+import heapq
+import itertools
+
 import pygame
 
+from GameLog import STATES
+
+
+class Scheduler:
+    """
+    Führt Aufgaben nach einer Verzögerung aus, ohne die Frame-Schleife anzuhalten.
+    Die Zeit läuft nur über update(dt) weiter, das Game in jedem Frame aufruft.
+    """
+    def __init__(self):
+        """
+        Erstellt einen leeren Scheduler.
+
+        Eigenschaften:
+        - time: Seit dem Start vergangene Zeit in Sekunden
+        - tasks: Heap aus Aufgaben [Fälligkeit, Nummer, Callback, Besitzer]
+        """
+        self.time = 0.0
+        self.tasks = []
+        self.counter = itertools.count()
+
+    def schedule(self, delay, callback, owner=None):
+        """
+        Plant einen Aufruf von callback in delay Sekunden.
+
+        Input:
+        - delay: Verzögerung in Sekunden.
+        - callback: Funktion ohne Argumente.
+        - owner: Besitzer der Aufgabe (z.B. ein State), um sie gesammelt abzubrechen.
+
+        Output:
+        - Die Aufgabe, die an cancel() übergeben werden kann.
+        """
+        task = [self.time + delay, next(self.counter), callback, owner]
+        heapq.heappush(self.tasks, task)
+        return task
+
+    def cancel(self, task):
+        """
+        Bricht eine geplante Aufgabe ab.
+
+        Input:
+        - task: Die von schedule() zurückgegebene Aufgabe.
+        """
+        task[2] = None
+
+    def cancel_owner(self, owner):
+        """
+        Bricht alle Aufgaben eines Besitzers ab.
+
+        Input:
+        - owner: Der Besitzer, der bei schedule() angegeben wurde.
+        """
+        for task in self.tasks:
+            if task[3] is owner:
+                task[2] = None
+
+    def update(self, dt):
+        """
+        Lässt die Zeit weiterlaufen und führt alle fälligen Aufgaben aus.
+
+        Input:
+        - dt: Die Zeit seit dem letzten Frame in Sekunden.
+        """
+        self.time += dt
+        while self.tasks and self.tasks[0][0] <= self.time:
+            task = heapq.heappop(self.tasks)
+            if task[2] is not None:
+                task[2]()
+
 
 class Game:
-    def __init__(self, screen, states, start_state):
+    def __init__(self, screen, states, start_state, persistent=None, assets=None):
         """
         Initialisiert das Spiel und setzt den ersten Zustand.
 
@@ -10,15 +82,21 @@ class Game:
         - screen: Die Oberfläche (Display), auf der das Spiel gezeichnet wird.
         - states: Ein Dictionary, das die Zustände (States) des Spiels enthält.
         - start_state: Der Name des Startzustands (String).
+        - persistent: Anfangsdaten für den ersten Zustand (optional, z.B. {'match_seed': 42}).
+        - assets: Die GameAssets, deren Bilder bei einem Moduswechsel neu umgewandelt werden (optional).
 
         """
         self.screen = screen
         self.states = states
+        self.assets = assets
+        self.scheduler = Scheduler()
+        for state in self.states.values():
+            state.scheduler = self.scheduler
         self.state_name = start_state
         self.state = self.states.get(self.state_name)
         self.done = False
         self.quit = False
-        self.state.startup({})
+        self.state.startup(dict(persistent or {}))
 
     def get_event(self, event):
         """
@@ -39,6 +117,7 @@ class Game:
         - dt: Die Zeit, die seit dem letzten Frame vergangen ist (Delta Time).
 
         """
+        self.scheduler.update(dt)
         if self.state:
             self.state.update(dt)
             if self.state.done:
@@ -53,8 +132,21 @@ class Game:
         Input:
         - screen: Die Oberfläche, auf die gezeichnet werden soll.
 
+        Output:
+        - Die geänderten Rechtecke, falls der Zustand nur Änderungen zeichnet, sonst None.
         """
-        self.state.draw(self.screen)
+        return self.state.draw(self.screen)
+
+    def repaint(self, rect):
+        """
+        Lässt den aktuellen Zustand einen Bereich beim nächsten Zeichnen vollständig neu zeichnen.
+
+        Input:
+        - rect: Der neu zu zeichnende Bereich.
+
+        """
+        if self.state:
+            self.state.repaint(rect)
 
     def flip_state(self):
         """
@@ -63,6 +155,7 @@ class Game:
         """
         if self.state:
             self.state.done = False
+            self.scheduler.cancel_owner(self.state)
             previous, self.state_name = self.state_name, self.state.next_state
             persistent = self.state.cleanup()
             self.state = self.states.get(self.state_name)
@@ -70,6 +163,7 @@ class Game:
                 raise ValueError(
                     f"Next state '{self.state_name}' not found in states.")
             self.state.startup(persistent)
+            STATES.debug("State %s -> %s", previous, self.state_name)
 
     def resize(self, width, height):
         """
@@ -82,5 +176,7 @@ class Game:
         """
         self.screen = pygame.display.set_mode((width, height),
                                               pygame.RESIZABLE)
+        if self.assets:
+            self.assets.convert_images()  # Neues Display kann ein anderes Pixelformat haben
         if self.state:
             self.state.resize(width, height)
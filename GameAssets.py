@@ -1,7 +1,24 @@
 import pygame
 import os
-import random
 import json
+from collections import OrderedDict
+
+
+# Schlüssel der Kartenrückseite im Cache der skalierten Karten
+CARD_BACK = "back"
+# Vergrößerung hervorgehobener Karten
+HIGHLIGHT_SCALE = 1.1
+# Kartenwert -> Name des Bildattributs in GameAssets
+CARD_IMAGE_NAMES = {
+    -2: "CardN2", -1: "CardN1", 0: "Card0", 1: "Card1", 2: "Card2", 3: "Card3", 4: "Card4",
+    5: "Card5", 6: "Card6", 7: "Card7", 8: "Card8", 9: "Card9", 10: "Card10", 11: "Card11", 12: "Card12"
+}
+# Alle einzelnen Bildattribute, die an das Pixelformat des Displays angepasst werden
+IMAGE_NAMES = ["CardBack", *CARD_IMAGE_NAMES.values(), "background", "Bot1", "Bot2", "Bot3", "Player", "Skyjo"]
+# Maximale Anzahl gerenderter Texte im Text-Cache
+TEXT_CACHE_SIZE = 512
+# Prozessweites Register der Schriftarten: (Name, Größe) -> pygame.font.Font
+FONTS = {}
 
 
 def load_image(filename):
@@ -17,6 +34,44 @@ def load_image(filename):
     return pygame.image.load(os.path.join("Grafiken", filename))
 
 
+def convert_image(surface):
+    """
+    Wandelt ein Bild in das Pixelformat des Displays um, damit beim Blitten nicht jedes Mal
+    konvertiert werden muss. Bilder mit Alphakanal behalten ihn.
+
+    Input:
+    - surface: Das Bild als Pygame-Oberfläche.
+
+    Output:
+    - Das umgewandelte Bild.
+    """
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def get_font(name, size):
+    """
+    Gibt die gemeinsame Schriftart für Name und Größe zurück. Jede Kombination wird nur einmal
+    aufgelöst (SysFont sucht dabei im Dateisystem), danach wird dasselbe Font-Objekt verwendet.
+
+    Input:
+    - name: Name einer Systemschriftart oder None für die Standardschriftart von pygame.
+    - size: Die Schriftgröße.
+
+    Output:
+    - Das Font-Objekt.
+    """
+    key = (name, size)
+    font = FONTS.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+        FONTS[key] = font
+    return font
+
+
 def load_sound(filename):
     """
     Lädt einen Sound aus dem Verzeichnis "Sounds".
@@ -39,6 +94,9 @@ class GameAssets:
         - Geladene Bilder und Sounds sowie eingestellte Lautstärke.
         """
         self.bot_icons = None
+        self.display_format = None  # Pixelformat des Displays, in das die Bilder umgewandelt wurden
+        self.scaled_cards = {}  # (Wert oder CARD_BACK, Breite, Höhe, hervorgehoben, Drehung) -> Oberfläche
+        self.text_cache = OrderedDict()  # (Schriftart, Text, Farbe, Antialiasing) -> Oberfläche, LRU-Reihenfolge
         pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=4096)
         pygame.mixer.music.load(os.path.join("Sounds", "main-menu.mp3"))
 
@@ -82,6 +140,8 @@ class GameAssets:
         self.Player = load_image("Player.png")
         self.Skyjo = load_image("Skyjo.png")
 
+        self.card_images = {value: getattr(self, name) for value, name in CARD_IMAGE_NAMES.items()}
+
         self.bot_icons = [
             load_image("Bot_1.png"),
             load_image("Bot_2.png"),
@@ -91,6 +151,117 @@ class GameAssets:
         self.card_turn_sfx = load_sound("flipcard.mp3")
         self.card_turn_sfx.set_volume(self._sfx_volume)
 
+        self.convert_images()
+
+    def convert_images(self):
+        """
+        Wandelt alle Bilder in das Pixelformat des aktuellen Displays um. Ohne Display oder
+        bei unverändertem Format passiert nichts. Nach einem Moduswechsel wird erneut umgewandelt
+        und der Cache der skalierten Karten verworfen.
+
+        Output:
+        - True, wenn die Bilder umgewandelt wurden.
+        """
+        display = pygame.display.get_surface()
+        if display is None:
+            return False
+        display_format = (display.get_bitsize(), display.get_masks())
+        if display_format == self.display_format:
+            return False
+
+        for name in IMAGE_NAMES:
+            setattr(self, name, convert_image(getattr(self, name)))
+        self.bot_icons = [convert_image(icon) for icon in self.bot_icons]
+        self.card_images = {value: getattr(self, name) for value, name in CARD_IMAGE_NAMES.items()}
+        self.scaled_cards.clear()
+        self.text_cache.clear()
+        self.display_format = display_format
+        return True
+
+    def get_card_image(self, value, visible=True):
+        """
+        Gibt das Bild einer Karte zurück, je nach Sichtbarkeit und Wert.
+
+        Input:
+        - value: Der Wert der Karte.
+        - visible: Ob die Vorderseite gezeigt wird.
+
+        Output:
+        - Das Bild der Karte (Pygame-Oberfläche) oder die Rückseite.
+        """
+        if not visible:
+            return self.CardBack
+        return self.card_images.get(value, self.CardBack)
+
+    def get_scaled_card(self, value, visible, width, height, highlighted=False, angle=0):
+        """
+        Gibt das auf Kartengröße skalierte Bild einer Karte aus dem Cache zurück.
+        Skaliert (und gedreht) wird nur beim ersten Zugriff je Größe, danach wird nur noch geblittet.
+
+        Input:
+        - value: Der Wert der Karte.
+        - visible: Ob die Vorderseite gezeigt wird.
+        - width: Die Breite der Karte in Pixeln.
+        - height: Die Höhe der Karte in Pixeln.
+        - highlighted: Ob die Karte vergrößert (hervorgehoben) gezeigt wird.
+        - angle: Drehung der Karte in Grad.
+
+        Output:
+        - Die skalierte Oberfläche der Karte.
+        """
+        key = (value if visible else CARD_BACK, int(width), int(height), highlighted, angle)
+        surface = self.scaled_cards.get(key)
+        if surface is None:
+            scale = HIGHLIGHT_SCALE if highlighted else 1.0
+            surface = pygame.transform.scale(self.get_card_image(value, visible),
+                                             (int(key[1] * scale), int(key[2] * scale)))
+            if angle:
+                surface = pygame.transform.rotate(surface, angle)
+            self.scaled_cards[key] = surface
+        return surface
+
+    def resize_card_cache(self, width, height):
+        """
+        Verwirft die skalierten Karten der alten Fenstergröße und skaliert alle Vorderseiten
+        und die Rückseite für die neue Kartengröße vor.
+
+        Input:
+        - width: Die neue Breite einer Karte in Pixeln.
+        - height: Die neue Höhe einer Karte in Pixeln.
+        """
+        self.scaled_cards.clear()
+        self.get_scaled_card(None, False, width, height)
+        for value in self.card_images:
+            self.get_scaled_card(value, True, width, height)
+
+    def render_text(self, font, text, color, antialias=True):
+        """
+        Gibt den gerenderten Text aus dem gemeinsamen LRU-Cache zurück. Gerendert wird nur beim
+        ersten Zugriff; sind mehr als TEXT_CACHE_SIZE Texte gespeichert, wird der am längsten
+        nicht benutzte verworfen. Die zurückgegebene Oberfläche wird geteilt und darf nicht
+        verändert werden.
+
+        Input:
+        - font: Die Schriftart.
+        - text: Der Text.
+        - color: Die Textfarbe (Name, Tupel oder pygame.Color).
+        - antialias: Ob der Text geglättet wird.
+
+        Output:
+        - Der gerenderte Text als Pygame-Oberfläche.
+        """
+        color = tuple(pygame.Color(color))
+        key = (font, text, color, antialias)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            return surface
+        surface = font.render(text, antialias, color)
+        self.text_cache[key] = surface
+        if len(self.text_cache) > TEXT_CACHE_SIZE:
+            self.text_cache.popitem(last=False)
+        return surface
+
     @property
     def music_volume(self):
         """Gibt die aktuelle Musiklautstärke zurück."""
@@ -191,276 +362,6 @@ class GameAssets:
             self._sfx_volume = 0.5
 
 
-class Card:
-    def __init__(self, value, assets, visible=False, highlighted=False, elim=False):
-        """
-        Erstellt eine Spielkarte.
-
-        Input:
-        - value: Der Wert der Karte.
-        - assets: Die GameAssets, die die Kartengrafiken enthalten.
-        - visible: Ob die Karte sichtbar ist.
-        - highlighted: Ob die Karte hervorgehoben ist.
-        - elim: Ob die Karte eliminiert ist.
-
-        Output:
-        - Erstellte Karte mit angegebenen Attributen.
-        """
-        self.value = value
-        self.visible = visible
-        self.assets = assets
-        self.highlighted = highlighted
-        self.elim = elim
-
-    def get_image(self):
-        """
-        Gibt das Bild der Karte zurück, je nach Sichtbarkeit und Wert.
-
-        Input:
-        - Keine Eingabe.
-
-        Output:
-        - Das Bild der Karte (Pygame-Oberfläche).
-        """
-        if not self.visible:
-            return self.assets.CardBack
-
-        value_to_image = {
-            -2: self.assets.CardN2,
-            -1: self.assets.CardN1,
-            0: self.assets.Card0,
-            1: self.assets.Card1,
-            2: self.assets.Card2,
-            3: self.assets.Card3,
-            4: self.assets.Card4,
-            5: self.assets.Card5,
-            6: self.assets.Card6,
-            7: self.assets.Card7,
-            8: self.assets.Card8,
-            9: self.assets.Card9,
-            10: self.assets.Card10,
-            11: self.assets.Card11,
-            12: self.assets.Card12
-        }
-        return value_to_image.get(self.value, self.assets.CardBack)
-
-
-class Deck:
-    def __init__(self, assets):
-        """
-        Erstellt ein Kartendeck mit den vorgegebenen Werten und mischt es.
-
-        Input:
-        - assets: Die GameAssets, die die Kartengrafiken enthalten.
-
-        Output:
-        - Ein gemischtes Kartendeck.
-        """
-        self.assets = assets
-        self.cards = self.generate_deck()
-        self.shuffle()
-
-    def generate_deck(self):
-        """
-        Generiert das komplette Deck aus Spielkarten.
-
-        Output:
-        - Eine Liste von Spielkarten (Cards).
-        """
-        cards = []
-        for value in range(1, 13):
-            cards.extend([Card(value, self.assets) for _ in range(10)])
-        cards.extend([Card(-1, self.assets) for _ in range(10)])
-        cards.extend([Card(0, self.assets) for _ in range(15)])
-        cards.extend([Card(-2, self.assets) for _ in range(5)])
-        return cards
-
-    def shuffle(self):
-        """
-        Mischt die Karten im Deck.
-
-        Output:
-        - Gemischtes Deck.
-        """
-        random.shuffle(self.cards)
-
-    def draw_card(self):
-        """
-        Zieht die oberste Karte vom Deck.
-
-        Output:
-        - Die gezogene Karte oder None, falls das Deck leer ist.
-        """
-        if self.cards:
-            return self.cards.pop()
-        return None
-
-    def deal(self, playercount):
-        """
-        Teilt Karten an die Spieler aus.
-
-        Input:
-        - playercount: Anzahl der Spieler.
-
-        Output:
-        - Eine Liste mit Kartenhänden für jeden Spieler.
-        """
-        players_hands = [[] for _ in range(playercount)]
-        for _ in range(12):  # 12 Karten pro Spieler
-            for player_hand in players_hands:
-                player_hand.append(self.draw_card())
-        return players_hands
-
-    def draw(self, stack):
-        """Bewegt die oberste Karte des Decks auf den Stack und dreht sie um."""
-        if self.cards:
-            if self.cards:
-                top_card = self.cards.pop()
-                stack.add_card(top_card)
-                return top_card
-            return None
-
-    def __len__(self):
-        return len(self.cards)
-
-
-# Die Deck-Klasse repräsentiert einen Kartenstapel, aus dem Karten gezogen werden können.
-class Deck:
-    def __init__(self, assets):
-        self.cards = []
-        self.assets = assets
-
-    def draw(self, stack):
-        """
-        Zieht die oberste Karte des Decks und legt sie auf den angegebenen Stack.
-        Die Karte wird auch umgedreht, d.h. ihre Sichtbarkeit ändert sich.
-
-        Input:
-        - stack: Der Stack, auf den die gezogene Karte gelegt wird.
-
-        Output:
-        - top_card: Die gezogene Karte oder None, falls keine Karte im Deck vorhanden ist.
-        """
-        if self.cards:
-            top_card = self.cards.pop()
-            stack.add_card(top_card)
-            return top_card
-        return None
-
-    def __len__(self):
-        """
-        Gibt die Anzahl der verbleibenden Karten im Deck zurück.
-
-        Output:
-        - Anzahl der Karten im Deck (int).
-        """
-        return len(self.cards)
-
-
-
-class Stack:
-    def __init__(self):
-        self.cards = []
-        self.saved_value = None
-
-    def add_card(self, card):
-        """
-        Fügt eine Karte zum Stapel hinzu.
-
-        Input:
-        - card: Die hinzuzufügende Karte.
-
-        """
-        self.cards.append(card)
-
-    def get_top_card(self):
-        """
-        Gibt die oberste Karte des Stapels zurück.
-
-        Output:
-        - Die oberste Karte (Card-Objekt) oder None, falls der Stapel leer ist.
-        """
-        if self.cards:
-            return self.cards[-1]
-        return None
-
-    def get_second_top_card(self):
-        """
-        Gibt die zweitoberste Karte des Stapels zurück.
-
-        Output:
-        - Die zweitoberste Karte (Card-Objekt) oder None, falls der Stapel weniger als zwei Karten hat.
-        """
-        if len(self.cards) > 1:
-            return self.cards[-2]
-        return None
-
-    def clear(self):
-        """
-        Entfernt alle Karten vom Stapel.
-
-        """
-        self.cards.clear()
-
-    def draw(self):
-        """
-        Entfernt die oberste Karte des Stapels und ändert ihre Sichtbarkeit.
-
-        Output:
-        - Die gezogene Karte (Card-Objekt) oder None, falls der Stapel leer ist.
-        """
-        if self.cards:
-            top_card = self.cards.pop()  # Entferne die oberste Karte
-            top_card.visible = not top_card.visible  # Ändere die Sichtbarkeit der Karte
-            return top_card  # Rückgabe der gezogenen Karte
-        return None
-
-    def turn_second_top_card(self):
-        """
-        Ändert die Sichtbarkeit der zweitobersten Karte des Stapels.
-
-        """
-        if len(self.cards) > 1:
-            self.cards[-2].visible = not self.cards[-2].visible  # Sichtbarkeit der zweitobersten Karte ändern
-
-    def peek(self):
-        """
-        Gibt die oberste Karte des Stapels zurück, ohne sie zu entfernen oder ihre Sichtbarkeit zu ändern.
-
-        Output:
-        - Die oberste Karte (Card-Objekt) oder None, falls der Stapel leer ist.
-        """
-        if self.cards:
-            return self.cards[-1]
-        return None
-
-    def is_empty(self):
-        """
-        Überprüft, ob der Stapel leer ist.
-
-        Output:
-        - True, wenn der Stapel leer ist, andernfalls False.
-        """
-        return len(self.cards) == 0
-
-    def save_top_card_value(self):
-        """
-        Speichert den Wert der obersten Karte des Stapels, falls vorhanden.
-
-        """
-        if self.cards:
-            self.saved_value = self.cards[-1].value
-        else:
-            self.saved_value = None
-
-    def get_saved_value(self):
-        """
-        Gibt den gespeicherten Wert der obersten Karte zurück, falls vorhanden.
-
-        """
-        return self.saved_value
-
-
 # Die Button-Klasse repräsentiert einen klickbaren Knopf im Spiel.
 class Button:
     def __init__(self, text, x, y, width, height, font, text_color, button_color, action=None):
@@ -0,0 +1,78 @@
+"""
+Protokollierung für Spielablauf, Bots und Netzwerk.
+
+Statt print gibt es benannte Kategorien (Logger unterhalb von "skyjo"). Meldungen werden mit
+%-Platzhaltern übergeben und erst formatiert, wenn ihre Kategorie eingeschaltet ist; ist sie
+aus, kostet ein Aufruf nur die Prüfung des Levels. Aufwendige Argumente (z.B. Listen aller
+Handkarten) werden zusätzlich mit enabled() geschützt.
+
+Standardmäßig erscheinen Hinweise, Warnungen und Fehler. Debug-Meldungen werden mit
+configure(verbose=True) für alle Kategorien oder configure(categories=["bots"]) für einzelne
+eingeschaltet, z.B. über "python Main.py --verbose" oder "python Main.py --log bots,states".
+"""
+import logging
+
+ROOT = "skyjo"
+FORMAT = "%(relativeCreated)8.0f ms [%(name)s] %(levelname)s: %(message)s"
+
+BOTS = logging.getLogger(f"{ROOT}.bots")  # Entscheidungen der Bots
+STATES = logging.getLogger(f"{ROOT}.states")  # Zustandswechsel und Spielablauf
+NETWORK = logging.getLogger(f"{ROOT}.network")  # Verbindung des Clients zum Server
+SERVER = logging.getLogger(f"{ROOT}.server")  # Räume, Spieler und Befehle auf dem Server
+FRAMES = logging.getLogger(f"{ROOT}.frames")  # Frame-Zeiten aus FrameProfiler
+
+CATEGORIES = {"bots": BOTS, "states": STATES, "network": NETWORK, "server": SERVER, "frames": FRAMES}
+
+logging.getLogger(ROOT).setLevel(logging.INFO)  # Ohne configure(): keine Debug-Meldungen
+
+
+def enabled(logger):
+    """
+    Prüft, ob Debug-Meldungen einer Kategorie ausgegeben werden.
+
+    Input:
+    - logger: Eine der Kategorien, z.B. BOTS.
+
+    Output:
+    - True, wenn die Kategorie Debug-Meldungen ausgibt.
+    """
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+def configure(verbose=False, categories=()):
+    """
+    Richtet die Ausgabe auf stderr ein und schaltet Debug-Meldungen ein.
+
+    Input:
+    - verbose: Debug-Meldungen aller Kategorien ausgeben.
+    - categories: Namen einzelner Kategorien (siehe CATEGORIES), deren Debug-Meldungen erscheinen.
+
+    Output:
+    - Konfigurierte Logger; unbekannte Kategorien lösen einen ValueError aus.
+    """
+    unknown = [name for name in categories if name not in CATEGORIES]
+    if unknown:
+        raise ValueError(f"Unknown log categories: {', '.join(unknown)} (known: {', '.join(CATEGORIES)})")
+
+    root = logging.getLogger(ROOT)
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(FORMAT))
+        root.addHandler(handler)
+        root.propagate = False
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+    for name in categories:
+        CATEGORIES[name].setLevel(logging.DEBUG)
+
+
+def parse_categories(text):
+    """
+    Zerlegt eine Kommaliste von Kategorien, z.B. aus einem Kommandozeilenargument.
+
+    Input:
+    - text: z.B. "bots,network" oder None.
+
+    Output:
+    - Liste der Kategorienamen.
+    """
+    return [name.strip() for name in (text or "").split(",") if name.strip()]
@@ -1,3 +1,5 @@
+import argparse
+import time
 import pygame
 from States.menu import Menu
 from States.player_select import PlayerSelect
@@ -14,16 +16,19 @@ from States.gamemode import Gamemode
 from States.local import Local
 from Game import Game
 from GameAssets import GameAssets
+from GameLog import CATEGORIES, configure, parse_categories
+from FrameProfiler import HUD_KEY, FrameProfiler
 
 
 class Main:
-    def __init__(self):
+    def __init__(self, seed=None, profile_trace=None):
         """
         Initialisiert das Hauptspiel, die Bildschirmgröße, die GameAssets und die Spielzustände.
         Es stellt sicher, dass Pygame initialisiert wird und die erforderlichen Zustände und Assets geladen sind.
 
         Input:
-        - Keine expliziten Eingaben, aber es werden Ressourcen geladen.
+        - seed: Fester Seed für alle Matches (optional), um ein Match exakt nachzuspielen.
+        - profile_trace: Datei, in die die Zeiten jedes Frames geschrieben werden (optional, .csv oder .json).
 
         Output:
         - Initialisierte GameAssets und Spielzustände, Spiel läuft im "MENU"-Zustand.
@@ -38,11 +43,13 @@ class Main:
             (self.screen_info.current_w, self.screen_info.current_h - 50),
             pygame.RESIZABLE
         )
+        self.assets.convert_images()  # Bilder erst nach dem Öffnen des Fensters umwandeln
 
         pygame.display.set_caption("SkyJo a DataX Project")
 
         self.clock = pygame.time.Clock()
         self.done = False
+        self.profiler = FrameProfiler(trace_path=profile_trace)  # Frame-Zeiten pro Zustand, HUD mit F3
 
         # Zustände (States) initialisieren. Jeder Zustand repräsentiert eine Phase des Spiels
         states = {
@@ -61,12 +68,13 @@ class Main:
             "A_GAMEOVER": A_Gameover(assets=self.assets)
         }
 
-        self.game = Game(self.screen, states, "MENU")
+        persistent = {'match_seed': seed} if seed is not None else {}
+        self.game = Game(self.screen, states, "MENU", persistent, assets=self.assets)
 
     def run(self):
         """
         Hauptspieldurchlauf. Steuert den Spielzyklus, verarbeitet Eingaben, aktualisiert den Zustand
-        und zeichnet die Grafiken.
+        und zeichnet die Grafiken. Die Dauer jeder Phase geht an den FrameProfiler.
 
         Input:
         - Keine direkten Eingaben, aber es werden Ereignisse von Pygame erfasst (z.B. Tastendrücke, Fenstergröße).
@@ -77,6 +85,7 @@ class Main:
 
         while not self.done:
             dt = self.clock.tick(60) / 1000
+            start = time.perf_counter()
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -84,18 +93,43 @@ class Main:
                 elif event.type == pygame.VIDEORESIZE:
                     self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
                     self.game.resize(event.w, event.h)
+                elif event.type == pygame.KEYDOWN and event.key == HUD_KEY:
+                    self.game.repaint(self.profiler.toggle_hud())  # Ausgeblendetes HUD übermalen
+                    continue
                 self.game.get_event(event)
 
             if self.game.done or self.game.quit:
                 self.done = True
 
+            events_done = time.perf_counter()
             self.game.update(dt)
-            self.screen.fill((0, 0, 0))
-
-            self.game.draw(self.screen)
-
-            pygame.display.flip()
-
+            update_done = time.perf_counter()
+            # Der Frame zählt zum Zustand, der ihn zeichnet; die Startup-Kosten eines neuen
+            # Zustands landen so bei diesem
+            state_name = self.game.state_name
+
+            # Zustände mit Dirty-Rect-Rendering geben die geänderten Bereiche zurück,
+            # alle anderen zeichnen den ganzen Bildschirm neu
+            dirty_rects = self.game.draw(self.screen)
+            draw_done = time.perf_counter()
+
+            # Das HUD wird nach dem Zustand gezeichnet und zählt zu keiner Phase
+            if self.profiler.hud_visible:
+                hud_rect = self.profiler.draw_hud(self.screen, state_name, self.clock.get_fps())
+                if dirty_rects is not None:
+                    dirty_rects = [*dirty_rects, hud_rect]
+
+            flip_start = time.perf_counter()
+            if dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+            flip_done = time.perf_counter()
+
+            self.profiler.record(state_name, (events_done - start, update_done - events_done,
+                                              draw_done - update_done, flip_done - flip_start), dt)
+
+        self.profiler.close()
         pygame.quit()
 
 
@@ -104,5 +138,18 @@ if __name__ == "__main__":
     Startpunkt des Programms. Erstellt eine Instanz der Main-Klasse und startet das Spiel.
     """
 
-    main = Main()
+    parser = argparse.ArgumentParser(description="SkyJo a DataX Project")
+    parser.add_argument("--seed", type=int, default=None, help="Fester Seed zum Nachspielen eines Matches")
+    parser.add_argument("--verbose", action="store_true", help="Debug-Meldungen aller Kategorien ausgeben")
+    parser.add_argument("--log", default=None,
+                        help=f"Debug-Meldungen einzelner Kategorien, kommagetrennt ({', '.join(CATEGORIES)})")
+    parser.add_argument("--profile-trace", default=None,
+                        help="Zeiten jedes Frames in diese Datei schreiben (.csv oder .json); F3 zeigt das HUD")
+    args = parser.parse_args()
+    try:
+        configure(args.verbose, parse_categories(args.log))
+    except ValueError as e:
+        parser.error(str(e))
+
+    main = Main(seed=args.seed, profile_trace=args.profile_trace)
     main.run()
@@ -0,0 +1,314 @@
+"""
+Binäre Kodierung für Züge und Spielereignisse (Frames der Art MOVE und GAME).
+
+Jede Nachricht beginnt mit der Codec-Version. Aufbau:
+
+- Zug (3 Byte):            Version, Aktion (0 = flip, 1 = draw, 2 = swap), Position (255 = keine)
+- Runde (Snapshot):        Version, ROUND, Anzahl Spieler, Spieler-IDs (je 2 Byte), Stack-Karte,
+                           Spieler am Zug, Phase/gezogen, danach je Hand: sichtbar (2 Byte),
+                           eliminiert (2 Byte) und 12 Kartenwerte als 4-Bit-Werte (Wert + 2, 6 Byte)
+- Änderungen (Delta):      Version, DELTA, danach die Operationen aus state_sync als
+                           Kennung + Nutzdaten (Karte 3 Byte, Elimination 4, Stack 2, Zug 3,
+                           Ergebnis 2 + 2 je Spieler, Match-Ende 3 + 2 je Spieler)
+
+Ein voller Tisch mit 4 Spielern braucht so 54 Byte, ein typischer Zug 6-10 Byte.
+Verdeckte Karten werden im Snapshot als 0 gesendet.
+
+Aufruf des Benchmarks (die Round-Trip-Prüfung steht in tests/test_codec.py):
+    python -m Online.codec --rounds 200
+"""
+import argparse
+import json
+import random
+import struct
+import time
+
+from Engine.rules import Round, Move, HAND_SIZE, FLIP, DRAW, SWAP, new_seed
+from Online.state_sync import CARD, ELIM, STACK, TURN, RESULT, MATCH, capture, empty_state, diff
+
+CODEC_VERSION = 2  # 2: Operation für das Ende des Matches
+
+# Nachrichtentypen der GAME-Frames
+ROUND = 1
+DELTA = 2
+
+ACTIONS = [FLIP, DRAW, SWAP]  # Aktion <-> Zahl
+NO_INDEX = 255  # Position eines Zuges ohne Karte (draw)
+NO_CARD = -128  # Stack ohne Karte
+VALUE_OFFSET = 2  # Kartenwerte -2..12 werden als 0..14 in 4 Bit gespeichert
+
+MOVE_FORMAT = struct.Struct("!BBB")
+HEADER_FORMAT = struct.Struct("!BB")
+SEAT_FORMAT = struct.Struct("!H")
+TABLE_FORMAT = struct.Struct("!bBB")  # Stack-Karte, Spieler am Zug, Phase << 1 | gezogen
+HAND_FORMAT = struct.Struct("!HH6s")  # Sichtbar, eliminiert, 12 Werte à 4 Bit
+
+# Operationen: Kennung und Format der Nutzdaten
+OP_CODES = {CARD: 0, ELIM: 1, STACK: 2, TURN: 3, RESULT: 4, MATCH: 5}
+OP_NAMES = {code: name for name, code in OP_CODES.items()}
+CARD_FORMAT = struct.Struct("!BBb")  # Kennung, Spieler << 4 | Position, Wert
+ELIM_FORMAT = struct.Struct("!BBH")  # Kennung, Spieler, Maske
+STACK_FORMAT = struct.Struct("!Bb")  # Kennung, Wert
+TURN_FORMAT = struct.Struct("!BBB")  # Kennung, Spieler, Phase << 1 | gezogen
+RESULT_FORMAT = struct.Struct("!BB")  # Kennung, Anzahl; danach je Spieler ein Wert (2 Byte)
+MATCH_FORMAT = struct.Struct("!BBB")  # Kennung, Gewinner, Anzahl; danach je Spieler die Gesamtpunkte (2 Byte)
+SCORE_FORMAT = struct.Struct("!h")
+
+
+def check_version(version):
+    """Löst einen ValueError aus, wenn die Nachricht mit einer anderen Codec-Version kodiert wurde."""
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported codec version {version}, expected {CODEC_VERSION}")
+
+
+def encode_move(move):
+    """
+    Kodiert einen Zug.
+
+    Parameter:
+    - move: Das Move-Tupel
+
+    Rückgabewert:
+    - 3 Byte
+    """
+    index = NO_INDEX if move.index is None else move.index
+    return MOVE_FORMAT.pack(CODEC_VERSION, ACTIONS.index(move.action), index)
+
+
+def decode_move(data):
+    """
+    Dekodiert einen Zug; ValueError bei falscher Länge, Version oder Aktion.
+
+    Parameter:
+    - data: Die Bytes aus encode_move()
+
+    Rückgabewert:
+    - Das Move-Tupel
+    """
+    if len(data) != MOVE_FORMAT.size:
+        raise ValueError(f"Invalid move of {len(data)} bytes")
+    version, action, index = MOVE_FORMAT.unpack(data)
+    check_version(version)
+    if action >= len(ACTIONS):
+        raise ValueError(f"Unknown move action {action}")
+    return Move(ACTIONS[action]) if index == NO_INDEX else Move(ACTIONS[action], index)
+
+
+def pack_values(values):
+    """Packt 12 Kartenwerte in 6 Byte (je 4 Bit, Wert + VALUE_OFFSET)."""
+    return bytes((values[i] + VALUE_OFFSET) << 4 | (values[i + 1] + VALUE_OFFSET) for i in range(0, HAND_SIZE, 2))
+
+
+def unpack_values(data):
+    """Entpackt 12 Kartenwerte aus 6 Byte."""
+    values = []
+    for byte in data:
+        values.append((byte >> 4) - VALUE_OFFSET)
+        values.append((byte & 0x0F) - VALUE_OFFSET)
+    return tuple(values)
+
+
+def encode_round(seats, state):
+    """
+    Kodiert den öffentlichen Stand einer neuen Runde.
+
+    Parameter:
+    - seats: Spieler-IDs in Sitzreihenfolge (Strings aus Zahlen)
+    - state: Zustand aus state_sync.capture(); verdeckte Werte werden nicht übertragen
+
+    Rückgabewert:
+    - Die Nachricht als bytes
+    """
+    hands, stack_top, (current_player, phase, drawn) = state
+    parts = [HEADER_FORMAT.pack(CODEC_VERSION, ROUND), bytes([len(seats)])]
+    parts.extend(SEAT_FORMAT.pack(int(seat)) for seat in seats)
+    parts.append(TABLE_FORMAT.pack(NO_CARD if stack_top is None else stack_top, current_player, phase << 1 | drawn))
+    for values, visible, elim in hands:
+        public = [values[i] if visible >> i & 1 else 0 for i in range(HAND_SIZE)]
+        parts.append(HAND_FORMAT.pack(visible, elim, pack_values(public)))
+    return b"".join(parts)
+
+
+def encode_delta(ops):
+    """
+    Kodiert die Operationen eines Zuges.
+
+    Parameter:
+    - ops: Liste der Operationen aus state_sync.diff()
+
+    Rückgabewert:
+    - Die Nachricht als bytes
+    """
+    parts = [HEADER_FORMAT.pack(CODEC_VERSION, DELTA)]
+    for op in ops:
+        kind = op[0]
+        code = OP_CODES[kind]
+        if kind == CARD:
+            parts.append(CARD_FORMAT.pack(code, op[1] << 4 | op[2], op[3]))
+        elif kind == ELIM:
+            parts.append(ELIM_FORMAT.pack(code, op[1], op[2]))
+        elif kind == STACK:
+            parts.append(STACK_FORMAT.pack(code, NO_CARD if op[1] is None else op[1]))
+        elif kind == TURN:
+            parts.append(TURN_FORMAT.pack(code, op[1], op[2] << 1 | op[3]))
+        elif kind == RESULT:
+            parts.append(RESULT_FORMAT.pack(code, len(op[1])))
+            parts.extend(SCORE_FORMAT.pack(score) for score in op[1])
+        elif kind == MATCH:
+            parts.append(MATCH_FORMAT.pack(code, op[1], len(op[2])))
+            parts.extend(SCORE_FORMAT.pack(score) for score in op[2])
+    return b"".join(parts)
+
+
+def decode_round(data, offset):
+    """
+    Dekodiert den Rest einer ROUND-Nachricht ab offset.
+
+    Rückgabewert:
+    - (Spieler-IDs, Zustand im Format von state_sync.capture())
+    """
+    count = data[offset]
+    offset += 1
+    seats = [str(SEAT_FORMAT.unpack_from(data, offset + 2 * i)[0]) for i in range(count)]
+    offset += 2 * count
+    stack_top, current_player, turn = TABLE_FORMAT.unpack_from(data, offset)
+    offset += TABLE_FORMAT.size
+    hands = []
+    for _ in range(count):
+        visible, elim, packed = HAND_FORMAT.unpack_from(data, offset)
+        offset += HAND_FORMAT.size
+        hands.append((unpack_values(packed), visible, elim))
+    stack_top = None if stack_top == NO_CARD else stack_top
+    return seats, (tuple(hands), stack_top, (current_player, turn >> 1, turn & 1))
+
+
+def decode_ops(data, offset):
+    """
+    Dekodiert die Operationen einer DELTA-Nachricht ab offset.
+
+    Rückgabewert:
+    - Liste der Operationen im Format von state_sync.diff()
+    """
+    ops = []
+    while offset < len(data):
+        kind = OP_NAMES.get(data[offset])
+        if kind == CARD:
+            _, slot, value = CARD_FORMAT.unpack_from(data, offset)
+            ops.append([CARD, slot >> 4, slot & 0x0F, value])
+            offset += CARD_FORMAT.size
+        elif kind == ELIM:
+            _, player, mask = ELIM_FORMAT.unpack_from(data, offset)
+            ops.append([ELIM, player, mask])
+            offset += ELIM_FORMAT.size
+        elif kind == STACK:
+            _, value = STACK_FORMAT.unpack_from(data, offset)
+            ops.append([STACK, None if value == NO_CARD else value])
+            offset += STACK_FORMAT.size
+        elif kind == TURN:
+            _, player, turn = TURN_FORMAT.unpack_from(data, offset)
+            ops.append([TURN, player, turn >> 1, turn & 1])
+            offset += TURN_FORMAT.size
+        elif kind == RESULT:
+            _, count = RESULT_FORMAT.unpack_from(data, offset)
+            offset += RESULT_FORMAT.size
+            ops.append([RESULT, [SCORE_FORMAT.unpack_from(data, offset + 2 * i)[0] for i in range(count)]])
+            offset += 2 * count
+        elif kind == MATCH:
+            _, winner, count = MATCH_FORMAT.unpack_from(data, offset)
+            offset += MATCH_FORMAT.size
+            ops.append([MATCH, winner, [SCORE_FORMAT.unpack_from(data, offset + 2 * i)[0] for i in range(count)]])
+            offset += 2 * count
+        else:
+            raise ValueError(f"Unknown operation {data[offset]}")
+    return ops
+
+
+def decode_game_event(data):
+    """
+    Dekodiert eine GAME-Nachricht in das Ereignis, das GamePlay verarbeitet.
+
+    Parameter:
+    - data: Die Bytes aus encode_round() oder encode_delta()
+
+    Rückgabewert:
+    - {'event': 'round', 'seats': [...], 'ops': [...]} oder {'event': 'delta', 'ops': [...]};
+      der Snapshot einer Runde wird dabei in Operationen gegenüber einem leeren Tisch umgewandelt
+    """
+    try:
+        version, kind = HEADER_FORMAT.unpack_from(data)
+        check_version(version)
+        if kind == ROUND:
+            seats, state = decode_round(data, HEADER_FORMAT.size)
+            return {'event': 'round', 'seats': seats, 'ops': diff(empty_state(len(seats)), state)}
+        if kind == DELTA:
+            return {'event': 'delta', 'ops': decode_ops(data, HEADER_FORMAT.size)}
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Truncated game event: {e}")
+    raise ValueError(f"Unknown game event type {kind}")
+
+
+def public_state(state):
+    """Setzt verdeckte Werte auf 0, so wie sie nach encode_round() beim Client ankommen."""
+    hands = tuple((tuple(values[i] if visible >> i & 1 else 0 for i in range(HAND_SIZE)), visible, elim)
+                  for values, visible, elim in state[0])
+    return hands, state[1], state[2]
+
+
+def sample_messages(rounds, player_count, rng):
+    """
+    Spielt Runden mit zufälligen Zügen und sammelt Snapshots, Deltas und Züge.
+
+    Rückgabewert:
+    - (Liste von (Spieler-IDs, Zustand), Liste von Operationslisten, Liste von Zügen)
+    """
+    snapshots, deltas, moves = [], [], []
+    seats = [str(i + 1) for i in range(player_count)]
+    for _ in range(rounds):
+        game_round = Round(player_count, rng=random.Random(rng.getrandbits(64)))
+        while game_round.legal_moves():
+            state = capture(game_round)
+            snapshots.append((seats, state))
+            move = rng.choice(game_round.legal_moves())
+            game_round.apply(move)
+            moves.append(move)
+            ops = diff(state, capture(game_round))
+            if not game_round.legal_moves():
+                ops.append([RESULT, game_round.scores()])
+            deltas.append(ops)
+    return snapshots, deltas, moves
+
+
+def benchmark(name, items, encode, decode):
+    """Misst Kodieren und Dekodieren und gibt Nachrichten pro Sekunde und Ø Größe aus."""
+    start = time.perf_counter()
+    encoded = [encode(item) for item in items]
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for data in encoded:
+        decode(data)
+    decode_time = time.perf_counter() - start
+    size = sum(len(data) for data in encoded) / len(encoded)
+    print(f"{name:<9} {len(items):>7}  encode {len(items) / encode_time:>10.0f}/s  "
+          f"decode {len(items) / decode_time:>10.0f}/s  Ø {size:.1f} Byte")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark des Binärformats.")
+    parser.add_argument("--rounds", type=int, default=200, help="Anzahl zufällig gespielter Runden")
+    parser.add_argument("--players", type=int, default=4, help="Spieler pro Runde (2-4)")
+    parser.add_argument("--seed", type=int, default=None, help="Startwert des Zufallsgenerators")
+    args = parser.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else new_seed()
+    print(f"Seed: {seed}")
+    snapshots, deltas, moves = sample_messages(args.rounds, args.players, random.Random(seed))
+
+    benchmark("move", moves, encode_move, decode_move)
+    benchmark("delta", deltas, encode_delta, decode_game_event)
+    benchmark("snapshot", snapshots, lambda item: encode_round(*item), decode_game_event)
+    json_size = sum(len(json.dumps(ops, separators=(',', ':'))) for ops in deltas) / len(deltas)
+    print(f"Ø delta as JSON: {json_size:.1f} Byte")
+
+
+if __name__ == "__main__":
+    main()
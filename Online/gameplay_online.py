@@ -1,11 +1,11 @@
 from GameAssets import *
-import time
+from GameLog import STATES
+from Engine.rules import Move, FLIP, DRAW, SWAP, PHASE_INITIAL, PHASE_TURN
+from Online.state_sync import RoundView
+from Game import Scheduler
+from TableRenderer import TableRenderer
 
-
-def remove_three_in_a_row(cards):
-    """Setzt elim der Karten auf True."""
-    for card in cards:
-        card.elim = True
+GAME_OVER_PAUSE = 10  # Sekunden, die das Endergebnis des Matches angezeigt wird, bevor das Online-Spiel endet
 
 
 class GamePlay:
@@ -17,68 +17,117 @@ class GamePlay:
         self.assets = GameAssets()
         self.player_count = 0
         self.players = []
-        self.current_player = 0
-        self.cards_turned = 0
-        self.initial_round = True
+        self.round = None  # RoundView: Spiegel der Runde des Servers
+        self.seat = None  # Eigener Spielerindex in der Runde
+        self.persist = {}
+        self.done = False
+        self.next_state = None
         self.stack_clicked = False  # Trackt, ob der Stack angeklickt wurde
-        self.deck_clicked = False  # Trackt, ob das Deck angeklickt wurde
-        self.deck_action_taken = False  # Status der Deck-Aktion
-        self.font = pygame.font.Font(None, 50)
+        self.message = None  # Nachricht, die über dem Spielfeld angezeigt wird
+        self.scheduler = Scheduler()  # Verzögerte Aktionen, läuft über update(dt)
+        self.table = TableRenderer("blue")  # Sprites des Spieltisches, gezeichnet werden nur Änderungen
+        self.font = get_font(None, 50)
         self.screen = pygame.display.get_surface()
         self.screen_rect = self.screen.get_rect()
         self.card_width, self.card_height, self.card_gap = self.get_card_measurements()
-        self.selected_stack_card = None
 
     def startup(self):
         self.get_players()
         self.GameStart()
+        self.run()
+
+    def run(self):
+        """Frame-Schleife des Online-Spiels, bis das Fenster geschlossen wird."""
+        clock = pygame.time.Clock()
+        while not self.done:
+            dt = clock.tick(60) / 1000
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.done = True
+                elif event.type == pygame.VIDEORESIZE:
+                    self.resize(event.w, event.h)
+                else:
+                    self.get_event(event)
+            self.update(dt)
+            self.draw(self.screen)
+
+    def update(self, dt):
+        """Übernimmt die Änderungen des Servers und lässt geplante Aktionen weiterlaufen."""
+        for event in self.net.poll_game_events():
+            if event['event'] == 'round':
+                self.start_round(event)
+            elif event['event'] == 'delta':
+                self.apply_delta(event['ops'])
+        self.scheduler.update(dt)
 
     def GameStart(self):
-        """Bereitet alles für den Spielstart vor."""
-        # Deck und Stapel vorbereiten
-        self.deck = Deck(assets=self.assets)
-        self.stack = Stack()
-        self.players_hands = self.deck.deal(self.player_count)
-        self.deck.turn_top_card(self.stack)
+        """Bereitet den Spieltisch vor. Deck und Handkarten verwaltet der Server."""
+        self.card_width, self.card_height, self.card_gap = self.get_card_measurements()
+        self.assets.resize_card_cache(self.card_width, self.card_height)
+        self.table = TableRenderer("blue")
+        self.table.reset(self.screen)
+        self.stack_clicked = False
+        self.message = None
 
-        # Informationen über die verteilten Karten ausgeben (optional)
-        for i, hand in enumerate(self.players_hands):
-            print(f"Spieler {i + 1}: {[card.value for card in hand]}")
+    def start_round(self, event):
+        """
+        Übernimmt eine neue Runde des Servers.
 
-        self.cards_turned = 0
-        self.initial_round = True  # Setzt die Anfangsrunde
+        Parameter:
+        - event: Das Ereignis "round" mit Sitzreihenfolge und öffentlichem Stand
+        """
+        self.player_count = len(event['seats'])
+        self.seat = event['seats'].index(self.net.id) if self.net.id in event['seats'] else None
+        self.round = RoundView(self.player_count)
+        self.round.apply(event['ops'])
+        self.table.reset(self.screen)
+        self.stack_clicked = False
+        self.message = None
 
-    def get_players(self):
+    def apply_delta(self, ops):
         """
-        Send a request to the server to get the player count and player names.
+        Übernimmt die Änderungen eines Zuges und reagiert auf Phasenwechsel.
+
+        Parameter:
+        - ops: Die Operationen des Servers
         """
-        try:
-            # Sende die "lobby"-Anfrage an den Server, um die aktuellen Daten zu erhalten
-            reply = self.net.send("lobby")
-            print(f"[DEBUG] Server response (get_players): {reply}")
-
-            lines = reply.split('\n')  # Trenne die Serverantwort in einzelne Zeilen
-
-            if len(lines) > 1:
-                # Extrahiere die Spieleranzahl aus der ersten Zeile
-                player_count_info = lines[0].strip()  # z.B. "1/4"
-                self.player_count = int(player_count_info.split('/')[0].strip())  # Setze die aktuelle Spieleranzahl
-                print(f"[DEBUG] Player count extracted: {self.player_count}")
-
-                # Extrahiere die Spielernamen aus den nachfolgenden Zeilen (ohne die erste und die letzte Zeile)
-                self.players = []
-                for line in lines[1:-1]:
-                    if ':' in line:  # Der Doppelpunkt trennt die Spielerinformationen
-                        player_name = line.split(':', 1)[1].strip()  # Spielername nach dem Doppelpunkt
-                        self.players.append(player_name)
-                        print(f"[DEBUG] Player name extracted: {player_name}")
-
-                print(f"[DEBUG] Player list: {self.players}")
+        if self.round is None:
+            return
+        phase, scored = self.round.phase, self.round.round_scores is not None
+        self.round.apply(ops)
+
+        if phase == PHASE_INITIAL and self.round.phase == PHASE_TURN:
+            self.determine_starting_player()
+        elif not scored and self.round.round_scores is not None:
+            # Das Ergebnis kommt mit dem letzten Zug oder nach einer Wiederverbindung in der Pause
+            if self.round.winner is not None:
+                self.game_over()
             else:
-                print("[DEBUG] Unexpected format for lobby data response.")
+                self.round_over()
+
+    @property
+    def current_player(self):
+        """Index des Spielers, der am Zug ist."""
+        return self.round.current_player
+
+    def apply_move(self, move):
+        """Schickt einen eigenen Zug an den Server; ausgeführt wird er, wenn die Änderungen zurückkommen."""
+        if self.round is None or self.current_player != self.seat or move not in self.round.legal_moves():
+            return
+        self.net.send_move(move)
+
+    def get_players(self):
+        """
+        Übernimmt Spieleranzahl und Spielernamen aus dem zuletzt vom Server gepushten Lobby-Zustand.
+        """
+        _, lobby = self.net.get_lobby()
+        if lobby is None:
+            STATES.debug("No lobby data received yet.")
+            return
 
-        except Exception as e:
-            print(f"[DEBUG] Error retrieving players: {e}")
+        self.players = [player['name'] for player in lobby['players']]
+        self.player_count = len(self.players)
+        STATES.debug("Player list: %s", self.players)
 
     def get_card_measurements(self):
         """Berechnet die Maße und Abstände der Karten basierend auf der Bildschirmgröße."""
@@ -94,56 +143,43 @@ class GamePlay:
 
         # Aktualisiere die Kartenmaße und andere Bildschirmelemente
         self.card_width, self.card_height, self.card_gap = self.get_card_measurements()
+        self.assets.resize_card_cache(self.card_width, self.card_height)
+        self.table.reset(self.screen)
 
     def determine_starting_player(self):
-        """Bestimmt den Spieler, der beginnt, basierend auf der höchsten Summe der ersten zwei aufgedeckten Karten."""
-        highest_sum = -1
-        starting_player = 0
-
-        for i in range(self.player_count):
-            visible_cards = [card for card in self.players_hands[i] if card.visible]
-            if len(visible_cards) >= 2:
-                card_sum = visible_cards[0].value + visible_cards[1].value
-                if card_sum > highest_sum:
-                    highest_sum = card_sum
-                    starting_player = i
-
-        self.current_player = starting_player
-
+        """Zeigt den Spieler an, der beginnt. Die Runde bestimmt ihn anhand der höchsten Summe der ersten zwei
+        aufgedeckten Karten."""
         # Zeige den Startspieler für 5 Sekunden an
-        self.show_starting_player_message(starting_player + 1)
+        self.show_starting_player_message(self.round.starting_player + 1)
 
     def show_starting_player_message(self, player_number):
-        """Zeigt eine Nachricht an, welcher Spieler beginnt, und wartet 5 Sekunden."""
-        message = f"Spieler {player_number} beginnt!"
-        text_surface = self.font.render(message, True, pygame.Color("yellow"))
-        text_rect = text_surface.get_rect(center=self.screen_rect.center)
-
-        # Schwarze Box hinter Text anzeigen
-        background_rect = pygame.Rect(
-            text_rect.left - 10,
-            text_rect.top - 5,
-            text_rect.width + 20,
-            text_rect.height + 10
-        )
-
-        # Hintergrundrechteck schwarz füllen
-        pygame.draw.rect(self.screen, pygame.Color("black"), background_rect)
-
-        # Nachricht für 5 Sekunden anzeigen
-        self.screen.blit(text_surface, text_rect)
-        pygame.display.flip()
-        pygame.time.wait(5000)
+        """Zeigt 5 Sekunden lang an, welcher Spieler beginnt, ohne die Frame-Schleife anzuhalten."""
+        self.message = f"Spieler {player_number} beginnt!"
+        self.scheduler.schedule(5, self.hide_message)
+
+    def hide_message(self):
+        """Blendet die aktuelle Nachricht wieder aus."""
+        self.message = None
+
+    def draw_message(self):
+        """Zeigt die aktuelle Nachricht mittig auf einer schwarzen Box an oder blendet sie aus."""
+        if self.message is None:
+            self.table.hide("message")
+            return
+        self.table.set_text("message", self.message, self.font, "yellow", self.screen_rect.center,
+                            layer=2, center=True, background="black")
 
     def get_event(self, event):
+        if self.message is not None or self.round is None:
+            return
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.initial_round:
+            if self.round.phase == PHASE_INITIAL:
                 self.handle_initial_turn(event)
-            else:
+            elif self.round.phase == PHASE_TURN:
                 self.gameLogic(event)
 
     def gameLogic(self, event):
-        """Zentraler Ablauf der Spiellogik ruft die einzelnen Schritte auf."""
+        """Übersetzt einen Mausklick in einen Zug der Runde."""
         mouse_pos = event.pos
 
         if self.is_over_deck(mouse_pos):
@@ -152,107 +188,29 @@ class GamePlay:
             self.handle_stack_click()
         else:
             # Verarbeitet Mausereignisse und wählt Karten basierend auf der Position.
-            if self.selected_stack_card:
-                selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
-
-                if selected_card_index is not None:
-                    self.swap_with_stack(selected_card_index)
-
-                    # Rücksetzen der ausgewählten Stack-Karte
-                    self.selected_stack_card = None
-                    self.stack_clicked = False
-
-                    # Überprüfen, ob das Spiel vorbei ist oder der Zug endet
-                    if self.check_all_cards_visible(self.current_player):
-                        self.round_over()  # change here fome game over to round over
-                    else:
-                        self.end_turn()
-
-                else:
-                    self.selected_stack_card = None
-                    self.stack_clicked = False
-
-            else:
-                selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
+            selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
+            if self.stack_clicked:
+                # Rücksetzen der Stack-Auswahl, getauscht wird nur bei einem Treffer
+                self.stack_clicked = False
                 if selected_card_index is not None:
-                    card = self.players_hands[self.current_player][selected_card_index]
-                    if not card.visible:
-                        self.deck.turn_card(card)
-                        self.check_three_in_a_row(self.current_player)
+                    self.apply_move(Move(SWAP, selected_card_index))
 
-                    # Überprüfen, ob das Spiel vorbei ist oder der Zug endet
-                    if self.check_all_cards_visible(self.current_player):
-                        self.round_over()  # change here fome game over to round over
-                    else:
-                        self.end_turn()
+            elif selected_card_index is not None:
+                self.apply_move(Move(FLIP, selected_card_index))
 
     def handle_initial_turn(self, event):
         """Lässt den aktuellen Spieler zwei seiner Karten aufdecken."""
-        mouse_pos = event.pos
-        selected_card = self.get_card_at_pos(self.current_player, mouse_pos)
+        selected_card = self.get_card_at_pos(self.current_player, event.pos)
         if selected_card is not None:
-            card = self.players_hands[self.current_player][selected_card]
-            if not card.visible:
-                self.deck.turn_card(card)
-                self.cards_turned += 1
-                if self.cards_turned >= 2:  # Wenn zwei Karten aufgedeckt wurden
-                    self.end_turn()
-                    self.cards_turned = 0  # Setzt die Anzahl aufgedeckter Karten für den nächsten Spieler zurück
-                    if self.current_player == 0:  # Nach der letzten Runde des letzten Spielers
-                        self.initial_round = False  # Schaltet in die reguläre Spielrunde um
-                        self.determine_starting_player()  # Jetzt den Startspieler bestimmen
+            self.apply_move(Move(FLIP, selected_card))
 
     def handle_deck_click(self):
         """Legt die oberste Karte des Decks auf den Stack und erlaubt dann eine Aktion."""
-        if not self.deck_action_taken:
-            self.deck.draw(self.stack)
-            self.deck_action_taken = True  # Markiere die Deck-Aktion als durchgeführt
+        self.apply_move(Move(DRAW))
 
     def handle_stack_click(self):
-        """Wählt die oberste Karte des Stacks aus oder tauscht Karten, wenn eine Handkarte ausgewählt wird."""
-        if not self.stack_clicked:
-            # Wenn der Stack-Klick das erste Mal erfolgt
-            self.stack_clicked = True
-            self.selected_stack_card = self.stack.peek()  # Wählt die oberste Karte des Stacks aus
-        else:
-            # Wenn der Stack-Klick bereits aktiv ist
-            mouse_pos = pygame.mouse.get_pos()
-            selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
-            if selected_card_index is not None:
-                player_card = self.players_hands[self.current_player][selected_card_index]
-
-                # Tauscht die Handkarte mit der ausgewählten Stack-Karte
-                self.players_hands[self.current_player][selected_card_index] = self.selected_stack_card
-                self.stack.add_card(player_card)  # Legt die Handkarte auf den Stack
-
-                # Rücksetzen der ausgewählten Stack-Karte
-                self.selected_stack_card = None
-                self.stack_clicked = False  # Zurücksetzen des Klick-Status
-                self.deck_action_taken = True  # Markiert, dass eine Deck-Aktion stattgefunden hat
-            else:
-                # Kein Klick auf eine Handkarte, daher wird die Auswahl aufgehoben
-                self.selected_stack_card = None
-                self.stack_clicked = False
-
-    def swap_with_stack(self, selected_card_index):
-        """Tauscht die ausgewählte Karte des Spielers mit der obersten Karte des Stacks."""
-        player_card = self.players_hands[self.current_player][selected_card_index]
-        top_stack_card = self.stack.draw()  # Entfernt die oberste Karte vom Stack
-
-        # Setze die Sichtbarkeit der Stack-Karte auf True
-        if top_stack_card:
-            top_stack_card.visible = True
-
-        # Legt die Spielerkarte auf den Stack
-        if player_card:
-            player_card.visible = True
-            self.stack.add_card(player_card)
-
-        # Ersetzt die Spielerkarte durch die Stack-Karte
-        self.players_hands[self.current_player][selected_card_index] = top_stack_card
-
-        # Überprüfe, ob der aktuelle Spieler drei gleiche Karten in einer Reihe hat
-        self.check_three_in_a_row(self.current_player)
+        """Wählt die oberste Karte des Stacks aus oder hebt die Auswahl wieder auf."""
+        self.stack_clicked = not self.stack_clicked
 
     def get_card_at_pos(self, player_index, pos):
         global start_x, start_y
@@ -305,31 +263,17 @@ class GamePlay:
         stack_rect = pygame.Rect(x, y, card_width, card_height)
         return stack_rect.collidepoint(pos)
 
-    def end_turn(self):
-        """Wechselt zum nächsten Spieler."""
-        self.current_player = (self.current_player + 1) % self.player_count
-        self.stack_clicked = False
-        self.deck_clicked = False
-        self.deck_action_taken = False  # Zurücksetzen des Status für den nächsten Zug
-
-    def check_all_cards_visible(self, player_index):
-        """Überprüft, ob alle Karten des aktuellen Spielers aufgedeckt sind."""
-        for card in self.players_hands[player_index]:
-            if not card.visible:
-                return False
-        return True
-
     def draw(self, surface):
-        """Zeichnet das Spielfeld, den Stapel, das Deck und die Karten der Spieler."""
-        surface.fill(pygame.Color("blue"))
-
-        for i in range(self.player_count):
-            self.draw_player_hand(i)
+        """Aktualisiert die Sprites des Spielfelds und zeigt nur die geänderten Bereiche neu an."""
+        if self.round is not None:
+            for i in range(self.player_count):
+                self.draw_player_hand(i)
 
-        self.draw_deck()
-        self.draw_stack()
-        self.draw_player_score()
-        pygame.display.flip()
+            self.draw_deck()
+            self.draw_stack()
+            self.draw_player_score()
+        self.draw_message()
+        pygame.display.update(self.table.draw(surface))
 
     def display_current_player(self, surface):
         """Zeigt den aktuellen Spieler an."""
@@ -337,28 +281,28 @@ class GamePlay:
         surface.blit(text, (10, 10))
 
     def draw_deck(self):
-        """Zeichnet das Deck auf den Bildschirm."""
+        """Aktualisiert das Sprite des Decks."""
         card_width, card_height, card_gap = self.get_card_measurements()
         x = self.screen.get_width() / 2 - (card_width + card_gap / 2)
         y = self.screen.get_height() / 2 - card_height / 2
 
-        card_surface = pygame.transform.scale(self.assets.CardBack, (int(card_width), int(card_height)))
-        self.screen.blit(card_surface, (x, y))
+        card_surface = self.assets.get_scaled_card(None, False, card_width, card_height)
+        self.table.set_image("deck", card_surface, (x, y))
 
     def draw_stack(self):
-        """Zeichnet den Stapel auf den Bildschirm."""
+        """Aktualisiert das Sprite der obersten Stapelkarte."""
         card_width, card_height, card_gap = self.get_card_measurements()
         x = self.screen.get_width() / 2 + card_gap / 2
         y = self.screen.get_height() / 2 - card_height / 2
 
-        if self.stack.cards:
-            card = self.stack.cards[-1]
-            card_image = card.get_image()
-            card_surface = pygame.transform.scale(card_image, (int(card_width), int(card_height)))
-            self.screen.blit(card_surface, (x, y))
+        if self.round.stack_top is not None:
+            card_surface = self.assets.get_scaled_card(self.round.stack_top, True, card_width, card_height)
+            self.table.set_image("stack", card_surface, (x, y))
+        else:
+            self.table.hide("stack")
 
     def draw_player_hand(self, player_index):
-        """Zeichnet die Kartenhand des Spielers auf den Bildschirm."""
+        """Aktualisiert die Sprites der Kartenhand des Spielers."""
         global start_x, start_y, rotation_angle
         card_width, card_height, card_gap = self.get_card_measurements()
         rows = 3
@@ -384,10 +328,11 @@ class GamePlay:
         for row in range(rows):
             for col in range(cols):
                 index = row * cols + col
-                card = self.players_hands[player_index][index]
+                card = self.round.hands[player_index][index]
 
                 if card.elim:
-                    continue  # Überspringt die eliminierte Karte
+                    self.table.hide(("hand", player_index, index))  # Blendet die eliminierte Karte aus
+                    continue
 
                 if player_index == 0 or player_index == 2:
                     x = start_x + col * (card_width + card_gap)
@@ -396,105 +341,67 @@ class GamePlay:
                     x = start_x + row * (card_height + card_gap)
                     y = start_y + col * (card_width + card_gap)
 
-                card_image = card.get_image()
+                # Skalierte (und ggf. gedrehte) Karte aus dem Cache, hervorgehobene Karten sind größer
+                card_surface = self.assets.get_scaled_card(card.value, card.visible, card_width, card_height,
+                                                           card.highlighted, rotation_angle)
 
-                # Anpassung der Skalierung, wenn die Karte markiert ist
-                scale = 1.1 if card.highlighted else 1.0
-                card_width_scaled = int(card_width * scale)
-                card_height_scaled = int(card_height * scale)
-
-                card_surface = pygame.transform.scale(card_image, (card_width_scaled, card_height_scaled))
-                if rotation_angle != 0:
-                    card_surface = pygame.transform.rotate(card_surface, rotation_angle)
-
-                self.screen.blit(card_surface, (x, y))
-
-    def check_three_in_a_row(self, player_index):
-        """Überprüft, ob drei gleiche Karten in einer vertikalen Reihe des angegebenen Spielers vorhanden sind und
-        alle hervorgehoben sind."""
-        hand = self.players_hands[player_index]
-        rows = 3
-        cols = 4
-
-        # Überprüfe alle möglichen 3er-Reihen vertikal
-        for col in range(cols):
-            for row in range(rows - 2):  # Es gibt nur rows - 2 Möglichkeiten, eine 3er-Reihe zu beginnen
-                index1 = row * cols + col
-                index2 = (row + 1) * cols + col
-                index3 = (row + 2) * cols + col
-
-                if (0 <= index1 < len(hand) and
-                        0 <= index2 < len(hand) and
-                        0 <= index3 < len(hand)):
-
-                    card1 = hand[index1]
-                    card2 = hand[index2]
-                    card3 = hand[index3]
-
-                    if card1.value == card2.value == card3.value and card1.value > 0 and card1.visible and card2.visible and card3.visible:
-                         remove_three_in_a_row([card1, card2, card3])
+                self.table.set_image(("hand", player_index, index), card_surface, (x, y))
 
     def Calculate_player_score(self, player_index):
         """Berechnet die Punktzahl eines Spielers basierend auf den offenen Karten."""
-        player_score = 0
-        for card in self.players_hands[player_index]:
-            if card.visible and not card.elim:
-                player_score += card.value
-        return player_score
+        return self.round.hands[player_index].score()
 
     def draw_player_score(self):
         """Zeigt dauerhaft die Punktzahl aller Spieler rechts neben der Spielerhand an."""
         for i in range(self.player_count):
             player_score = self.Calculate_player_score(i)
 
-            # Render the text for the score
-            text = self.font.render(f"Score: {player_score}", True, pygame.Color("white"))
-
             # Berechne die Position des Textes nahe der Spielerhand
             if i == 0:  # Spieler unten
                 x = self.screen.get_width() / 2 + 2 * (self.card_width + self.card_gap)
                 y = self.screen.get_height() - 3 * (self.card_height + self.card_gap)
-                rotated_text = text  # Keine Rotation erforderlich
+                angle = 0  # Keine Rotation erforderlich
             elif i == 1:  # Spieler links
                 x = self.card_height * 3 - 5 * self.card_gap
                 y = self.screen.get_height() / 2 + 2 * (self.card_width + self.card_gap) + self.card_gap
-                rotated_text = pygame.transform.rotate(text, 270)  # Schrift um 90 Grad drehen
+                angle = 270  # Schrift um 90 Grad drehen
             elif i == 2:  # Spieler oben
                 x = self.screen.get_width() / 2 + 2 * (self.card_width + self.card_gap)
                 y = 3 * self.card_height - 5 * self.card_gap
-                rotated_text = pygame.transform.rotate(text, 180)  # Schrift um 180 Grad drehen
+                angle = 180  # Schrift um 180 Grad drehen
             elif i == 3:  # Spieler rechts
                 x = self.screen.get_width() - 3 * (self.card_height + self.card_gap)
                 y = self.screen.get_height() / 2 - 4 * (self.card_width + self.card_gap) - 2 * self.card_gap
-                rotated_text = pygame.transform.rotate(text, 90)  # Schrift um 270 Grad drehen (oder -90 Grad)
+                angle = 90  # Schrift um 270 Grad drehen (oder -90 Grad)
 
-            self.screen.blit(rotated_text, (x, y))
+            # Gerendert und gedreht wird nur, wenn sich die Punktzahl ändert
+            self.table.set_text(("score", i), f"Score: {player_score}", self.font, "white", (x, y), angle=angle)
 
     def round_over(self):
-        """Wechselt den Spielzustand zu 'Round Summary' und berechnet die Punkte."""
-        # 1. Aufdecken aller noch nicht aufgedeckten Karten aller Spieler
-        for i in range(self.player_count):
-            for card in self.players_hands[i]:
-                if not card.visible:
-                    self.deck.turn_card(card)
-
-        # 2. Pause für 5 Sekunden einfügen
-        self.draw(self.screen)  # Aktualisiert den Bildschirm, damit die Spieler die aufgedeckten Karten sehen
-        time.sleep(5)
+        """Übernimmt die Punkte und zeigt sie 5 Sekunden lang an; die nächste Runde startet der Server."""
+        # Übernimm die vom Server gewerteten Punkte. Die aufgedeckten Karten bleiben sichtbar
+        self.persist['current_round_score'] = self.round.round_scores
+        scores = ", ".join(f"{name}: {score}" for name, score in zip(self.players, self.round.round_scores or []))
+        self.message = f"Runde vorbei! {scores}"
+        self.scheduler.schedule(5, self.hide_message)
 
-        # 3. Berechne die Punkte und wechsle den Zustand
-        current_round_score = []
-        for i in range(self.player_count):
-            score = self.Calculate_player_score(i)
-            current_round_score.append(score)
-
-        self.persist['current_round_score'] = current_round_score
-        self.next_state = "SCOREBOARD"
-        self.done = True
+    def player_name(self, index):
+        """Name des Spielers auf dem Sitz index laut Lobby, sonst "Spieler n"."""
+        return self.players[index] if index < len(self.players) else f"Spieler {index + 1}"
 
     def game_over(self):
-        """Handles the game over logic."""
-        print("Game Over!")
-        # Add any additional game over logic here, such as transitioning to a game over screen or resetting the game state.
-        self.done = True
-        self.next_state = "GAME_OVER"  # Example of transitioning to a game over state
\ No newline at end of file
+        """
+        Zeigt Gewinner und Gesamtpunkte des Matches an, die der Server mit dem letzten Zug schickt,
+        und beendet das Online-Spiel nach GAME_OVER_PAUSE Sekunden.
+        """
+        self.persist['current_round_score'] = self.round.round_scores
+        self.persist['total_scores'] = self.round.total_scores
+        winner = self.player_name(self.round.winner)
+        STATES.info("Game over, winner: %s", winner)
+        totals = ", ".join(f"{self.player_name(i)}: {score}" for i, score in enumerate(self.round.total_scores))
+        self.message = f"Spiel vorbei! {winner} gewinnt. {totals}"
+        self.scheduler.schedule(GAME_OVER_PAUSE, self.leave_game)
+
+    def leave_game(self):
+        """Beendet die Frame-Schleife des Online-Spiels."""
+        self.done = True
\ No newline at end of file
@@ -0,0 +1,323 @@
+"""
+Lasttest für den Online-Server mit simulierten Clients ohne Fenster.
+
+Startet Online/server.py als eigenen Prozess und verbindet viele simulierte Clients. Jeder
+Client ist ein echter Network-Client aus Online/network.py, mit demselben Empfangs- und
+Heartbeat-Thread wie im Spiel. Je Raum legt der erste Client den Raum an, die anderen treten
+mit dem Raumcode bei. Alle benennen sich um und fragen regelmäßig Lobby und Host-Status mit
+Network.send_many ab. Der Host startet das Spiel, und danach spielt jeder zufällige erlaubte
+Züge, sobald die Änderungen des Servers ankommen.
+
+Gemessen werden die Latenz von Anfragen (Befehl bis Antwort) und von Zügen (Zug bis
+zugehörige Änderung vom Server), der Durchsatz sowie CPU-Zeit und Speicher des Servers.
+Alle Werte gelten nur für das Messfenster nach dem Aufbau der Räume.
+
+Aufruf:
+    python -m Online.loadtest --clients 400 --players 4 --duration 30
+"""
+import argparse
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+from Engine.rules import PHASE_OVER, new_seed
+from Online.network import Network
+from Online.protocol import GAME
+from Online.state_sync import RoundView
+
+LOBBY_POLL_INTERVAL = 1.0  # Sekunden zwischen zwei Lobby-Abfragen eines Clients
+STARTUP_TIMEOUT = 10  # Sekunden, die auf den Start des Servers und volle Räume gewartet wird
+WAIT_INTERVAL = 0.01  # Sekunden zwischen zwei Blicken auf den Lobby-Zustand beim Aufbau der Räume
+LOBBY_REQUESTS = ["lobby", "check_host"]  # Befehle einer Lobby-Abfrage, per Pipelining gesendet
+CONNECTION_CLOSED = "Connection closed"  # Antwort von Network.send_many, wenn keine Antwort kam
+
+
+class Stats:
+    def __init__(self):
+        """
+        Sammelt die Messwerte aller simulierten Clients. Die Clients melden aus ihren
+        Empfangs- und Abfrage-Threads, deshalb schützt ein Lock alle Werte.
+        """
+        self.lock = threading.Lock()
+        self.errors = 0
+        self.connected = 0
+        self.start_window()
+
+    def start_window(self):
+        """Beginnt das Messfenster: Zähler und Latenzen zählen ab jetzt, Fehler weiter über den ganzen Lauf."""
+        with self.lock:
+            self.request_latencies = []  # Sekunden von Anfrage bis Antwort
+            self.move_latencies = []  # Sekunden von Zug bis zur Änderung vom Server
+            self.requests = 0
+            self.moves = 0
+            self.events = 0
+            self.rounds = 0
+
+    def add(self, name, amount=1):
+        """Erhöht einen Zähler, z.B. "moves" oder "errors"."""
+        with self.lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def add_latency(self, samples, seconds):
+        """Trägt eine Latenz in die Liste samples ("request_latencies" oder "move_latencies") ein."""
+        with self.lock:
+            getattr(self, samples).append(seconds)
+
+
+class SimulatedClient(Network):
+    def __init__(self, host, port, number, stats, rng, room_code=None):
+        """
+        Ein simulierter Spieler auf Basis von Network.
+
+        Parameter:
+        - host, port: Adresse des Servers
+        - number: Laufende Nummer des Clients (für den Namen)
+        - stats: Gemeinsames Stats-Objekt
+        - rng: random.Random für die Zugauswahl
+        - room_code: Code des Raums oder None, um einen neuen Raum anzulegen
+        """
+        self.number = number
+        self.stats = stats
+        self.rng = rng
+        self.poll_rng = random.Random(rng.getrandbits(64))  # Eigener Generator für den Abfrage-Thread
+        self.move_sent = None  # Sendezeitpunkt des letzten Zuges, bis seine Änderung ankommt
+        self.view = None
+        self.seat = None
+        self.stopped = threading.Event()
+        self.poller = None
+        super().__init__(host, room_code, device_id=str(uuid.uuid4()), port=port)
+
+    def start(self):
+        """
+        Benennt den Client um, meldet ihn für Lobby-Ereignisse an und startet die Lobby-Abfragen.
+
+        Rückgabewert:
+        - False, wenn die Verbindung nicht aufgebaut werden konnte
+        """
+        if self.error is not None or not self.connected:
+            print(f"Client {self.number}: {self.error}")
+            self.stats.add("errors")
+            return False
+        self.stats.add("connected")
+        self.post(f"name:Bot {self.number}")
+        self.subscribe()
+        self.poller = threading.Thread(target=self.poll_lobby, daemon=True)
+        self.poller.start()
+        return True
+
+    def handle_frame(self, kind, payload):
+        """Verarbeitet einen Frame wie Network und spielt bei Spielereignissen direkt den nächsten Zug."""
+        super().handle_frame(kind, payload)
+        if kind == GAME:
+            self.play_events(time.perf_counter())
+
+    def play_events(self, now):
+        """
+        Wendet die empfangenen Spielereignisse auf die eigene RoundView an und misst die Latenz
+        des letzten Zuges.
+
+        Parameter:
+        - now: Empfangszeitpunkt der Ereignisse
+        """
+        for event in self.poll_game_events():
+            self.stats.add("events")
+            if event['event'] == 'round':
+                self.view = RoundView(len(event['seats']))
+                self.seat = event['seats'].index(self.id)
+                self.view.apply(event['ops'])
+                self.move_sent = None
+            elif self.view is not None:
+                self.view.apply(event['ops'])
+                if self.move_sent is not None:
+                    self.stats.add_latency("move_latencies", now - self.move_sent)
+                    self.move_sent = None
+                if self.view.phase == PHASE_OVER and self.seat == 0:
+                    self.stats.add("rounds")
+        self.play()
+
+    def play(self):
+        """Spielt einen zufälligen erlaubten Zug, wenn dieser Client am Zug ist."""
+        view = self.view
+        if view is None or self.move_sent is not None or view.current_player != self.seat:
+            return
+        moves = view.legal_moves()
+        if moves:
+            self.move_sent = time.perf_counter()
+            self.send_move(self.rng.choice(moves))
+            self.stats.add("moves")
+
+    def poll_lobby(self):
+        """Fragt in festen Abständen Lobby und Host-Status per Pipelining ab, bis stop() aufgerufen wird."""
+        while not self.stopped.wait(LOBBY_POLL_INTERVAL * (0.5 + self.poll_rng.random())):
+            started = time.perf_counter()
+            replies = self.send_many(LOBBY_REQUESTS)
+            if self.stopped.is_set():
+                return
+            if CONNECTION_CLOSED in replies:
+                self.stats.add("errors")
+                continue
+            self.stats.add_latency("request_latencies", time.perf_counter() - started)
+            self.stats.add("requests", len(replies))
+
+    def players_in_lobby(self):
+        """Gibt die Anzahl der Spieler im zuletzt gepushten Lobby-Zustand zurück."""
+        _, lobby = self.get_lobby()
+        return len(lobby['players']) if lobby else 0
+
+    def stop(self):
+        """Beendet die Lobby-Abfragen und trennt die Verbindung."""
+        self.stopped.set()
+        self.close()
+
+
+def wait_for(condition, timeout=STARTUP_TIMEOUT):
+    """
+    Wartet, bis condition() wahr ist.
+
+    Rückgabewert:
+    - False, wenn timeout Sekunden vergangen sind
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(WAIT_INTERVAL)
+    return True
+
+
+def open_room(host, port, players, first_number, stats, rng):
+    """
+    Verbindet die Clients eines Raums: der erste legt ihn an, die anderen treten mit dem Code bei.
+
+    Rückgabewert:
+    - Liste der Clients, der erste ist der Host; leer, wenn der Raum nicht angelegt werden konnte
+    """
+    creator = SimulatedClient(host, port, first_number, stats, random.Random(rng.getrandbits(64)))
+    if not creator.start():
+        return []
+    if not wait_for(lambda: creator.room_code is not None):
+        stats.add("errors")
+        creator.stop()
+        return []
+    clients = [creator]
+    for number in range(first_number + 1, first_number + players):
+        client = SimulatedClient(host, port, number, stats, random.Random(rng.getrandbits(64)), creator.room_code)
+        if client.start():
+            clients.append(client)
+    return clients
+
+
+def process_usage(pid):
+    """
+    Liest CPU-Zeit (Sekunden) und Speicher (RSS in MB) eines Prozesses aus /proc.
+
+    Rückgabewert:
+    - (CPU-Zeit, RSS) oder (None, None), wenn /proc nicht verfügbar ist
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as stat_file:
+            fields = stat_file.read().rsplit(')', 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+        with open(f"/proc/{pid}/status") as status_file:
+            rss = next(int(line.split()[1]) for line in status_file if line.startswith('VmRSS:')) / 1024
+        return cpu, rss
+    except (OSError, StopIteration, ValueError, IndexError):
+        return None, None
+
+
+def percentiles(values):
+    """Gibt p50, p90, p99 und das Maximum in Millisekunden als Text zurück."""
+    if not values:
+        return "n/a"
+    values = sorted(values)
+
+    def at(fraction):
+        return values[min(len(values) - 1, int(fraction * len(values)))] * 1000
+
+    return f"p50 {at(0.5):.2f} ms  p90 {at(0.9):.2f} ms  p99 {at(0.99):.2f} ms  max {values[-1] * 1000:.2f} ms"
+
+
+def run_load(args, server_pid, stats):
+    """Verbindet alle Clients raumweise, startet die Spiele, misst args.duration Sekunden und trennt dann alle."""
+    rng = random.Random(args.seed)
+    rooms = []
+    for first_number in range(0, args.clients, args.players):
+        players = min(args.players, args.clients - first_number)
+        clients = open_room(args.host, args.port, players, first_number, stats, rng)
+        if clients:
+            rooms.append((clients, players))
+        if args.ramp:
+            time.sleep(args.ramp)
+
+    # Der Host jedes Raums startet das Spiel, sobald alle Spieler in seiner Lobby stehen
+    for clients, players in rooms:
+        host = clients[0]
+        if not wait_for(lambda: host.players_in_lobby() >= players):
+            print(f"Room {host.room_code} did not fill up in time")
+        host.post("start_game")
+    print(f"{stats.connected} clients connected in {len(rooms)} rooms")
+
+    stats.start_window()  # Aufbau und Rampe zählen nicht zu den Messwerten
+    cpu_start, _ = process_usage(server_pid)
+    start = time.perf_counter()
+    time.sleep(args.duration)
+    elapsed = time.perf_counter() - start
+    cpu_end, rss = process_usage(server_pid)
+    with stats.lock:
+        requests, moves, rounds = stats.requests, stats.moves, stats.rounds
+        request_latencies, move_latencies = list(stats.request_latencies), list(stats.move_latencies)
+
+    disconnected = 0
+    for client in (client for clients, _ in rooms for client in clients):
+        if not client.connected:
+            disconnected += 1
+        client.stop()
+
+    print(f"Duration: {elapsed:.1f}s  Errors: {stats.errors}  Disconnected: {disconnected}  Rounds finished: {rounds}")
+    print(f"Requests: {requests} ({requests / elapsed:.0f}/s)  {percentiles(request_latencies)}")
+    print(f"Moves:    {moves} ({moves / elapsed:.0f}/s)  {percentiles(move_latencies)}")
+    if cpu_start is not None and cpu_end is not None:
+        print(f"Server:   CPU {100 * (cpu_end - cpu_start) / elapsed:.0f}%  RSS {rss:.1f} MB")
+    else:
+        print("Server:   CPU/RSS not available on this platform")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lasttest des Online-Servers mit simulierten Clients.")
+    parser.add_argument("--clients", type=int, default=200, help="Anzahl simulierter Clients")
+    parser.add_argument("--players", type=int, default=4, help="Spieler pro Raum (2-4)")
+    parser.add_argument("--duration", type=float, default=20, help="Messdauer in Sekunden")
+    parser.add_argument("--ramp", type=float, default=0, help="Pause in Sekunden zwischen zwei Räumen")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse des Servers")
+    parser.add_argument("--port", type=int, default=5599, help="Port des Servers")
+    parser.add_argument("--seed", type=int, default=None, help="Startwert für die Zugauswahl")
+    args = parser.parse_args(argv)
+    if args.seed is None:
+        args.seed = new_seed()
+    print(f"Seed: {args.seed}")
+
+    server = subprocess.Popen([sys.executable, "-m", "Online.server", "--host", args.host, "--port", str(args.port)],
+                              stdout=subprocess.DEVNULL)
+    try:
+        deadline = time.time() + STARTUP_TIMEOUT
+        while True:
+            try:
+                socket.create_connection((args.host, args.port), timeout=1).close()
+                break
+            except OSError:
+                if time.time() > deadline or server.poll() is not None:
+                    raise RuntimeError("Server did not start")
+                time.sleep(0.1)
+        run_load(args, server.pid, Stats())
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ import subprocess
 import time
 import socket
 import pyperclip
+from GameAssets import get_font
+from GameLog import NETWORK, STATES
 
 
 class Button:
@@ -23,7 +25,7 @@ class Button:
         self.rect = pygame.Rect(x, y, width, height)  # Erstelle ein Rechteck für den Button
         self.color = color  # Setze die Farbe des Buttons
         self.text = text  # Setze den Text des Buttons
-        self.font = pygame.font.SysFont(None, 36)  # Erstelle eine Schriftart für den Text
+        self.font = get_font(None, 36)  # Erstelle eine Schriftart für den Text
         self.hover_color = (255, 200, 200)  # Farbe des Buttons beim Hover-Effekt
 
     def draw(self, screen):
@@ -89,6 +91,8 @@ class Lobby:
         self.GamePlay = GamePlay(self.net, self.is_host)  # Erstelle eine Instanz für das Gameplay
 
         self.ip_display_text = None  # Text zur Anzeige der IP-Adresse des Hosts
+        self.lobby_version = 0  # Version des zuletzt gelesenen Lobby-Ereignisses
+        self.lobby_info = ""  # Text der Spielerliste zum zuletzt gelesenen Ereignis
 
     def startup(self):
         """
@@ -107,20 +111,28 @@ class Lobby:
 
     def enter_ip_dialog(self):
         """
-        Zeige ein Dialogfeld zur Eingabe der IP-Adresse an und versuche, eine Verbindung zum Server herzustellen.
+        Zeige ein Dialogfeld zur Eingabe der IP-Adresse und des Raumcodes an und versuche,
+        eine Verbindung zum Server herzustellen. Ohne Raumcode wird ein neuer Raum angelegt.
         """
         running = True
         text_field = TextField(self.width // 2 - 100, self.height // 2 - 25, 200, 50,
                                font_size=30)  # Erstelle ein Textfeld für die IP-Eingabe
+        code_field = TextField(self.width // 2 - 100, self.height // 2 + 75, 200, 50,
+                               font_size=30)  # Textfeld für den Raumcode
+        watch_button = Button(self.width // 2 - 75, self.height - 100, 150, 50, (200, 200, 255),
+                              "Watch")  # Tritt dem Raum als Zuschauer bei
 
         while running:
             self.canvas.draw_background()  # Zeichne den Hintergrund des Canvas neu
             self.canvas.draw_text("Enter Server IP:", 30, self.width // 2, self.height // 2 - 70,
                                   center=True)  # Zeichne den Text "Enter Server IP:"
             text_field.draw(self.canvas.screen)  # Zeichne das Textfeld auf dem Bildschirm
+            self.canvas.draw_text("Room Code:", 30, self.width // 2, self.height // 2 + 50, center=True)
+            code_field.draw(self.canvas.screen)
+            watch_button.draw(self.canvas.screen)
 
             if self.error_message:
-                self.canvas.draw_text(self.error_message, 30, self.width // 2, self.height // 2 + 50,
+                self.canvas.draw_text(self.error_message, 30, self.width // 2, self.height // 2 + 160,
                                       center=True)  # Zeige Fehlermeldung an
 
             for event in pygame.event.get():
@@ -128,18 +140,22 @@ class Lobby:
                     pygame.quit()  # Beende Pygame, wenn das Fenster geschlossen wird
                     return
 
-                # Behandle die IP-Eingabe
+                # Behandle die Eingabe; Enter in einem der beiden Felder verbindet, "Watch" verbindet als Zuschauer
                 ip_input = text_field.handle_event(event)
-                if ip_input:
-                    try:
-                        # Versuche, eine Verbindung mit der angegebenen IP-Adresse herzustellen
-                        self.net = Network(ip_input)
+                code_input = code_field.handle_event(event)
+                spectate = event.type == pygame.MOUSEBUTTONDOWN and watch_button.rect.collidepoint(event.pos)
+                if ip_input or code_input or spectate:
+                    ip_input = text_field.text.strip()
+                    # Versuche, eine Verbindung mit der angegebenen IP-Adresse herzustellen
+                    net = Network(ip_input, code_field.text.strip().upper() or None, spectate=spectate)
+                    if net.connected:
+                        self.net = net
                         self.error_message = ""
                         self.host_ip = ip_input
                         running = False  # Beende die Schleife, wenn die Verbindung erfolgreich ist
-                    except Exception as e:
-                        print(f"[DEBUG] Connection failed: {e}")  # Debug-Ausgabe bei Verbindungsfehler
-                        self.error_message = "Connection failed! Please enter the IP again."  # Setze Fehlermeldung
+                    else:
+                        NETWORK.debug("Connection failed: %s", net.error)  # Debug-Ausgabe bei Verbindungsfehler
+                        self.error_message = f"Connection failed ({net.error})! Please try again."  # Setze Fehlermeldung
 
             self.canvas.update()  # Aktualisiere den Bildschirm
 
@@ -148,8 +164,8 @@ class Lobby:
         Starte den Serverprozess.
         """
         if self.server_process is None:
-            self.server_process = subprocess.Popen(["python", "Online./server.py"])  # Starte den Serverprozess
-            print("Server gestartet")  # Ausgabe zur Bestätigung, dass der Server gestartet wurde
+            self.server_process = subprocess.Popen(["python", "-m", "Online.server"])  # Starte den Serverprozess
+            NETWORK.info("Server gestartet")  # Ausgabe zur Bestätigung, dass der Server gestartet wurde
 
     def stop_server(self):
         """
@@ -158,7 +174,7 @@ class Lobby:
         if self.server_process is not None:
             self.server_process.terminate()  # Beende den Serverprozess
             self.server_process = None
-            print("Server gestoppt")  # Ausgabe zur Bestätigung, dass der Server gestoppt wurde
+            NETWORK.info("Server gestoppt")  # Ausgabe zur Bestätigung, dass der Server gestoppt wurde
 
     def run(self):
         """
@@ -166,6 +182,7 @@ class Lobby:
         """
         clock = pygame.time.Clock()  # Erstelle ein Clock-Objekt für die Zeitkontrolle
         run = True
+        self.net.subscribe()  # Lobby-Änderungen werden ab jetzt vom Server gepusht
 
         while run:
             clock.tick(60)  # Begrenze die Schleife auf 60 FPS
@@ -175,7 +192,7 @@ class Lobby:
                     self.stop_server()  # Stoppe den Server, wenn das Fenster geschlossen wird
                     run = False  # Beende die Schleife
                 new_name = self.text_field.handle_event(event)  # Behandle Ereignisse im Textfeld
-                if new_name:
+                if new_name and not self.net.spectator:
                     self.send_name_change(new_name)  # Sende den neuen Namen an den Server
                     self.name = new_name  # Aktualisiere den Namen des Spielers
 
@@ -183,16 +200,20 @@ class Lobby:
                     self.resize(event.w, event.h)  # Behandle die Größenänderung des Fensters
 
             if not self.game_started:
-                player_count, lobby_info = self.send_lobby_data()  # Hole Lobby-Daten vom Server
+                player_count, lobby_info = self.read_lobby_data()  # Zuletzt gepushte Lobby-Daten
 
                 # Aktualisiere das Canvas mit dem aktuellen Status
                 self.canvas.draw_background()
                 self.draw_player_list(lobby_info)  # Zeichne die Spieler-Liste
 
-                # Zeige den Namen des Spielers an
-                self.canvas.draw_text("Your player name:", self.font_size, self.width // 2, self.height // 2 - 70,
-                                      center=True)
-                self.text_field.draw(self.canvas.screen)  # Zeichne das Textfeld
+                # Zeige den Namen des Spielers an; Zuschauer haben keinen Sitz und keinen Namen
+                if self.net.spectator:
+                    self.canvas.draw_text("Spectating - waiting for the host to start", self.font_size,
+                                          self.width // 2, self.height // 2 - 70, center=True)
+                else:
+                    self.canvas.draw_text("Your player name:", self.font_size, self.width // 2, self.height // 2 - 70,
+                                          center=True)
+                    self.text_field.draw(self.canvas.screen)  # Zeichne das Textfeld
 
                 # Zeige die Server-IP-Adresse im GUI für den Host an
                 if self.is_host and self.host_ip:
@@ -201,54 +222,48 @@ class Lobby:
                         self.ip_display_text = ip_text
                     self.canvas.draw_text(self.ip_display_text, 30, self.width // 2, 30, center=True)
 
+                # Zeige den Raumcode an, damit weitere Spieler beitreten können
+                if self.net.room_code:
+                    self.canvas.draw_text(f"Room Code: {self.net.room_code}", 30, self.width // 2, 65, center=True)
+
                 # Zeige den Start-Button, wenn der Client der Host ist
                 if self.is_host:
                     self.start_button.draw(self.canvas.screen)
                     if self.start_button.is_clicked():
-                        print("[DEBUG] Start Game button clicked")  # Debug-Ausgabe bei Button-Klick
-                        self.net.send('start_game')  # Sende ein Signal zum Starten des Spiels
+                        STATES.debug("Start Game button clicked")  # Debug-Ausgabe bei Button-Klick
+                        self.net.post('start_game')  # Sende ein Signal zum Starten des Spiels
 
                 self.canvas.update()  # Aktualisiere den Bildschirm
 
             if self.game_started:
+                self.GamePlay.net = self.net  # Das Gameplay liest die Spielerliste aus derselben Verbindung
                 self.GamePlay.startup()  # Starte das Gameplay, wenn das Spiel begonnen hat
                 break
 
         pygame.quit()  # Beende Pygame, wenn die Schleife endet
 
-    def send_lobby_data(self):
+    def read_lobby_data(self):
         """
-        Sende eine Anfrage an den Server, um die Lobby-Daten zu erhalten.
+        Liest den zuletzt vom Server gepushten Lobby-Zustand. Es wird keine Anfrage gesendet;
+        der Empfangs-Thread von Network aktualisiert den Zustand nur bei Änderungen.
 
         Rückgabewert:
         - game_status: Status des Spiels
         - lobby_info: Informationen zur Lobby
         """
-        try:
-            reply = self.net.send("lobby")  # Sende Anfrage an den Server
-            print(f"[DEBUG] Server response (send_lobby_data): {reply}")  # Debug-Ausgabe der Server-Antwort
-
-            lines = reply.split('\n')  # Teile die Antwort in Zeilen auf
-            if len(lines) > 1:
-                game_status = lines[-1].strip()  # Der Status des Spiels befindet sich in der letzten Zeile
-                self.game_started = (game_status == 'game_started')  # Setze das Flag für den Spielstatus
-
-                print(f"[DEBUG] Game Status: {game_status}, Game Started: {self.game_started}")
-
-                lobby_info = "\n".join(lines[:-1]) if len(
-                    lines) > 1 else ""  # Lobby-Informationen sind alle Zeilen außer der letzten
-                self.is_host = lines[1].startswith(f"Player 1:") if len(
-                    lines) > 1 else False  # Überprüfe, ob der Client der Host ist
-
-                print(f"[DEBUG] Lobby Info: {lobby_info}, Is Host: {self.is_host}")
-
-                return game_status, lobby_info
-            else:
-                print("[DEBUG] Unexpected format for lobby data response.")  # Debug-Ausgabe für unerwartetes Format
-                return "", ""
-        except Exception as e:
-            print(f"[DEBUG] Error sending lobby data request: {e}")  # Debug-Ausgabe bei Fehlern
+        version, lobby = self.net.get_lobby()
+        if lobby is None:
             return "", ""
+        if version != self.lobby_version:
+            # Nur bei einem neuen Ereignis den Text der Spielerliste neu aufbauen
+            self.lobby_version = version
+            players = lobby['players']
+            self.lobby_info = f"{len(players)}/{lobby['max_players']}\n" + '\n'.join(
+                f"Player {player['id']}: {player['name']}" for player in players)
+            self.game_started = (lobby['status'] == 'game_started')  # Setze das Flag für den Spielstatus
+            self.is_host = (lobby['host'] == self.net.id)  # Überprüfe, ob der Client der Host ist
+            STATES.debug("Lobby Info: %s, Is Host: %s, Status: %s", self.lobby_info, self.is_host, lobby['status'])
+        return lobby['status'], self.lobby_info
 
     def send_name_change(self, new_name):
         """
@@ -258,10 +273,9 @@ class Lobby:
         - new_name: Neuer Name des Spielers
         """
         try:
-            response = self.net.send(f"name:{new_name}")  # Sende die Namensänderung an den Server
-            print(f"Server response (name change): {response}")  # Ausgabe der Server-Antwort
+            self.net.post(f"name:{new_name}")  # Der Server pusht danach die neue Spielerliste
         except Exception as e:
-            print(f"Error sending name change: {e}")  # Ausgabe bei Fehlern
+            NETWORK.warning("Error sending name change: %s", e)  # Ausgabe bei Fehlern
 
     def draw_player_list(self, lobby_info):
         """
@@ -329,8 +343,7 @@ class Canvas:
         - y: y-Position des Texts
         - center: Ob der Text zentriert sein soll
         """
-        pygame.font.init()  # Initialisiere die Schriftart
-        font = pygame.font.SysFont("comicsans", size)  # Erstelle die Schriftart
+        font = get_font("comicsans", size)  # Schriftart aus dem gemeinsamen Register
         text = str(text)  # Stelle sicher, dass der Text als String vorliegt
         render = font.render(text, True, (0, 0, 0))  # Render den Text
         text_rect = render.get_rect(center=(x, y)) if center else pygame.Rect(x, y, render.get_width(),
@@ -357,7 +370,7 @@ class Canvas:
         - render: Das gerenderte Textobjekt
         - (x, y): Die Position des Texts
         """
-        font = pygame.font.SysFont("comicsans", size)  # Erstelle die Schriftart
+        font = get_font("comicsans", size)  # Schriftart aus dem gemeinsamen Register
         text = str(text)  # Stelle sicher, dass der Text als String vorliegt
         render = font.render(text, True, (0, 0, 0))  # Render den Text
         return render, (x, y)  # Gebe das gerenderte Textobjekt und die Position zurück
@@ -381,7 +394,7 @@ class TextField:
         self.color_active = pygame.Color('dodgerblue2')  # Farbe des Textfelds im aktiven Zustand
         self.color = self.color_inactive  # Setze die anfängliche Farbe
         self.text = text  # Setze den Anfangstext
-        self.font = pygame.font.Font(None, font_size)  # Erstelle die Schriftart
+        self.font = get_font(None, font_size)  # Schriftart aus dem gemeinsamen Register
         self.txt_surface = self.font.render(text, True, self.color)  # Render den Anfangstext
         self.active = False  # Flag, das angibt, ob das Textfeld aktiv ist
 
@@ -0,0 +1,196 @@
+"""
+Kennzahlen des Online-Servers.
+
+Der Server zählt Nachrichten und Bytes, misst die Laufzeit jedes Handlers in einem Histogramm
+mit festen Grenzen und stellt alles als Text bereit: über einen lokalen HTTP-Endpunkt
+(--metrics-port) im Prometheus-Textformat und als einzeilige Zusammenfassung alle
+--stats-interval Sekunden.
+
+Aufruf:
+    python -m Online.server --metrics-port 9100 --stats-interval 10
+    curl http://127.0.0.1:9100/metrics
+"""
+import asyncio
+import bisect
+import time
+
+# Obergrenzen der Histogramm-Eimer in Sekunden; alles darüber landet im letzten Eimer (+Inf)
+LATENCY_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+METRICS_PREFIX = "skyjo_"
+HTTP_TIMEOUT = 5  # Sekunden, die der Endpunkt auf die Anfragezeile wartet
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        Histogramm mit festen Eimergrenzen; observe() kostet nur eine binäre Suche.
+
+        Parameter:
+        - buckets: Aufsteigende Obergrenzen der Eimer in Sekunden
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Letzter Eimer: größer als alle Grenzen
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """
+        Trägt einen Messwert ein.
+
+        Parameter:
+        - value: Dauer in Sekunden
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, fraction):
+        """
+        Schätzt ein Perzentil als Obergrenze des Eimers, in dem es liegt.
+
+        Parameter:
+        - fraction: Anteil zwischen 0 und 1, z.B. 0.99
+
+        Rückgabewert:
+        - Obergrenze in Sekunden, float('inf') für den letzten Eimer oder None ohne Messwerte
+        """
+        if self.count == 0:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else float('inf')
+        return float('inf')
+
+
+class Metrics:
+    def __init__(self):
+        """
+        Zähler und Histogramme des Servers. Zähler wachsen nur; Raten ergeben sich aus der
+        Differenz zweier Abfragen.
+        """
+        self.started = time.monotonic()
+        self.counters = {
+            'messages_in': 0,
+            'messages_out': 0,
+            'bytes_in': 0,
+            'bytes_out': 0,
+            'connections_accepted': 0,
+            'reaped': 0,
+            'hello_timeouts': 0,
+            'resumed': 0,
+            'expired': 0,
+        }
+        self.handlers = {}  # Name des Handlers -> Histogram der Laufzeiten
+        self.last_summary = (self.started, 0)  # Zeitpunkt und messages_in der letzten Zusammenfassung
+
+    def count_in(self, frames, size):
+        """
+        Zählt empfangene Frames und Bytes.
+
+        Parameter:
+        - frames: Anzahl der Frames
+        - size: Anzahl der Bytes
+        """
+        self.counters['messages_in'] += frames
+        self.counters['bytes_in'] += size
+
+    def count_out(self, size, frames=1):
+        """
+        Zählt gesendete Frames und Bytes.
+
+        Parameter:
+        - size: Anzahl der Bytes
+        - frames: Anzahl der Frames
+        """
+        self.counters['messages_out'] += frames
+        self.counters['bytes_out'] += size
+
+    def observe(self, handler, seconds):
+        """
+        Trägt die Laufzeit eines Handlers ein.
+
+        Parameter:
+        - handler: Name des Handlers, z.B. "move" oder "lobby"
+        - seconds: Laufzeit in Sekunden
+        """
+        histogram = self.handlers.get(handler)
+        if histogram is None:
+            histogram = self.handlers[handler] = Histogram()
+        histogram.observe(seconds)
+
+    def render(self, gauges):
+        """
+        Erstellt alle Kennzahlen im Prometheus-Textformat.
+
+        Parameter:
+        - gauges: Dictionary mit Momentanwerten, z.B. Räume und verbundene Clients
+
+        Rückgabewert:
+        - Der Text, eine Kennzahl pro Zeile
+        """
+        lines = [f"{METRICS_PREFIX}uptime_seconds {time.monotonic() - self.started:.1f}"]
+        lines += [f"{METRICS_PREFIX}{name} {value}" for name, value in gauges.items()]
+        lines += [f"{METRICS_PREFIX}{name}_total {value}" for name, value in self.counters.items()]
+        for handler, histogram in sorted(self.handlers.items()):
+            name = f'{METRICS_PREFIX}handler_seconds'
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{handler="{handler}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{handler="{handler}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{name}_sum{{handler="{handler}"}} {histogram.sum:.6f}')
+            lines.append(f'{name}_count{{handler="{handler}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def summary(self, gauges):
+        """
+        Fasst die Kennzahlen in einer Zeile zusammen; die Nachrichtenrate gilt seit dem letzten Aufruf.
+
+        Parameter:
+        - gauges: Dictionary mit Momentanwerten
+
+        Rückgabewert:
+        - Die Zeile als String
+        """
+        now = time.monotonic()
+        last_time, last_messages = self.last_summary
+        messages = self.counters['messages_in']
+        rate = (messages - last_messages) / max(now - last_time, 1e-9)
+        self.last_summary = (now, messages)
+        parts = [f"{name}: {value}" for name, value in gauges.items()]
+        parts.append(f"msg/s in: {rate:.1f}")
+        parts.append(f"bytes in/out: {self.counters['bytes_in']}/{self.counters['bytes_out']}")
+        for handler, histogram in sorted(self.handlers.items()):
+            p99 = histogram.percentile(0.99)
+            parts.append(f"{handler} p99<={p99 * 1000:g}ms" if p99 != float('inf') else f"{handler} p99>250ms")
+        return ", ".join(parts)
+
+
+async def serve_metrics(metrics, gauges, host, port):
+    """
+    Startet einen minimalen HTTP-Endpunkt, der auf jede Anfrage die Kennzahlen als Text liefert.
+
+    Parameter:
+    - metrics: Das Metrics-Objekt
+    - gauges: Funktion ohne Parameter, die das Dictionary der Momentanwerte liefert
+    - host, port: Adresse des Endpunkts (nur lokal binden, z.B. 127.0.0.1)
+
+    Rückgabewert:
+    - Der asyncio-Server des Endpunkts
+    """
+    async def handle(reader, writer):
+        try:
+            await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), HTTP_TIMEOUT)
+            body = metrics.render(gauges()).encode('utf-8')
+            writer.write(b"HTTP/1.0 200 OK\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                         + f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
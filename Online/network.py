@@ -1,49 +1,183 @@
+import json
+import os
+import queue
+from collections import deque
 import socket
+import threading
+import time
 import uuid
 
+from GameLog import NETWORK
+from Online.codec import encode_move, decode_game_event
+from Online.protocol import (REPLY, EVENT, MOVE, GAME, HEARTBEAT, HEARTBEAT_INTERVAL, ERROR_PREFIX, DEVICE_IN_USE,
+                             RESUME, SPECTATE, FrameReader, encode_frame, encode_frames, read_frames)
+
+REPLY_TIMEOUT = 5  # Sekunden, die send() höchstens auf eine Antwort wartet
+DEVICE_ID_FILE = 'device_id.txt'  # Dauerhafte Geräte-ID, damit der Server den Client wiedererkennt
+RECONNECT_TIMEOUT = 30  # Sekunden, die nach einem Verbindungsabbruch versucht wird, sich neu zu verbinden
+RECONNECT_INTERVAL = 1  # Sekunden zwischen zwei Verbindungsversuchen
+SERVER_TIMEOUT = 3 * HEARTBEAT_INTERVAL  # Sekunden ohne Daten vom Server, nach denen die Verbindung als tot gilt
+
+
+def load_device_id():
+    """
+    Liest die Geräte-ID aus DEVICE_ID_FILE oder legt beim ersten Start eine neue an.
+
+    Rückgabewert:
+    - Die Geräte-ID (UUID als String)
+    """
+    if os.path.exists(DEVICE_ID_FILE):
+        with open(DEVICE_ID_FILE, 'r') as file:
+            device_id = file.read().strip()
+        if device_id:
+            return device_id
+    device_id = str(uuid.uuid4())
+    try:
+        with open(DEVICE_ID_FILE, 'w') as file:
+            file.write(device_id)
+    except OSError as e:
+        NETWORK.warning("Could not save device id: %s", e)
+    return device_id
+
 
 class Network:
-    def __init__(self, host):
+    def __init__(self, host, room_code=None, device_id=None, spectate=False, port=5555):
         """
         Initialisiert die Netzwerkverbindung zum angegebenen Host.
 
         Parameter:
         - host: Die IP-Adresse oder der Hostname des Servers, zu dem verbunden werden soll
+        - room_code: Code des Raums, dem beigetreten wird; ohne Code legt der Server einen neuen Raum an
+        - device_id: Geräte-ID (optional, Standard: die dauerhaft gespeicherte ID dieses Rechners)
+        - spectate: Nur zuschauen; erfordert einen Raumcode und ist auch nach dem Spielstart möglich
+        - port: Port des Servers (z.B. für den Lasttest mit einem eigenen Server)
         """
         # Erstelle einen neuen TCP/IP-Socket für die Kommunikation
         self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
         self.host = host  # Setze den Host (Server-IP oder Hostname)
-        self.port = 5555  # Setze den Port, auf dem der Server lauscht
+        self.port = port  # Setze den Port, auf dem der Server lauscht
         self.addr = (self.host, self.port)  # Adresse des Servers als Tuple (Host, Port)
 
-        # Generiere eine eindeutige Geräte-ID für den Client
-        self.device_id = str(uuid.uuid4())
+        # Dauerhafte Geräte-ID: nach einem Verbindungsabbruch erkennt der Server den Client daran wieder
+        self.device_id = device_id or load_device_id()
 
         self.id = None  # Initialisiere die ID des Clients (wird später vom Server zugewiesen)
+        self.room_code = room_code  # Raumcode; beim Anlegen eines Raums kommt er mit dem ersten Lobby-Ereignis
+        self.error = None  # Grund, falls der Server die Verbindung abgelehnt hat
+        self.spectator = spectate  # Zuschauer bekommen dieselben Spielereignisse, dürfen aber nicht ziehen
+
+        # Vom Server gepushter Lobby-Zustand, wird vom Empfangs-Thread aktualisiert
+        self.lobby = None  # Letztes Lobby-Ereignis (dict) oder None
+        self.lobby_version = 0  # Zählt empfangene Lobby-Ereignisse, damit nur bei Änderungen neu gezeichnet wird
+        self.connected = False  # Ob der Empfangs-Thread noch Daten vom Server bekommt
+        self.closing = False  # Gesetzt von close(); danach wird nicht mehr neu verbunden
+        self.receiver = None  # Hintergrund-Thread, der alle Frames des Servers liest
+        self.heartbeat = None  # Hintergrund-Thread, der Lebenszeichen schickt und den Server überwacht
+        self.last_received = time.monotonic()  # Zeitpunkt der letzten Daten vom Server
+        self.subscribed = False  # Ob der Server Lobby-Ereignisse an diesen Client pusht
+        self.reader = FrameReader()  # Puffer für unvollständige Frames
+        self.game_events = deque()  # Spielereignisse des Servers in Empfangsreihenfolge
+        self.replies = queue.Queue()  # Antworten auf Befehle, in der Reihenfolge der Befehle
+        self.abandoned_replies = 0  # Antworten, auf die nach einer Zeitüberschreitung niemand mehr wartet
+        self.reply_lock = threading.Lock()  # Schützt abandoned_replies zusammen mit der Warteschlange
+        self.lock = threading.Lock()  # Schützt den Lobby-Zustand
+        self.request_lock = threading.Lock()  # Hält gleichzeitige send()-Aufrufe in ihrer Reihenfolge
+        self.send_lock = threading.Lock()  # Verhindert, dass Frames mehrerer Threads ineinander geschrieben werden
 
         self.connect()  # Stelle die Verbindung zum Server her
 
     def connect(self):
         """
-        Stellt eine Verbindung zum Server her und sendet die Geräte-ID.
+        Stellt eine Verbindung zum Server her, sendet die Geräte-ID und startet den Empfangs-Thread.
         """
         try:
-            # Verbinde den Socket mit der Server-Adresse
-            self.client.connect(self.addr)
-
-            # Sende die Geräte-ID an den Server, um sich zu identifizieren
-            self.client.send(str.encode(self.device_id))
-
-            # Empfange die Spieler-ID vom Server und speichere sie
-            self.id = self.client.recv(2048).decode()
+            try:
+                self.handshake()
+            except ConnectionError:
+                if self.error != DEVICE_IN_USE:
+                    raise
+                # Ein zweites Fenster auf demselben Rechner bekommt eine eigene, nicht gespeicherte ID
+                self.device_id = str(uuid.uuid4())
+                self.error = None
+                self.client.close()
+                self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.reader = FrameReader()
+                self.handshake()
         except Exception as e:
             # Fange alle Ausnahmen ab, die beim Verbindungsaufbau auftreten können
-            print(f"Error during connection: {e}")
+            NETWORK.warning("Error during connection: %s", e)
+            self.error = self.error or str(e)
+            return
+
+        self.receiver = threading.Thread(target=self.receive_frames, daemon=True)
+        self.receiver.start()
+        self.heartbeat = threading.Thread(target=self.send_heartbeats, daemon=True)
+        self.heartbeat.start()
+
+    def handshake(self, resume=False):
+        """
+        Verbindet den Socket und meldet sich mit Geräte-ID und Raumcode an. Bei einer
+        Wiederverbindung übernimmt der Server die bisherige Sitzung und schickt den aktuellen
+        Lobby-Zustand und die laufende Runde direkt hinterher.
+
+        Parameter:
+        - resume: Ob eine abgebrochene Verbindung wiederhergestellt wird
+        """
+        # Verbinde den Socket mit der Server-Adresse
+        self.client.connect(self.addr)
+
+        # Sende die Geräte-ID (und den Raumcode) an den Server, um sich zu identifizieren
+        hello = self.device_id if not self.room_code else f"{self.device_id}\n{self.room_code}"
+        if self.spectator:
+            hello = f"{self.device_id}\n{self.room_code or ''}\n{SPECTATE}"  # Zuschauer starten immer neu
+        elif resume:
+            hello = f"{self.device_id}\n{self.room_code or ''}\n{RESUME}"
+        self.client.sendall(encode_frame(hello))
+
+        # Empfange die Spieler-ID vom Server und speichere sie
+        frames = read_frames(self.client, self.reader)
+        if not frames:
+            raise ConnectionError("Server closed the connection")
+        reply = frames[0][1].decode('utf-8')
+        if reply.startswith(ERROR_PREFIX):
+            self.error = reply[len(ERROR_PREFIX):]
+            raise ConnectionError(self.error)
+        self.id = reply
+        self.connected = True
+        self.last_received = time.monotonic()
+
+        # Frames, die zusammen mit der Spieler-ID angekommen sind, nicht verlieren
+        for kind, payload in frames[1:]:
+            self.handle_frame(kind, payload)
+
+    def reconnect(self):
+        """
+        Versucht nach einem Verbindungsabbruch RECONNECT_TIMEOUT Sekunden lang, die Sitzung
+        mit derselben Geräte-ID fortzusetzen.
+
+        Rückgabewert:
+        - True, wenn die Verbindung wiederhergestellt wurde
+        """
+        deadline = time.monotonic() + RECONNECT_TIMEOUT
+        while not self.closing and time.monotonic() < deadline:
+            time.sleep(RECONNECT_INTERVAL)
+            self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.reader = FrameReader()
+            try:
+                self.handshake(resume=True)
+                NETWORK.info("Reconnected to server as Player %s", self.id)
+                return True
+            except (socket.error, ConnectionError, ValueError) as e:
+                NETWORK.debug("Reconnect failed: %s", e)
+                self.client.close()
+                if self.error is not None:
+                    return False  # Vom Server abgelehnt, z.B. weil die Gnadenfrist abgelaufen ist
+        return False
 
     def send(self, data):
         """
-        Sendet Daten an den Server und empfängt eine Antwort.
+        Sendet einen Befehl an den Server und wartet auf die Antwort.
 
         Parameter:
         - data: Die Daten, die an den Server gesendet werden sollen (als String)
@@ -51,16 +185,221 @@ class Network:
         Rückgabewert:
         - Antwort des Servers (als String) oder eine Fehlermeldung, falls ein Fehler auftritt
         """
+        return self.send_many([data])[0]
+
+    def send_many(self, requests):
+        """
+        Sendet mehrere Befehle mit einem einzigen Systemaufruf (Pipelining) und wartet danach
+        auf alle Antworten. Der Server antwortet in der Reihenfolge der Befehle. Antworten, die
+        erst nach REPLY_TIMEOUT kommen, werden verworfen, damit sie nicht als Antwort auf den
+        nächsten Befehl gelesen werden.
+
+        Parameter:
+        - requests: Liste von Befehlen, die jeweils eine Antwort erwarten (z.B. "lobby", "check_host")
+
+        Rückgabewert:
+        - Liste der Antworten (als Strings); bei Fehlern die Fehlermeldung an deren Stelle
+        """
+        with self.request_lock:
+            self.drain_replies()  # Weckruf eines Verbindungsabbruchs, auf den niemand gewartet hat
+            try:
+                self.write(encode_frames(requests))
+            except socket.error as e:
+                # Fange alle Socket-Fehler ab und gebe die Fehlermeldung zurück
+                return [str(e)] * len(requests)
+
+            replies = []
+            lost = False
+            for _ in requests:
+                try:
+                    reply = self.replies.get(timeout=REPLY_TIMEOUT)
+                except queue.Empty:
+                    break
+                if reply is None:
+                    lost = True  # Verbindung abgebrochen, die übrigen Antworten kommen nicht mehr
+                    break
+                replies.append(reply)
+
+            missing = len(requests) - len(replies)
+            if missing and not lost:
+                # Zeitüberschreitung: die Antworten können noch kommen und werden dann verworfen
+                with self.reply_lock:
+                    self.abandoned_replies += missing - self.drain_replies()
+            return replies + ["Connection closed"] * missing
+
+    def drain_replies(self):
+        """
+        Leert die Warteschlange der Antworten.
+
+        Rückgabewert:
+        - Anzahl der verworfenen Antworten (ohne Weckrufe eines Verbindungsabbruchs)
+        """
+        drained = 0
+        while True:
+            try:
+                reply = self.replies.get_nowait()
+            except queue.Empty:
+                return drained
+            if reply is not None:
+                drained += 1
+
+    def post(self, data):
+        """
+        Sendet einen Befehl an den Server, ohne auf eine Antwort zu warten.
+
+        Parameter:
+        - data: Der Befehl (als String), z.B. "name:Anna" oder "start_game"
+        """
         try:
-            # Sende die Daten an den Server
-            self.client.send(str.encode(data))
+            self.write(encode_frame(data))
+        except socket.error as e:
+            NETWORK.warning("Error sending %r: %s", data, e)
 
-            # Empfange die Antwort des Servers
-            reply = self.client.recv(2048).decode()
+    def send_move(self, move):
+        """
+        Schickt einen Spielzug binär kodiert an den Server, ohne auf eine Antwort zu warten.
 
-            return reply  # Gebe die Antwort des Servers zurück
+        Parameter:
+        - move: Das Move-Tupel
+        """
+        try:
+            self.write(encode_frame(encode_move(move), MOVE))
         except socket.error as e:
-            # Fange alle Socket-Fehler ab und gebe die Fehlermeldung zurück
-            return str(e)
+            NETWORK.warning("Error sending move %s: %s", move, e)
+
+    def write(self, data):
+        """
+        Schreibt fertige Frames auf den Socket; mehrere Threads dürfen gleichzeitig senden.
+
+        Parameter:
+        - data: Die Frames als bytes
+        """
+        with self.send_lock:
+            self.client.sendall(data)
+
+    def send_heartbeats(self):
+        """
+        Schickt im Hintergrund alle HEARTBEAT_INTERVAL Sekunden ein Lebenszeichen, damit der
+        Server die Verbindung nicht als tot trennt. Kommen SERVER_TIMEOUT Sekunden lang keine
+        Daten vom Server, wird der Socket geschlossen; der Empfangs-Thread verbindet dann neu.
+        """
+        while not self.closing and self.receiver.is_alive():
+            time.sleep(HEARTBEAT_INTERVAL)
+            if not self.connected:
+                continue  # Der Empfangs-Thread verbindet gerade neu
+            if time.monotonic() - self.last_received > SERVER_TIMEOUT:
+                NETWORK.warning("No data from server for %ss, reconnecting", SERVER_TIMEOUT)
+                try:
+                    self.client.shutdown(socket.SHUT_RDWR)
+                except socket.error:
+                    pass
+                continue
+            try:
+                self.write(encode_frame(b"", HEARTBEAT))
+            except socket.error as e:
+                NETWORK.debug("Error sending heartbeat: %s", e)
+
+    def subscribe(self):
+        """
+        Meldet den Client für Lobby-Ereignisse an. Der Server schickt danach nur noch bei
+        Änderungen (Beitritt, Namensänderung, Verbindungsabbruch, Spielstart) den neuen
+        Lobby-Zustand, den der Empfangs-Thread speichert.
+        """
+        if self.subscribed:
+            return
+        self.subscribed = True
+        self.post("subscribe")
+
+    def receive_frames(self):
+        """
+        Liest im Hintergrund alle Frames des Servers: Antworten gehen in die Warteschlange
+        für send(), Ereignisse aktualisieren den Lobby-Zustand. Bricht die Verbindung ab,
+        wird sie mit derselben Geräte-ID wiederhergestellt.
+        """
+        while True:
+            try:
+                while True:
+                    frames = read_frames(self.client, self.reader)
+                    if not frames:
+                        break
+                    self.last_received = time.monotonic()
+                    for kind, payload in frames:
+                        self.handle_frame(kind, payload)
+            except (socket.error, ValueError) as e:
+                if not self.closing:  # close() schließt den Socket unter dem wartenden recv()
+                    NETWORK.warning("Connection to server lost: %s", e)
+            self.connected = False
+            with self.reply_lock:
+                self.abandoned_replies = 0  # Die neue Verbindung beantwortet keine alten Befehle
+            if self.request_lock.locked():
+                self.replies.put(None)  # Weckt einen wartenden send()-Aufruf auf; seine Antwort kommt nicht mehr
+            if self.closing or not self.reconnect():
+                return
+
+    def handle_frame(self, kind, payload):
+        """
+        Verarbeitet einen empfangenen Frame.
+
+        Parameter:
+        - kind: Art des Frames (REPLY, EVENT, GAME oder HEARTBEAT; Lebenszeichen zählen nur als empfangene Daten)
+        - payload: Die Nutzdaten als bytes
+        """
+        if kind == REPLY:
+            with self.reply_lock:
+                if self.abandoned_replies:
+                    self.abandoned_replies -= 1  # Verspätete Antwort auf einen abgebrochenen Befehl
+                    return
+                self.replies.put(payload.decode('utf-8'))
+        elif kind == EVENT:
+            try:
+                event = json.loads(payload.decode('utf-8'))
+            except ValueError:
+                NETWORK.warning("Invalid event from server: %r", payload)
+                return
+            if event.get('event') == 'lobby':
+                with self.lock:
+                    self.room_code = event.get('room', self.room_code)
+                    self.lobby = event
+                    self.lobby_version += 1
+        elif kind == GAME:
+            try:
+                event = decode_game_event(payload)
+            except ValueError as e:
+                NETWORK.warning("Invalid game event from server: %s", e)
+                return
+            self.game_events.append(event)  # Runden und Änderungen, abgeholt von GamePlay.update
 
+    def get_lobby(self):
+        """
+        Gibt den zuletzt gepushten Lobby-Zustand zurück, ohne den Server zu fragen.
 
+        Rückgabewert:
+        - (Version, Lobby-Ereignis oder None)
+        """
+        with self.lock:
+            return self.lobby_version, self.lobby
+
+    def close(self):
+        """
+        Meldet den Client beim Server ab und trennt die Verbindung; der Server gibt den Sitz
+        sofort frei und der Empfangs-Thread beendet sich danach.
+        """
+        self.closing = True
+        self.post("leave")
+        try:
+            self.client.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+        self.client.close()
+
+    def poll_game_events(self):
+        """
+        Gibt alle seit dem letzten Aufruf empfangenen Spielereignisse zurück.
+
+        Rückgabewert:
+        - Liste der Ereignisse (dict) in Empfangsreihenfolge
+        """
+        events = []
+        while self.game_events:
+            events.append(self.game_events.popleft())
+        return events
@@ -0,0 +1,112 @@
+import struct
+
+# Kopf jedes Frames: Länge der Nutzdaten (4 Byte, Network Byte Order) und Art des Frames (1 Byte)
+HEADER = struct.Struct("!IB")
+MAX_FRAME_SIZE = 16 * 1024 * 1024  # Obergrenze für einen Frame, schützt vor defekten Längenangaben
+RECV_SIZE = 65536  # Anzahl Bytes, die pro recv-Aufruf gelesen werden
+
+# Arten von Frames
+REQUEST = 0  # Client -> Server: Befehl, z.B. "lobby" oder "name:Anna"
+REPLY = 1  # Server -> Client: Antwort auf einen Befehl, in der Reihenfolge der Befehle
+EVENT = 2  # Server -> Client: ungefragt gepushtes Ereignis (JSON), z.B. der Lobby-Zustand
+MOVE = 3  # Client -> Server: Spielzug, binär kodiert (siehe Online/codec.py)
+GAME = 4  # Server -> Client: Runde oder Änderungen eines Zuges, binär kodiert (siehe Online/codec.py)
+HEARTBEAT = 5  # Beide Richtungen: Lebenszeichen ohne Nutzdaten, der Server antwortet mit einem eigenen
+
+HEARTBEAT_INTERVAL = 5  # Sekunden zwischen zwei Lebenszeichen des Clients
+
+ERROR_PREFIX = "error:"  # Antworten, die mit diesem Präfix beginnen, melden einen Fehler
+DEVICE_IN_USE = "Device already connected"  # Fehler, wenn die Geräte-ID im Raum noch verbunden ist
+RESUME = "resume"  # Dritte Zeile der Anmeldung: Wiederverbindung einer bestehenden Sitzung
+SPECTATE = "spectate"  # Dritte Zeile der Anmeldung: nur zuschauen, ohne Sitz am Tisch
+
+
+def encode_frame(payload, kind=REQUEST):
+    """
+    Verpackt eine Nachricht in einen Frame mit Längenpräfix.
+
+    Parameter:
+    - payload: Die Nachricht (str oder bytes)
+    - kind: Art des Frames (REQUEST, REPLY, EVENT, MOVE, GAME oder HEARTBEAT)
+
+    Rückgabewert:
+    - Der Frame als bytes
+    """
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame too large: {len(payload)} bytes")
+    return HEADER.pack(len(payload), kind) + payload
+
+
+def encode_frames(payloads, kind=REQUEST):
+    """
+    Verpackt mehrere Nachrichten, damit sie mit einem einzigen sendall verschickt werden können.
+
+    Parameter:
+    - payloads: Liste von Nachrichten (str oder bytes)
+    - kind: Art der Frames
+
+    Rückgabewert:
+    - Alle Frames hintereinander als bytes
+    """
+    return b"".join(encode_frame(payload, kind) for payload in payloads)
+
+
+class FrameReader:
+    def __init__(self, max_size=MAX_FRAME_SIZE):
+        """
+        Gepufferter Leser für Frames. Empfangene Bytes werden mit feed() übergeben; TCP darf
+        Nachrichten dabei beliebig zerteilen oder zusammenfassen.
+
+        Parameter:
+        - max_size: Größte erlaubte Nutzdatenlänge eines Frames
+        """
+        self.buffer = bytearray()
+        self.max_size = max_size
+
+    def feed(self, data):
+        """
+        Hängt empfangene Bytes an den Puffer an und gibt alle vollständigen Frames zurück.
+
+        Parameter:
+        - data: Die empfangenen Bytes
+
+        Rückgabewert:
+        - Liste von (Art, Nutzdaten als bytes); unvollständige Frames bleiben im Puffer
+        """
+        self.buffer += data
+        frames = []
+        offset = 0
+        while len(self.buffer) - offset >= HEADER.size:
+            length, kind = HEADER.unpack_from(self.buffer, offset)
+            if length > self.max_size:
+                raise ValueError(f"Frame too large: {length} bytes")
+            end = offset + HEADER.size + length
+            if end > len(self.buffer):
+                break
+            frames.append((kind, bytes(self.buffer[offset + HEADER.size:end])))
+            offset = end
+        del self.buffer[:offset]
+        return frames
+
+
+def read_frames(sock, reader):
+    """
+    Liest vom Socket, bis mindestens ein vollständiger Frame vorliegt.
+
+    Parameter:
+    - sock: Der Socket
+    - reader: Der FrameReader dieser Verbindung
+
+    Rückgabewert:
+    - Liste von (Art, Nutzdaten als bytes); eine leere Liste, wenn die Verbindung geschlossen wurde
+    """
+    while True:
+        data = sock.recv(RECV_SIZE)
+        if not data:
+            return []
+        frames = reader.feed(data)
+        if frames:
+            return frames
+
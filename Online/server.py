@@ -1,156 +1,786 @@
+import argparse
+import asyncio
+import json
+import random
 import socket
-from _thread import *
 import time
-import threading
-
-# Globale Variablen
-clients = {}  # Dictionary zur Speicherung der Clients mit UUID, Spieler-ID und Namen
-game_started = False  # Status, ob das Spiel gestartet wurde
-host_id = None  # Variable für den Host (erster Client, der sich verbindet)
-lock = threading.Lock()  # Lock für Thread-Sicherheit
-
-def create_server_socket():
-    """
-    Erstellt und konfiguriert einen Server-Socket.
-
-    Rückgabewert:
-    - Der erstellte Server-Socket, wenn erfolgreich; sonst None
-    """
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)  # Erstelle einen TCP/IP-Socket
-    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Setze SO_REUSEADDR, um Port-Konflikte zu vermeiden
-    server = socket.gethostbyname(socket.gethostname())  # Hole die IP-Adresse des Hosts
-    port = 5555  # Setze den Port auf 5555
-    try:
-        s.bind((server, port))  # Binde den Socket an die IP-Adresse und den Port
-        s.listen(4)  # Erlaube bis zu 4 Verbindungen (Spieler)
-        print(f"Server listening on {server}:{port}")
-        return s
-    except socket.error as e:
-        print(f"Socket error: {e}")
-        s.close()  # Schließe den Socket bei Fehler
-        return None
 
-def monitor_game_status():
-    """
-    Überwacht den Status des Spiels und gibt diesen alle 5 Sekunden aus.
-    """
-    global game_started
-    while True:
-        print(f"Game Started: {game_started}")  # Gib den aktuellen Spielstatus aus
-        time.sleep(5)  # Warte 5 Sekunden vor der nächsten Überprüfung
-
-def close_all_connections():
-    """
-    Schließt alle Verbindungen und leert das Clients-Dictionary.
-    """
-    global clients
-    try:
-        print("[DEBUG] Closing all connections...")
-        for device_id, client_info in list(clients.items()):
-            try:
-                client_info['connection'].close()  # Schließe die Verbindung zum Client
-                print(f"[DEBUG] Connection closed for {device_id}")
-            except Exception as e:
-                print(f"[DEBUG] Error closing connection for {device_id}: {e}")
-        clients.clear()  # Leere das Dictionary der Clients
-        print("[DEBUG] All connections closed and clients cleared.")
-    except Exception as e:
-        print(f"[DEBUG] Error while closing all connections: {e}")
-
-def threaded_client(conn):
-    """
-    Behandelt die Kommunikation mit einem einzelnen Client in einem eigenen Thread.
-
-    Parameter:
-    - conn: Die Verbindung zum Client
-    """
-    global game_started, host_id
-    try:
-        # Empfange die UUID des Clients und dekodiere sie
-        device_id = conn.recv(2048).decode('utf-8')
-        print(f"[DEBUG] Received device_id: {device_id}")
+from Engine.bots import play_bot_turn
+from Engine.rules import Match, Move, FLIP, PHASE_INITIAL, PHASE_OVER
+from GameLog import SERVER, configure
+from Online.codec import encode_round, encode_delta, decode_move
+from Online.protocol import (REPLY, EVENT, MOVE, GAME, HEARTBEAT, HEARTBEAT_INTERVAL, RECV_SIZE, ERROR_PREFIX,
+                             DEVICE_IN_USE, RESUME, SPECTATE, FrameReader, encode_frame, encode_frames)
+from Online.metrics import Metrics, serve_metrics
+from Online.state_sync import RESULT, MATCH, capture, diff
+
+PORT = 5555  # Port, auf dem der Server lauscht
+MAX_PLAYERS = 4  # Spieler pro Raum
+MAX_SPECTATORS = 32  # Zuschauer pro Raum, zusätzlich zu den Spielern
+SPECTATOR_BUFFER_LIMIT = 256 * 1024  # Ungesendete Bytes, ab denen ein Zuschauer Änderungen überspringt
+MAX_REQUEST_SIZE = 64 * 1024  # Größter erlaubter Befehl eines Clients; begrenzt den Speicher pro Verbindung
+STATS_INTERVAL = 0  # Sekunden zwischen zwei Statuszeilen; 0 schaltet sie ab (Kennzahlen gibt es über --metrics-port)
+METRICS_HOST = "127.0.0.1"  # Der Kennzahlen-Endpunkt ist nur lokal erreichbar
+COMMANDS = ('name', 'start_game', 'subscribe', 'check_host', 'lobby', 'leave')  # Namen der Handler-Histogramme
+BACKLOG = 128  # Warteschlange für noch nicht angenommene Verbindungen
+ROOM_CODE_LENGTH = 4
+ROOM_CODE_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"  # Ohne leicht verwechselbare Zeichen (I, O, 0, 1)
+ROUND_PAUSE = 5  # Sekunden zwischen dem Ende einer Runde und dem Beginn der nächsten
+SEAT_BOT = "Medium"  # Schwierigkeit des Bots, der den Sitz eines Spielers übernimmt, der das laufende Match verlässt
+RECONNECT_GRACE = 60  # Sekunden, die Sitz, Host-Rolle und Spielstand nach einem Verbindungsabbruch erhalten bleiben
+IDLE_TIMEOUT = 3 * HEARTBEAT_INTERVAL  # Sekunden ohne Frame, nach denen eine Verbindung als tot gilt
+HELLO_TIMEOUT = 10  # Sekunden, in denen nach dem Verbindungsaufbau die Anmeldung kommen muss
+REAP_INTERVAL = 1  # Sekunden zwischen zwei Durchläufen des Reapers
+
+HEARTBEAT_FRAME = encode_frame(b"", HEARTBEAT)  # Antwort auf ein Lebenszeichen, nur einmal gebaut
+
+
+class Client:
+    def __init__(self, device_id, player_id, writer, metrics, spectator=False):
+        """
+        Ein verbundener Spieler oder Zuschauer.
+
+        Parameter:
+        - device_id: Die Geräte-ID (UUID) des Clients
+        - player_id: Die vom Server vergebene Spieler-ID (als String)
+        - writer: Der asyncio.StreamWriter der Verbindung
+        - metrics: Die Kennzahlen des Servers, zählt gesendete Bytes
+        - spectator: Ob der Client nur zuschaut
+        """
+        self.device_id = device_id
+        self.metrics = metrics
+        self.id = player_id
+        self.name = f'Spectator {player_id}' if spectator else f'Player {player_id}'
+        self.spectator = spectator
+        self.lagging = False  # Zuschauer, dessen Sendepuffer voll war; bekommt beim Aufholen einen neuen Stand
+        self.writer = writer  # None, solange der Client getrennt ist und auf die Wiederverbindung gewartet wird
+        self.subscribed = False  # Ob der Client Lobby-Ereignisse gepusht bekommt
+        self.expiry = None  # Timer, der den Client nach Ablauf der Gnadenfrist entfernt
+
+    @property
+    def connected(self):
+        """Ob der Client gerade eine Verbindung hat."""
+        return self.writer is not None
+
+    def send(self, data):
+        """
+        Hängt fertige Frames an den Sendepuffer der Verbindung an; ohne Verbindung werden sie verworfen.
+
+        Parameter:
+        - data: Die Frames als bytes
+        """
+        if self.writer is not None and not self.writer.is_closing():
+            self.writer.write(data)
+            self.metrics.count_out(len(data))
 
-        if device_id not in clients:
+    def backlog(self):
+        """
+        Anzahl der Bytes, die noch im Sendepuffer der Verbindung liegen.
+
+        Rückgabewert:
+        - Die Anzahl der Bytes (0 ohne Verbindung)
+        """
+        if self.writer is None or self.writer.is_closing():
+            return 0
+        return self.writer.transport.get_write_buffer_size()
+
+
+class Room:
+    def __init__(self, code, metrics):
+        """
+        Ein Spielraum mit seinen Spielern, dem Host und dem Spielstatus.
+
+        Parameter:
+        - code: Der Raumcode, mit dem andere Spieler beitreten
+        - metrics: Die Kennzahlen des Servers
+        """
+        self.code = code
+        self.metrics = metrics
+        self.next_player_id = 1  # Spieler-IDs werden nicht wiederverwendet, auch wenn jemand geht
+        self.clients = {}  # Geräte-ID -> Client
+        self.host_id = None  # Geräte-ID des Hosts (erster Client, der sich verbindet)
+        self.game_started = False  # Status, ob das Spiel gestartet wurde
+        self.match = None  # Das Match des Raums; der Server ist die einzige Instanz mit Deck und Handkarten
+        self.seats = []  # Spieler-IDs in Sitzreihenfolge, Index = Spielerindex in der Round
+        self.bot_seats = set()  # Sitzindizes, die ein Bot übernommen hat, weil ihr Spieler gegangen ist
+        self.result = None  # Punkte der letzten beendeten Runde, bis die nächste Runde beginnt
+        self.spectators = {}  # Geräte-ID -> Client der Zuschauer
+        self.next_spectator_id = 1
+
+    def join(self, device_id, writer):
+        """
+        Fügt einen Client hinzu oder übernimmt die neue Verbindung eines bekannten Clients.
+
+        Parameter:
+        - device_id: Die Geräte-ID des Clients
+        - writer: Der asyncio.StreamWriter der Verbindung
+
+        Rückgabewert:
+        - Der Client
+        """
+        client = self.clients.get(device_id)
+        if client is None:
             # Wenn der Client neu ist, weise ihm eine Spieler-ID zu
-            player_id = str(len(clients) + 1)
-            clients[device_id] = {'id': player_id, 'name': f'Player {player_id}'}
-            print(f"[DEBUG] New client connected: Player {player_id}")
+            client = Client(device_id, str(self.next_player_id), writer, self.metrics)
+            self.next_player_id += 1
+            self.clients[device_id] = client
+            SERVER.debug("New client connected to room %s: Player %s", self.code, client.id)
 
-            if host_id is None:
+            if self.host_id is None:
                 # Setze den ersten Client als Host
-                host_id = device_id
-                print(f"[DEBUG] Client {device_id} is set as Host.")
+                self.host_id = device_id
+                SERVER.debug("Client %s is set as Host.", device_id)
         else:
-            # Wenn der Client bereits existiert, hole die Spieler-ID
-            player_id = clients[device_id]['id']
-            print(f"[DEBUG] Existing client reconnected: Player {player_id}")
+            # Wenn der Client bereits existiert, behalte Spieler-ID, Name, Sitz und Host-Rolle
+            client.writer = writer
+            if client.expiry is not None:
+                client.expiry.cancel()
+                client.expiry = None
+            SERVER.debug("Existing client reconnected: Player %s", client.id)
+        return client
+
+    def add_spectator(self, device_id, writer):
+        """
+        Fügt einen Zuschauer hinzu. Zuschauer belegen keinen Sitz und dürfen auch nach dem
+        Spielstart dazukommen.
+
+        Parameter:
+        - device_id: Die Geräte-ID des Clients
+        - writer: Der asyncio.StreamWriter der Verbindung
+
+        Rückgabewert:
+        - Der Client
+        """
+        client = Client(device_id, f"S{self.next_spectator_id}", writer, self.metrics, spectator=True)
+        self.next_spectator_id += 1
+        self.spectators[device_id] = client
+        SERVER.debug("Spectator %s joined room %s", client.id, self.code)
+        return client
+
+    def leave(self, client):
+        """
+        Entfernt einen Client; verlässt der Host den Raum, wird der Host zurückgesetzt. Hatte der
+        Client einen Sitz im laufenden Match, spielt ab jetzt ein Bot für ihn weiter, damit der
+        Tisch nicht auf seinen Zug wartet.
+
+        Parameter:
+        - client: Der Client
+        """
+        if client.spectator:
+            if self.spectators.get(client.device_id) is client:
+                del self.spectators[client.device_id]
+                SERVER.debug("Spectator %s left room %s", client.id, self.code)
+            return
+        if self.clients.get(client.device_id) is client:
+            del self.clients[client.device_id]
+            SERVER.debug("Client %s disconnected and removed.", client.device_id)
+        if client.device_id == self.host_id:
+            self.host_id = None
+            SERVER.debug("Host disconnected, host reset.")
+        if self.match is not None and client.id in self.seats:
+            self.bot_seats.add(self.seats.index(client.id))
+            SERVER.debug("Room %s: bot takes over the seat of Player %s", self.code, client.id)
+            self.play_bot_seats()
+
+    def can_join(self, device_id, resume=False, spectate=False):
+        """
+        Prüft, ob ein Client dem Raum beitreten darf.
+
+        Parameter:
+        - device_id: Die Geräte-ID des Clients
+        - resume: Ob der Client eine abgebrochene Verbindung wiederherstellt
+        - spectate: Ob der Client nur zuschauen möchte
+
+        Rückgabewert:
+        - None, wenn der Beitritt erlaubt ist, sonst der Grund als String
+        """
+        if spectate:
+            if device_id in self.spectators:
+                return DEVICE_IN_USE
+            if len(self.spectators) >= MAX_SPECTATORS:
+                return "Too many spectators"
+            return None
+        client = self.clients.get(device_id)
+        if client is not None:
+            # Bekannte Clients dürfen sich immer neu verbinden; eine neue Anmeldung mit einer noch
+            # verbundenen Geräte-ID stammt dagegen von einem zweiten Fenster auf demselben Rechner
+            if client.connected and not resume:
+                return DEVICE_IN_USE
+            return None
+        if self.game_started:
+            return "Game already started"
+        if len(self.clients) >= MAX_PLAYERS:
+            return "Room is full"
+        return None
+
+    def lobby_event(self):
+        """
+        Erstellt das Lobby-Ereignis mit Spielerliste, Host und Spielstatus.
+
+        Rückgabewert:
+        - Das Ereignis als Dictionary
+        """
+        host = self.clients.get(self.host_id)
+        return {
+            'event': 'lobby',
+            'room': self.code,
+            'players': [{'id': client.id, 'name': client.name, 'connected': client.connected}
+                        for client in self.clients.values()],
+            'max_players': MAX_PLAYERS,
+            'spectators': len(self.spectators),
+            'host': host.id if host else None,
+            'status': 'game_started' if self.game_started else 'waiting',
+        }
+
+    def lobby_text(self):
+        """
+        Erstellt die Antwort auf den Befehl "lobby" im bisherigen Textformat.
+
+        Rückgabewert:
+        - Spieleranzahl, eine Zeile pro Spieler und der Spielstatus, getrennt durch Zeilenumbrüche
+        """
+        status = 'game_started' if self.game_started else 'waiting'
+        lobby_info = f"{len(self.clients)}/{MAX_PLAYERS}\n" + '\n'.join(
+            f"Player {client.id}: {client.name}" for client in self.clients.values())
+        return f"{lobby_info}\n{status}"
+
+    def push_lobby(self, targets=None):
+        """
+        Schickt den aktuellen Lobby-Zustand an alle angemeldeten Clients (oder nur an die
+        angegebenen). Wird nur bei Änderungen aufgerufen, nicht pro Frame.
+
+        Parameter:
+        - targets: Liste von Clients (optional, Standard: alle angemeldeten Clients)
+        """
+        message = encode_frame(json.dumps(self.lobby_event()), EVENT)
+        if targets is None:
+            targets = [client for client in self.clients.values() if client.subscribed]
+            targets += [client for client in self.spectators.values() if client.subscribed]
+        for client in targets:
+            client.send(message)
+
+    def broadcast(self, data):
+        """
+        Schickt ein binär kodiertes Spielereignis an alle Spieler und Zuschauer des Raums. Der
+        Frame wird nur einmal gebaut und an jede Verbindung unverändert angehängt.
+
+        Ein Zuschauer, dessen Sendepuffer über SPECTATOR_BUFFER_LIMIT liegt, überspringt
+        Änderungen, statt den Speicher des Servers zu füllen. Sobald sein Puffer wieder Platz
+        hat, bekommt er einmal den vollständigen Stand und danach wieder die Änderungen.
+
+        Parameter:
+        - data: Die Nachricht aus encode_round() oder encode_delta()
+        """
+        message = encode_frame(data, GAME)
+        for client in self.clients.values():
+            client.send(message)
+
+        resync = None  # Aktueller Stand für aufholende Zuschauer, höchstens einmal kodiert
+        for spectator in self.spectators.values():
+            if spectator.backlog() > SPECTATOR_BUFFER_LIMIT:
+                spectator.lagging = True
+            elif spectator.lagging:
+                if resync is None:
+                    resync = encode_frames(self.snapshot(), GAME)
+                spectator.send(resync)
+                spectator.lagging = False
+            else:
+                spectator.send(message)
+
+    def snapshot(self):
+        """
+        Öffentlicher Stand der laufenden Runde für einen Client, der sich neu verbunden hat.
+        Ist die Runde vorbei (Pause vor der nächsten Runde oder Ende des Matches), folgt ein
+        Delta mit dem Ergebnis, damit auch dieser Client die Punkte der Runde und gegebenenfalls
+        das Ende des Matches sieht.
+
+        Rückgabewert:
+        - Liste der Nachrichten aus encode_round() und encode_delta() oder None, wenn keine Runde läuft
+        """
+        if self.match is None or self.match.round is None:
+            return None
+        messages = [encode_round(self.seats, capture(self.match.round))]
+        if self.result is not None:
+            messages.append(encode_delta(self.result_ops()))
+        return messages
+
+    def result_ops(self):
+        """
+        Operationen zum Ergebnis der beendeten Runde; ist das Match damit vorbei, zusätzlich
+        Gewinner und Gesamtpunkte.
+
+        Rückgabewert:
+        - Liste der Operationen
+        """
+        ops = [[RESULT, self.result]]
+        if self.match.is_over():
+            ops.append([MATCH, self.match.winner(), list(self.match.total_scores)])
+        return ops
+
+    def start_match(self):
+        """
+        Startet das Match mit allen Spielern im Raum; die Sitzreihenfolge ist die Beitrittsreihenfolge.
+        """
+        self.seats = [client.id for client in self.clients.values()]
+        self.bot_seats = set()
+        self.match = Match(len(self.seats))
+        SERVER.debug("Room %s: match seed %s", self.code, self.match.seed)
+        self.start_round()
+
+    def start_round(self):
+        """
+        Teilt eine neue Runde aus und schickt allen Clients den öffentlichen Stand
+        (die erste Stack-Karte und den Spieler am Zug, aber keine verdeckten Karten).
+        """
+        if self.match is None or not self.clients:
+            return
+        game_round = self.match.new_round()
+        self.result = None
+        self.broadcast(encode_round(self.seats, capture(game_round)))
+        self.play_bot_seats()
+
+    def handle_move(self, client, data):
+        """
+        Prüft und führt einen Zug aus und schickt die Änderungen an alle Clients des Raums.
+        Züge von Spielern, die nicht am Zug sind, und ungültige Züge werden ignoriert.
+
+        Parameter:
+        - client: Der Client, der den Zug schickt
+        - data: Der binär kodierte Zug (siehe Online/codec.py)
+        """
+        game_round = self.match.round if self.match else None
+        if game_round is None or game_round.phase == PHASE_OVER:
+            return
+        if client.id not in self.seats or self.seats.index(client.id) != game_round.current_player:
+            return
+        try:
+            move = decode_move(data)
+            before = capture(game_round)
+            game_round.apply(move)
+        except ValueError as e:
+            SERVER.debug("Room %s: rejected move %r: %s", self.code, data, e)
+            return
+        self.play_bots(game_round)
+        self.broadcast_changes(before, game_round)
+
+    def play_bots(self, game_round):
+        """
+        Spielt die Züge aller übernommenen Sitze, bis ein Spieler am Zug oder die Runde vorbei ist.
+        In der Anfangsrunde wird Karte für Karte aufgedeckt, weil der Spieler vor dem Verlassen
+        schon eine Karte aufgedeckt haben kann.
+
+        Parameter:
+        - game_round: Die laufende Round
+        """
+        while game_round.phase != PHASE_OVER and game_round.current_player in self.bot_seats:
+            if game_round.phase == PHASE_INITIAL:
+                game_round.apply(Move(FLIP, game_round.rng.choice(game_round.current_hand.hidden_indices())))
+            else:
+                play_bot_turn(game_round, SEAT_BOT)
+
+    def play_bot_seats(self):
+        """
+        Lässt die Bots ziehen, wenn einer der übernommenen Sitze am Zug ist, und schickt die
+        Änderungen an alle Clients des Raums.
+        """
+        game_round = self.match.round if self.match else None
+        if game_round is None or game_round.phase == PHASE_OVER or not self.clients:
+            return
+        if game_round.current_player not in self.bot_seats:
+            return
+        before = capture(game_round)
+        self.play_bots(game_round)
+        self.broadcast_changes(before, game_round)
 
-        # Sende die Spieler-ID zurück an den Client
-        conn.send(str.encode(player_id))
+    def broadcast_changes(self, before, game_round):
+        """
+        Schickt die Änderungen seit before an alle Clients; ist die Runde vorbei, mit dem Ergebnis,
+        und die nächste Runde beginnt nach ROUND_PAUSE Sekunden. Ist das Match vorbei, folgt
+        keine Runde mehr; das Delta meldet dann Gewinner und Gesamtpunkte.
 
+        Parameter:
+        - before: Der Stand vor den Zügen (aus capture())
+        - game_round: Die laufende Round
+        """
+        ops = diff(before, capture(game_round))
+        if game_round.phase == PHASE_OVER:
+            self.result = self.match.finish_round()
+            ops += self.result_ops()
+            if self.match.is_over():
+                SERVER.debug("Room %s: match over, winner Player %s", self.code, self.seats[self.match.winner()])
+            else:
+                asyncio.get_running_loop().call_later(ROUND_PAUSE, self.start_round)
+        self.broadcast(encode_delta(ops))
+
+    def handle_command(self, client, data):
+        """
+        Verarbeitet einen Befehl eines Clients.
+
+        Parameter:
+        - client: Der Client
+        - data: Der Befehl als String
+
+        Rückgabewert:
+        - Die Antwort als String oder None für Befehle ohne Antwort (name:, start_game, subscribe, leave)
+        """
+        if client.spectator and (data.startswith('name:') or data == 'start_game'):
+            return None  # Zuschauer verändern weder Lobby noch Spiel
+
+        if data.startswith('name:'):
+            client.name = data.split(':')[1]
+            SERVER.debug("Name changed for %s to %s", client.device_id, client.name)
+            self.push_lobby()
+
+        elif data == 'start_game':
+            if not self.game_started:
+                self.game_started = True
+                SERVER.debug("Game Started command received.")
+                self.push_lobby()
+                self.start_match()
+
+        elif data == 'subscribe':
+            # Ab jetzt bekommt der Client Lobby-Änderungen gepusht, beginnend mit dem aktuellen Zustand
+            client.subscribed = True
+            self.push_lobby([client])
+
+        elif data == 'check_host':
+            host = 'True' if client.device_id == self.host_id else 'False'
+            return f"Host: {host}"
+
+        elif data == 'lobby':
+            return self.lobby_text()
+        return None
+
+
+class GameServer:
+    def __init__(self, host=None, port=PORT, idle_timeout=IDLE_TIMEOUT, reconnect_grace=RECONNECT_GRACE):
+        """
+        asyncio-Server: alle Verbindungen laufen als Coroutinen in einem Thread und einer Event-Loop.
+        Ein Server verwaltet beliebig viele Räume, die über ihren Code gefunden werden.
+
+        Parameter:
+        - host: Adresse, an die der Server gebunden wird (Standard: IP-Adresse des Rechners)
+        - port: Port des Servers
+        - idle_timeout: Sekunden ohne Frame (auch ohne Lebenszeichen), nach denen der Reaper die Verbindung trennt
+        - reconnect_grace: Sekunden, die der Sitz eines getrennten Spielers frei gehalten wird
+        """
+        self.host = host or socket.gethostbyname(socket.gethostname())  # Hole die IP-Adresse des Hosts
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.reconnect_grace = reconnect_grace
+        self.rooms = {}  # Raumcode -> Room
+        self.connections = {}  # Offene Verbindungen: StreamWriter -> Zeitpunkt des letzten empfangenen Frames
+        self.rng = random.SystemRandom()  # Raumcodes sollen nicht vorhersagbar sein
+        self.metrics = Metrics()  # Zähler, Bytes und Handler-Laufzeiten
+
+    def create_room(self):
+        """
+        Legt einen neuen Raum mit einem noch freien Code an.
+
+        Rückgabewert:
+        - Der neue Raum
+        """
         while True:
-            try:
-                # Empfange Daten vom Client
-                data = conn.recv(2048).decode('utf-8')
-                if not data:
-                    break  # Beende die Schleife, wenn keine Daten empfangen werden
-
-                # Verarbeite die empfangenen Daten
-                if data.startswith('name:'):
-                    new_name = data.split(':')[1]
-                    clients[device_id]['name'] = new_name
-                    print(f"[DEBUG] Name changed for {device_id} to {new_name}")
-
-                elif data == 'start_game':
-                    game_started = True
-                    print("[DEBUG] Game Started command received.")
-
-                elif data == 'check_host':
-                    host = 'True' if device_id == host_id else 'False'
-                    response = f"Host: {host}"
-                    conn.sendall(str.encode(response))
-
-                elif data == 'lobby':
-                    status = 'game_started' if game_started else 'waiting'
-                    lobby_info = f"{len(clients)}/4\n" + '\n'.join(
-                        f"Player {info['id']}: {info['name']}" for info in clients.values())
-
-                    # Spielstatus an Lobby-Info anhängen
-                    response = f"{lobby_info}\n{status}"
-                    conn.sendall(str.encode(response))
-            except ConnectionResetError:
-                print("Connection was reset by the client.")
-                break
-            except Exception as e:
-                print(f"An error occurred: {e}")
+            code = "".join(self.rng.choice(ROOM_CODE_ALPHABET) for _ in range(ROOM_CODE_LENGTH))
+            if code not in self.rooms:
                 break
-    finally:
-        # Schließe die Verbindung und entferne den Client aus der Liste
-        conn.close()
-        if device_id in clients:
-            del clients[device_id]
-            print(f"[DEBUG] Client {device_id} disconnected and removed.")
-        if device_id == host_id:
-            # Setze den Host zurück, wenn der Host die Verbindung trennt
-            host_id = None
-            print("[DEBUG] Host disconnected, host reset.")
-
-# Starte den Status-Überwachungs-Thread
-start_new_thread(monitor_game_status, ())
-
-# Erstelle den Server-Socket
-s = create_server_socket()
-if s:
-    try:
+        room = Room(code, self.metrics)
+        self.rooms[code] = room
+        SERVER.debug("Room %s created.", code)
+        return room
+
+    def remove_client(self, room, client):
+        """
+        Entfernt einen Client aus seinem Raum und löst den Raum auf, wenn er danach leer ist.
+
+        Parameter:
+        - room: Der Raum
+        - client: Der Client
+        """
+        room.leave(client)
+        if room.clients:
+            room.push_lobby()  # Verbleibende Clients über den Abgang informieren
+        elif self.rooms.get(room.code) is room:
+            del self.rooms[room.code]
+            for spectator in room.spectators.values():
+                spectator.writer.close()  # Ohne Spieler gibt es nichts mehr zu sehen
+            SERVER.debug("Room %s closed.", room.code)
+
+    def suspend_client(self, room, client):
+        """
+        Hält Sitz, Host-Rolle und Spielstand eines getrennten Clients reconnect_grace Sekunden
+        lang frei. Meldet er sich in dieser Zeit mit derselben Geräte-ID zurück, übernimmt
+        Room.join die neue Verbindung, sonst wird er entfernt und ein Bot spielt seinen Sitz weiter.
+
+        Parameter:
+        - room: Der Raum
+        - client: Der Client
+        """
+        client.writer = None
+        client.expiry = asyncio.get_running_loop().call_later(self.reconnect_grace, self.expire_client, room, client)
+        SERVER.debug("Player %s in room %s lost connection, waiting %ss.", client.id, room.code, self.reconnect_grace)
+        room.push_lobby()  # Verbleibende Clients sehen den Spieler als getrennt
+
+    def expire_client(self, room, client):
+        """
+        Entfernt einen Client, dessen Gnadenfrist abgelaufen ist, ohne dass er sich zurückgemeldet hat.
+
+        Parameter:
+        - room: Der Raum
+        - client: Der Client
+        """
+        client.expiry = None
+        if not client.connected:
+            self.metrics.counters['expired'] += 1
+            self.remove_client(room, client)
+
+    def parse_hello(self, payload):
+        """
+        Liest die Anmeldung eines Clients: die Geräte-ID, optional gefolgt von einem Zeilenumbruch
+        und dem Code des Raums, dem er beitreten möchte. Ohne Code wird ein neuer Raum angelegt.
+        Eine dritte Zeile RESUME kennzeichnet die Wiederverbindung einer bestehenden Sitzung,
+        SPECTATE den Beitritt als Zuschauer.
+
+        Parameter:
+        - payload: Die Nutzdaten des ersten Frames
+
+        Rückgabewert:
+        - (Geräte-ID, Raum, Zuschauer, Fehlermeldung); Raum ist None, wenn der Beitritt nicht möglich ist
+        """
+        device_id, _, rest = payload.decode('utf-8').partition('\n')
+        code, _, flag = rest.partition('\n')
+        code = code.strip().upper()
+        spectate = flag == SPECTATE
+        if not code:
+            if spectate:
+                return device_id, None, spectate, "Room code required to spectate"
+            return device_id, self.create_room(), spectate, None
+        room = self.rooms.get(code)
+        if room is None:
+            return device_id, None, spectate, f"Room {code} not found"
+        reason = room.can_join(device_id, flag == RESUME, spectate)
+        if reason is not None:
+            return device_id, None, spectate, reason
+        return device_id, room, spectate, None
+
+    async def handle_client(self, reader, writer):
+        """
+        Behandelt die Kommunikation mit einem einzelnen Client. Alle Nachrichten sind Frames
+        mit Längenpräfix (siehe Online/protocol.py); Antworten werden in der Reihenfolge der
+        Befehle geschickt.
+
+        Parameter:
+        - reader: Der asyncio.StreamReader der Verbindung
+        - writer: Der asyncio.StreamWriter der Verbindung
+        """
+        loop = asyncio.get_running_loop()
+        self.connections[writer] = loop.time()
+        self.metrics.counters['connections_accepted'] += 1
+        frame_reader = FrameReader(MAX_REQUEST_SIZE)
+        room = None
+        client = None
+        left = False  # Ob der Client sich mit "leave" abgemeldet hat
+        try:
+            # Empfange die UUID des Clients (und den Raumcode) und dekodiere sie
+            try:
+                frames = await asyncio.wait_for(self.read_frames(reader, frame_reader), HELLO_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.metrics.counters['hello_timeouts'] += 1
+                return
+            device_id, room, spectate, error = self.parse_hello(frames[0][1])
+            if room is None:
+                SERVER.debug("Connection refused for %s: %s", device_id, error)
+                refusal = encode_frame(ERROR_PREFIX + error, REPLY)
+                writer.write(refusal)
+                self.metrics.count_out(len(refusal))
+                await writer.drain()
+                return
+            SERVER.debug("Received device_id: %s", device_id)
+            if not spectate and device_id in room.clients:
+                self.metrics.counters['resumed'] += 1
+
+            client = room.add_spectator(device_id, writer) if spectate else room.join(device_id, writer)
+            # Sende die Spieler-ID zurück an den Client
+            client.send(encode_frame(client.id, REPLY))
+            snapshot = room.snapshot()
+            if snapshot is not None:
+                client.send(encode_frames(snapshot, GAME))  # Wiederverbindung: laufende Runde neu übertragen
+            room.push_lobby()  # Angemeldete Clients über den neuen (oder zurückgekehrten) Spieler informieren
+
+            frames = frames[1:]  # Befehle, die zusammen mit der UUID ankamen
+            while True:
+                if not frames:
+                    frames = await self.read_frames(reader, frame_reader)
+                self.connections[writer] = loop.time()  # Jeder Frame zählt als Lebenszeichen
+                # Alle Befehle eines Lesevorgangs verarbeiten und gemeinsam beantworten
+                replies = []
+                for kind, payload in frames:
+                    started = time.perf_counter()
+                    if kind == MOVE:
+                        room.handle_move(client, payload)
+                        self.metrics.observe('move', time.perf_counter() - started)
+                        continue
+                    if kind == HEARTBEAT:
+                        client.send(HEARTBEAT_FRAME)
+                        continue
+                    if payload == b'leave':
+                        left = True  # Bewusst verlassen: keine Gnadenfrist
+                        return
+                    command = payload.decode('utf-8')
+                    reply = room.handle_command(client, command)
+                    if reply is not None:
+                        replies.append(reply)
+                    handler = command.partition(':')[0]
+                    self.metrics.observe(handler if handler in COMMANDS else 'other', time.perf_counter() - started)
+                if replies:
+                    client.send(encode_frames(replies, REPLY))
+                frames = []
+                await writer.drain()
+        except ConnectionResetError:
+            pass  # Verbindung vom Client geschlossen
+        except Exception as e:
+            SERVER.error("An error occurred: %s", e)
+        finally:
+            # Schließe die Verbindung und entferne den Client aus dem Raum
+            self.connections.pop(writer, None)
+            writer.close()
+            if client is not None and client.writer is writer:
+                if left or client.spectator:
+                    self.remove_client(room, client)
+                else:
+                    self.suspend_client(room, client)
+
+    async def read_frames(self, reader, frame_reader):
+        """
+        Liest von der Verbindung, bis mindestens ein vollständiger Frame vorliegt.
+
+        Parameter:
+        - reader: Der asyncio.StreamReader der Verbindung
+        - frame_reader: Der FrameReader der Verbindung
+
+        Rückgabewert:
+        - Liste von (Art, Nutzdaten als bytes); ConnectionResetError, wenn die Verbindung endet
+        """
+        while True:
+            data = await reader.read(RECV_SIZE)
+            if not data:
+                raise ConnectionResetError("Connection closed by the client")
+            frames = frame_reader.feed(data)
+            self.metrics.count_in(len(frames), len(data))
+            if frames:
+                return frames
+
+    async def reap_idle_connections(self):
+        """
+        Trennt alle REAP_INTERVAL Sekunden Verbindungen, von denen seit idle_timeout Sekunden
+        kein Frame (auch kein Lebenszeichen) kam, z.B. halb offene Verbindungen eines zugeklappten
+        Laptops. handle_client endet dadurch; der Sitz geht in die Gnadenfrist und wird danach frei
+        (im laufenden Match übernimmt ihn ein Bot, siehe Room.leave).
+        """
+        loop = asyncio.get_running_loop()
         while True:
-            # Akzeptiere eingehende Verbindungen und starte für jede eine neue Thread
-            conn, addr = s.accept()
-            start_new_thread(threaded_client, (conn,))
+            await asyncio.sleep(REAP_INTERVAL)
+            deadline = loop.time() - self.idle_timeout
+            for writer, last_seen in list(self.connections.items()):
+                if last_seen < deadline and not writer.is_closing():
+                    self.metrics.counters['reaped'] += 1
+                    SERVER.debug("Reaping idle connection %s", writer.get_extra_info('peername'))
+                    writer.transport.abort()  # Nicht auf das Leeren des Sendepuffers warten; die Gegenseite liest nicht
+
+    def gauges(self):
+        """
+        Momentanwerte für die Kennzahlen: Räume, laufende Spiele und Verbindungen.
+
+        Rückgabewert:
+        - Dictionary Name -> Wert
+        """
+        players = [client for room in self.rooms.values() for client in room.clients.values()]
+        connected = sum(client.connected for client in players)
+        return {
+            'rooms': len(self.rooms),
+            'games_started': sum(room.game_started for room in self.rooms.values()),
+            'connections': len(self.connections),
+            'players_connected': connected,
+            'players_suspended': len(players) - connected,
+            'spectators': sum(len(room.spectators) for room in self.rooms.values()),
+        }
+
+    async def report_stats(self, interval):
+        """
+        Gibt alle interval Sekunden eine Zeile mit den wichtigsten Kennzahlen aus.
+
+        Parameter:
+        - interval: Sekunden zwischen zwei Zeilen
+        """
+        while True:
+            await asyncio.sleep(interval)
+            SERVER.info("%s", self.metrics.summary(self.gauges()))
+
+    def close_all_connections(self):
+        """
+        Schließt alle Verbindungen und löst alle Räume auf.
+        """
+        SERVER.debug("Closing all connections...")
+        for writer in list(self.connections):
+            writer.close()
+        self.connections.clear()
+        self.rooms.clear()
+        SERVER.debug("All connections closed and clients cleared.")
+
+    async def serve(self, stats_interval=STATS_INTERVAL, metrics_port=None):
+        """
+        Startet den Server und bearbeitet Verbindungen, bis er beendet wird.
+
+        Parameter:
+        - stats_interval: Sekunden zwischen zwei Statuszeilen; 0 schaltet sie ab
+        - metrics_port: Port des lokalen Kennzahlen-Endpunkts oder None
+        """
+        server = await asyncio.start_server(self.handle_client, self.host, self.port,
+                                            backlog=BACKLOG, reuse_address=True)
+        SERVER.info("Server listening on %s:%s", self.host, self.port)
+        tasks = [asyncio.create_task(self.reap_idle_connections())]
+        if stats_interval > 0:
+            tasks.append(asyncio.create_task(self.report_stats(stats_interval)))
+        metrics_server = None
+        if metrics_port is not None:
+            metrics_server = await serve_metrics(self.metrics, self.gauges, METRICS_HOST, metrics_port)
+            SERVER.info("Metrics on http://%s:%s/metrics", METRICS_HOST, metrics_port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if metrics_server is not None:
+                metrics_server.close()
+            self.close_all_connections()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Skyjo-Server für Online-Spiele.")
+    parser.add_argument("--host", default=None, help="Adresse, an die der Server gebunden wird")
+    parser.add_argument("--port", type=int, default=PORT, help="Port des Servers")
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT,
+                        help="Sekunden ohne Lebenszeichen, nach denen eine Verbindung getrennt wird")
+    parser.add_argument("--reconnect-grace", type=float, default=RECONNECT_GRACE,
+                        help="Sekunden, die der Sitz eines getrennten Spielers frei gehalten wird")
+    parser.add_argument("--stats-interval", type=float, default=STATS_INTERVAL,
+                        help="Sekunden zwischen zwei Statuszeilen (0 = aus)")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help=f"Port für Kennzahlen im Textformat unter http://{METRICS_HOST}:<Port>/metrics")
+    parser.add_argument("--debug", action="store_true", help="Debug-Meldungen zu jeder Verbindung und jedem Befehl")
+    args = parser.parse_args(argv)
+
+    configure(categories=["server"] if args.debug else [])
+    try:
+        server = GameServer(args.host, args.port, args.idle_timeout, args.reconnect_grace)
+        asyncio.run(server.serve(args.stats_interval, args.metrics_port))
     except KeyboardInterrupt:
-        print("[DEBUG] Server shutting down due to KeyboardInterrupt.")
-    finally:
-        # Schließe alle Verbindungen und den Server-Socket
-        close_all_connections()
-        s.close()
-else:
-    print("Failed to create server socket.")
+        SERVER.info("Server shutting down due to KeyboardInterrupt.")
+    except OSError as e:
+        SERVER.error("Socket error: %s", e)
+        SERVER.error("Failed to create server socket.")
+
+
+if __name__ == "__main__":
+    main()
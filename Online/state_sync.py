@@ -0,0 +1,162 @@
+"""
+Abgleich des Spielzustands zwischen Server und Clients.
+
+Der Server hält die einzige vollständige Round (Deck, alle Handkarten, Zugreihenfolge).
+Nach jedem Zug vergleicht er den öffentlichen Zustand vor und nach dem Zug und schickt nur
+die Unterschiede als kurze Operationen an alle Clients des Raums:
+
+- ["c", Spieler, Position, Wert]  Karte ist offen und hat diesen Wert (aufgedeckt oder getauscht)
+- ["e", Spieler, Maske]           Bitmaske der eliminierten Positionen einer Hand
+- ["s", Wert]                     Oberste Karte des Stacks
+- ["t", Spieler, Phase, gezogen]  Spieler am Zug, Phase und ob er schon vom Deck gezogen hat
+- ["r", [Punkte, ...]]            Punkte der beendeten Runde (inkl. Verdopplung)
+- ["m", Gewinner, [Punkte, ...]]  Das Match ist vorbei: Index des Gewinners und Gesamtpunkte
+
+Verdeckte Kartenwerte verlassen den Server nie. Ein kompletter Stand (z.B. zu Rundenbeginn)
+ist die Liste der Operationen gegenüber einem leeren Tisch. Übertragen werden Züge, Stände
+und Operationen binär (siehe Online/codec.py).
+"""
+from Engine.rules import Hand, Move, HAND_SIZE, FLIP, DRAW, SWAP, PHASE_INITIAL, PHASE_TURN, PHASE_OVER
+
+CARD = "c"
+ELIM = "e"
+STACK = "s"
+TURN = "t"
+RESULT = "r"
+MATCH = "m"
+
+PHASES = [PHASE_INITIAL, PHASE_TURN, PHASE_OVER]  # Phase <-> Zahl im TURN-Eintrag
+
+
+def capture(game_round):
+    """
+    Hält den öffentlichen Zustand einer Round fest.
+
+    Parameter:
+    - game_round: Die Round des Servers
+
+    Rückgabewert:
+    - Tupel aus (Werte, sichtbar, eliminiert) je Hand, Stack-Karte und Zuginformationen
+    """
+    hands = tuple((tuple(hand.values), hand.visible, hand.elim) for hand in game_round.hands)
+    turn = (game_round.current_player, PHASES.index(game_round.phase), int(game_round.deck_action_taken))
+    return hands, game_round.stack_top, turn
+
+
+def empty_state(player_count):
+    """
+    Öffentlicher Zustand eines leeren Tisches; Ausgangspunkt für einen kompletten Stand.
+
+    Parameter:
+    - player_count: Anzahl der Spieler
+
+    Rückgabewert:
+    - Zustand im Format von capture()
+    """
+    return (((0,) * HAND_SIZE, 0, 0),) * player_count, None, None
+
+
+def diff(before, after):
+    """
+    Ermittelt die Operationen, die einen Client von before nach after bringen.
+
+    Parameter:
+    - before: Zustand aus capture() oder empty_state()
+    - after: Zustand aus capture()
+
+    Rückgabewert:
+    - Liste der Operationen
+    """
+    ops = []
+    for player, ((old_values, old_visible, old_elim), (values, visible, elim)) in enumerate(zip(before[0], after[0])):
+        for index in range(HAND_SIZE):
+            if not visible >> index & 1:
+                continue
+            if not old_visible >> index & 1 or old_values[index] != values[index]:
+                ops.append([CARD, player, index, values[index]])
+        if elim != old_elim:
+            ops.append([ELIM, player, elim])
+    if after[1] != before[1]:
+        ops.append([STACK, after[1]])
+    if after[2] != before[2]:
+        ops.append([TURN, *after[2]])
+    return ops
+
+
+class RoundView:
+    def __init__(self, player_count):
+        """
+        Spiegel einer Round auf dem Client. Verdeckte Karten haben den Platzhalter 0 und
+        zählen nicht zur Punktzahl; alle Änderungen kommen als Operationen vom Server.
+
+        Parameter:
+        - player_count: Anzahl der Spieler
+        """
+        self.player_count = player_count
+        self.hands = [Hand([0] * HAND_SIZE) for _ in range(player_count)]
+        self.stack_top = None
+        self.current_player = 0
+        self.phase = PHASE_INITIAL
+        self.deck_action_taken = False
+        self.starting_player = None
+        self.round_scores = None  # Punkte der Runde, sobald sie beendet ist
+        self.winner = None  # Index des Gewinners, sobald das Match vorbei ist
+        self.total_scores = None  # Gesamtpunkte am Ende des Matches
+
+    @property
+    def current_hand(self):
+        """Hand des Spielers, der am Zug ist."""
+        return self.hands[self.current_player]
+
+    def apply(self, ops):
+        """
+        Übernimmt Operationen des Servers.
+
+        Parameter:
+        - ops: Liste der Operationen (siehe Moduldokumentation)
+        """
+        for op in ops:
+            kind = op[0]
+            if kind == CARD:
+                self.hands[op[1]].swap(op[2], op[3])
+            elif kind == ELIM:
+                self.hands[op[1]].eliminate(op[2])
+            elif kind == STACK:
+                self.stack_top = op[1]
+            elif kind == TURN:
+                phase = PHASES[op[2]]
+                if self.phase == PHASE_INITIAL and phase == PHASE_TURN:
+                    self.starting_player = op[1]
+                self.current_player, self.phase, self.deck_action_taken = op[1], phase, bool(op[3])
+            elif kind == RESULT:
+                self.round_scores = op[1]
+            elif kind == MATCH:
+                self.winner, self.total_scores = op[1], op[2]
+
+    def scores(self):
+        """
+        Punktzahl jeder Hand aus den offenen, nicht eliminierten Karten.
+
+        Rückgabewert:
+        - Liste der Punktzahlen
+        """
+        return [hand.score() for hand in self.hands]
+
+    def legal_moves(self):
+        """
+        Züge, die der Server voraussichtlich annimmt; dient nur zur Vorprüfung von Klicks.
+
+        Rückgabewert:
+        - Liste von Move-Tupeln
+        """
+        if self.phase == PHASE_OVER:
+            return []
+        hand = self.current_hand
+        moves = [Move(FLIP, index) for index in hand.hidden_indices()]
+        if self.phase == PHASE_INITIAL:
+            return moves
+        if not self.deck_action_taken:
+            moves.append(Move(DRAW))
+        if self.stack_top is not None:
+            moves.extend(Move(SWAP, index) for index in range(HAND_SIZE) if not hand.elim >> index & 1)
+        return moves
@@ -1,5 +1,7 @@
 import pygame
 from States.base import State
+from Engine.rules import apply_first_finisher_penalty
+from GameAssets import get_font
 
 class A_Scoreboard(State):
     def __init__(self, assets=None):
@@ -19,7 +21,7 @@ class A_Scoreboard(State):
         """
         super(A_Scoreboard, self).__init__()
         self.assets = assets
-        self.font = pygame.font.Font(None, 50)
+        self.font = get_font(None, 50)
         self.round = 1
         self.options = ["New Round", "Quit Game"]
         self.active_index = 0
@@ -52,11 +54,8 @@ class A_Scoreboard(State):
         first_to_finish = self.persist.get('first_to_finish', None)
 
         if first_to_finish is not None:
-            # 2. Überprüfe, ob der Spieler nicht die niedrigste Punktzahl in der Runde hat
-            min_score = min(self.current_round_score)
-            if self.current_round_score[first_to_finish - 1] != min_score:
-                # 3. Verdopple die Punkte des Spielers, wenn er nicht die niedrigste Punktzahl hat
-                self.current_round_score[first_to_finish - 1] *= 2
+            # 2. Verdopple die Punkte des Spielers, wenn er nicht die niedrigste Punktzahl hat
+            apply_first_finisher_penalty(self.current_round_score, first_to_finish - 1)
         self.persist['first_to_finish'] = None
 
         # Aktualisiere die total_scores basierend auf den aktuellen Rundenscores
@@ -130,7 +129,7 @@ class A_Scoreboard(State):
         screen.blit(background_scaled, (0, 0))
 
         # Überschrift "Scoreboard" zeichnen
-        header_text = self.font.render("Scoreboard", True, pygame.Color("white"))
+        header_text = self.assets.render_text(self.font, "Scoreboard", pygame.Color("white"))
         screen.blit(header_text, (self.screen_rect.centerx - header_text.get_width() // 2, 50))
 
         # Definiere die Positionen und Abstände für die Tabelle
@@ -140,32 +139,32 @@ class A_Scoreboard(State):
         column_width = 200
 
         # Tabellenüberschrift zeichnen
-        header_text = self.font.render("Round", True, pygame.Color("white"))
+        header_text = self.assets.render_text(self.font, "Round", pygame.Color("white"))
         screen.blit(header_text, (x_offset, y_offset))
 
         # Namen der Spieler und Bots zeichnen
         for i in range(self.player_count):
             if i == 0:
-                player_header_text = self.font.render(self.player_names[i], True, pygame.Color("white"))
+                player_header_text = self.assets.render_text(self.font, self.player_names[i], pygame.Color("white"))
             else:
-                player_header_text = self.font.render(self.bot_names[i - 1], True, pygame.Color("white"))
+                player_header_text = self.assets.render_text(self.font, self.bot_names[i - 1], pygame.Color("white"))
             screen.blit(player_header_text, (x_offset + (i + 1) * column_width, y_offset))
 
         # Rundenscores und Gesamtpunktzahlen zeichnen
         for j, scores in enumerate(self.round_scores):
-            round_text = self.font.render(f"Round {j + 1}", True, pygame.Color("white"))
+            round_text = self.assets.render_text(self.font, f"Round {j + 1}", pygame.Color("white"))
             screen.blit(round_text, (x_offset, y_offset + (j + 1) * row_height))
 
             for i in range(self.player_count):
-                score_text = self.font.render(str(scores[i]), True, pygame.Color("white"))
+                score_text = self.assets.render_text(self.font, str(scores[i]), pygame.Color("white"))
                 screen.blit(score_text, (x_offset + (i + 1) * column_width, y_offset + (j + 1) * row_height))
 
         # Gesamtsumme in der letzten Zeile zeichnen
-        total_text = self.font.render("Total", True, pygame.Color("white"))
+        total_text = self.assets.render_text(self.font, "Total", pygame.Color("white"))
         screen.blit(total_text, (x_offset, y_offset + (len(self.round_scores) + 1) * row_height))
 
         for i in range(self.player_count):
-            total_score_text = self.font.render(str(self.total_scores[i]), True, pygame.Color("white"))
+            total_score_text = self.assets.render_text(self.font, str(self.total_scores[i]), pygame.Color("white"))
             screen.blit(total_score_text, (x_offset + (i + 1) * column_width, y_offset + (len(self.round_scores) + 1) * row_height))
 
         # Menüoptionen zeichnen
@@ -184,7 +183,7 @@ class A_Scoreboard(State):
         - Das gerenderte Textobjekt
         """
         color = pygame.Color("red") if index == self.active_index else pygame.Color("white")
-        return self.font.render(self.options[index], True, color)
+        return self.assets.render_text(self.font, self.options[index], color)
 
     def get_text_position(self, text, index):
         """
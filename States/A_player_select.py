@@ -1,3 +1,4 @@
+import random
 from States.base import State
 from GameAssets import *
 import pygame  # Stelle sicher, dass pygame importiert wird
@@ -45,8 +46,8 @@ class A_PlayerSelect(State):
         self.bot_difficulties = ["Medium"] * 4
         self.bot_names = self.generate_random_bot_names()
         self.next_state = "GAMEPLAY_AUTOMATED"
-        self.font = pygame.font.Font(None, 50)
-        self.button_font = pygame.font.Font(None, 40)
+        self.font = get_font(None, 50)
+        self.button_font = get_font(None, 40)
         self.screen_rect = pygame.display.get_surface().get_rect()
         self.icon_size = 100
         self.icon_positions = self.calculate_icon_positions()
@@ -97,10 +98,24 @@ class A_PlayerSelect(State):
             (bot3_x, bot3_y)
         ]
 
-    def generate_random_bot_names(self):
+    def startup(self, persistent):
+        """
+        Beginnt ein neues Match und lost die Bot-Namen mit dessen Zufallsgenerator neu aus.
+
+        Parameter:
+        - persistent: Ein Dictionary mit persistierenden Daten
+        """
+        super(A_PlayerSelect, self).startup(persistent)
+        self.reset_match_rng()
+        self.bot_names = self.generate_random_bot_names(self.get_match_rng())
+
+    def generate_random_bot_names(self, rng=None):
         """
         Generiert zufällige Namen für die KI-Gegner.
 
+        Parameter:
+        - rng: Zufallsgenerator des Matches (Standard: Modul random)
+
         Rückgabewert:
         - Eine Liste von drei zufällig ausgewählten Namen für die Bots.
         """
@@ -109,7 +124,7 @@ class A_PlayerSelect(State):
                  "Naomi", "Sophie", "Stella", "Eliza", "Hannah", "Leo", "Max", "Eli", "Ben", "Sam",
                  "Jack", "Luke", "Noah", "Alex", "Ryan", "Jake", "Owen", "Henry", "Liam", "Adam",
                  "James", "Daniel", "Thomas", "Ethan", "Mason", "Caleb", "Joseph", "Oliver", "David", "Charles"]
-        random.shuffle(names)
+        (rng or random).shuffle(names)
         return names[:3]
 
     def get_event(self, event):
@@ -1,5 +1,6 @@
 import pygame
 from States.base import State
+from GameAssets import get_font
 
 
 class Rules(State):
@@ -15,8 +16,8 @@ class Rules(State):
         """
         super(Rules, self).__init__()
         self.assets = assets
-        self.font = pygame.font.Font(None, 30)
-        self.button_font = pygame.font.Font(None, 40)
+        self.font = get_font(None, 30)
+        self.button_font = get_font(None, 40)
         self.screen_rect = pygame.display.get_surface().get_rect()
         self.text = (
             "Ziel des Spiels: Das Ziel ist es, am Ende des Spiels die wenigsten Punkte zu haben. "
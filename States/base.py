@@ -1,3 +1,9 @@
+import random
+
+from Engine.rules import new_seed
+from GameLog import STATES
+
+
 class State:
     """
     Basisklasse für Spielzustände.
@@ -15,12 +21,28 @@ class State:
         - quit: Gibt an, ob das Spiel beendet werden soll
         - next_state: Der nächste Zustand, der geladen werden soll
         - persist: Ein Dictionary für persistente Daten
+        - scheduler: Der Scheduler des Spiels, wird von Game gesetzt
         """
         self.assets = assets
         self.done = False
         self.quit = False
         self.next_state = None
         self.persist = {}
+        self.scheduler = None
+
+    def schedule(self, delay, callback):
+        """
+        Führt callback nach delay Sekunden aus, ohne die Frame-Schleife anzuhalten.
+        Geplante Aufgaben verfallen, wenn der Zustand verlassen wird.
+
+        Parameter:
+        - delay: Verzögerung in Sekunden
+        - callback: Funktion ohne Argumente
+
+        Rückgabewert:
+        - Die geplante Aufgabe
+        """
+        return self.scheduler.schedule(delay, callback, owner=self)
 
     def get_event(self, event):
         """
@@ -55,6 +77,19 @@ class State:
         """
         pass
 
+    def repaint(self, rect):
+        """
+        Sorgt dafür, dass ein Bereich beim nächsten draw() vollständig neu gezeichnet wird, z.B.
+        nachdem ein Overlay darübergezeichnet wurde.
+
+        Parameter:
+        - rect: Der neu zu zeichnende Bereich
+
+        Zustände, die jeden Frame den ganzen Bildschirm zeichnen, müssen nichts tun; Zustände mit
+        Dirty-Rect-Rendering überschreiben diese Methode.
+        """
+        pass
+
     def startup(self, persistent):
         """
         Initialisiert den Zustand mit persistierenden Daten.
@@ -66,6 +101,33 @@ class State:
         """
         self.persist = persistent
 
+    def get_match_rng(self):
+        """
+        Gibt den Zufallsgenerator des laufenden Matches zurück. Gibt es noch keinen, wird er mit
+        persist['match_seed'] (falls gesetzt) oder einem neuen Seed angelegt. Der verwendete Seed
+        steht in persist['match_metadata'], damit ein Match nachgespielt werden kann.
+
+        Rückgabewert:
+        - Der random.Random des Matches
+        """
+        rng = self.persist.get('match_rng')
+        if rng is None:
+            seed = self.persist.get('match_seed')
+            if seed is None:
+                seed = new_seed()
+            rng = random.Random(seed)
+            self.persist['match_rng'] = rng
+            self.persist['match_metadata'] = {'seed': seed}
+            STATES.info("Match seed = %s", seed)
+        return rng
+
+    def reset_match_rng(self):
+        """
+        Verwirft den Zufallsgenerator des Matches, sodass das nächste Match einen neuen erhält.
+        """
+        self.persist.pop('match_rng', None)
+        self.persist.pop('match_metadata', None)
+
     def cleanup(self):
         """
         Bereinigt Ressourcen und Daten vor einem Zustandswechsel.
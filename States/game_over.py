@@ -1,5 +1,6 @@
 import pygame
 from States.base import State
+from GameAssets import get_font
 
 class GameOver(State):
     def __init__(self, assets=None):
@@ -20,13 +21,13 @@ class GameOver(State):
         """
         super(GameOver, self).__init__()
         self.assets = assets
-        self.font = pygame.font.Font(None, 50)
+        self.font = get_font(None, 50)
         self.round = 1
         self.options = ["New Game", "Quit Game"]  # Optionen für den Benutzer
         self.active_index = 0  # Verfolgt die ausgewählte Option
         self.screen_rect = None
-        self.font_large = pygame.font.Font(None, 100)  # Große Schriftart für "Game Over"
-        self.font_small = pygame.font.Font(None, 50)  # Kleinere Schriftart für Details
+        self.font_large = get_font(None, 100)  # Große Schriftart für "Game Over"
+        self.font_small = get_font(None, 50)  # Kleinere Schriftart für Details
 
     def startup(self, persistent):
         """
@@ -106,11 +107,13 @@ class GameOver(State):
         Aktionen:
         - Leert die Rundenscores
         - Setzt die Gesamt-Scores und die Punktzahlen der aktuellen Runde zurück
+        - Verwirft den Zufallsgenerator des Matches
         - Setzt die Runde auf 1
         """
         self.persist['round_scores'] = []
         self.persist['total_scores'] = [0] * self.player_count
         self.persist['current_round_score'] = [0] * self.player_count
+        self.reset_match_rng()
         self.round = 1
 
     def handle_action(self):
@@ -147,7 +150,7 @@ class GameOver(State):
         screen.blit(background_scaled, (0, 0))
 
         # Zeichne die Überschrift Scoreboard
-        header_text = self.font.render("Scoreboard", True, pygame.Color("white"))
+        header_text = self.assets.render_text(self.font, "Scoreboard", pygame.Color("white"))
         screen.blit(header_text, (self.screen_rect.centerx - header_text.get_width() // 2, 50))
 
         # Definiere die Positionen und Abstände für die Tabelle
@@ -157,41 +160,41 @@ class GameOver(State):
         column_width = 200
 
         # Zeichne die Tabellenüberschrift
-        header_text = self.font.render("Round", True, pygame.Color("white"))
+        header_text = self.assets.render_text(self.font, "Round", pygame.Color("white"))
         screen.blit(header_text, (x_offset, y_offset))
 
         for i in range(self.player_count):
-            player_header_text = self.font.render(self.player_names[i], True, pygame.Color("white"))
+            player_header_text = self.assets.render_text(self.font, self.player_names[i], pygame.Color("white"))
             screen.blit(player_header_text, (x_offset + (i + 1) * column_width, y_offset))
 
         # Zeichne die Rundenscores und Gesamtpunkte
         for j, scores in enumerate(self.round_scores):
-            round_text = self.font.render(f"Round {j + 1}", True, pygame.Color("white"))
+            round_text = self.assets.render_text(self.font, f"Round {j + 1}", pygame.Color("white"))
             screen.blit(round_text, (x_offset, y_offset + (j + 1) * row_height))
 
             for i in range(self.player_count):
-                score_text = self.font.render(str(scores[i]), True, pygame.Color("white"))
+                score_text = self.assets.render_text(self.font, str(scores[i]), pygame.Color("white"))
                 screen.blit(score_text, (x_offset + (i + 1) * column_width, y_offset + (j + 1) * row_height))
 
         # Zeichne die Gesamtsumme in der letzten Zeile
-        total_text = self.font.render("Total", True, pygame.Color("white"))
+        total_text = self.assets.render_text(self.font, "Total", pygame.Color("white"))
         screen.blit(total_text, (x_offset, y_offset + (len(self.round_scores) + 1) * row_height))
 
         for i in range(self.player_count):
-            total_score_text = self.font.render(str(self.total_scores[i]), True, pygame.Color("white"))
+            total_score_text = self.assets.render_text(self.font, str(self.total_scores[i]), pygame.Color("white"))
             screen.blit(total_score_text, (x_offset + (i + 1) * column_width, y_offset + (len(self.round_scores) + 1) * row_height))
 
         # Zeichne den Game Over Text
-        game_over_text = self.font_large.render("Game Over", True, pygame.Color("white"))
+        game_over_text = self.assets.render_text(self.font_large, "Game Over", pygame.Color("white"))
         game_over_rect = game_over_text.get_rect(center=(self.screen_rect.centerx, self.screen_rect.centery + 140))
         screen.blit(game_over_text, game_over_rect)
 
         # Zeichne den Gewinner-Text
         if self.winner is not None and 0 <= self.winner < len(self.player_names):
             winner_name = self.player_names[self.winner]
-            winner_text = self.font_small.render(f"{winner_name} Wins!", True, pygame.Color("green"))
+            winner_text = self.assets.render_text(self.font_small, f"{winner_name} Wins!", pygame.Color("green"))
         else:
-            winner_text = self.font_small.render("No winner found", True, pygame.Color("red"))
+            winner_text = self.assets.render_text(self.font_small, "No winner found", pygame.Color("red"))
 
         # Positioniere den Gewinner-Text unter dem Game Over Text
         winner_rect = winner_text.get_rect(center=(self.screen_rect.centerx, self.screen_rect.centery + 220))
@@ -213,7 +216,7 @@ class GameOver(State):
         - Das gerenderte Text-Image
         """
         color = pygame.Color("red") if index == self.active_index else pygame.Color("white")
-        return self.font.render(self.options[index], True, color)
+        return self.assets.render_text(self.font, self.options[index], color)
 
     def get_text_position(self, text, index):
         """
@@ -1,6 +1,7 @@
 import pygame
 from States.base import State
 from Online.lobby import Lobby
+from GameAssets import get_font
 
 class Gamemode(State):
     def __init__(self, assets=None):
@@ -25,14 +26,14 @@ class Gamemode(State):
         self.options = ["Host", "Join", "Local", "Quit Game"]  # Optionen im Menü
         self.next_state = "PLAYER_SELECT"  # Wird durch handle_action angepasst
         self.active_index = 0
-        self.font = pygame.font.Font(None, 50)
-        self.button_font = pygame.font.Font(None, 40)  # Schriftart für den Button
+        self.font = get_font(None, 50)
+        self.button_font = get_font(None, 40)  # Schriftart für den Button
 
         # Initialisiere screen_rect
         self.screen_rect = pygame.display.get_surface().get_rect()
 
         # Erstellen des "Back"-Buttons
-        self.button_text = self.button_font.render("Main Menu", True, pygame.Color("white"))
+        self.button_text = self.assets.render_text(self.button_font, "Main Menu", pygame.Color("white"))
         self.button_rect = self.button_text.get_rect(topleft=(10, self.screen_rect.height - self.button_text.get_height() - 30))
 
         # Initiale Positionen der Textelemente setzen
@@ -49,7 +50,7 @@ class Gamemode(State):
         - Das gerenderte Text-Image
         """
         color = pygame.Color("red") if index == self.active_index else pygame.Color("white")
-        return self.font.render(self.options[index], True, color)
+        return self.assets.render_text(self.font, self.options[index], color)
 
     def get_text_position(self, text, index):
         """
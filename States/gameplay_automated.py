@@ -1,16 +1,10 @@
-import time
 from States.base import State
 from GameAssets import *
+from GameLog import STATES, enabled
+from Engine.rules import Round, Move, FLIP, DRAW, SWAP, PHASE_INITIAL, PHASE_TURN, PHASE_OVER
+from Engine import bots
+from TableRenderer import TableRenderer
 
-def remove_three_in_a_row(cards):
-    """
-    Setzt das Attribut 'elim' aller angegebenen Karten auf True.
-
-    Input:
-    - cards: Eine Liste von Karten, deren 'elim'-Attribut gesetzt werden soll.
-    """
-    for card in cards:
-        card.elim = True
 
 class Gameplay_Automated(State):
     def __init__(self, assets=None):
@@ -24,23 +18,14 @@ class Gameplay_Automated(State):
         self.assets = assets
         self.player_count = 1
         self.active_player_index = 0
-        self.current_player = 0
-        self.cards_turned = 0
-        self.initial_round = True
+        self.round = None
         self.stack_clicked = False
-        self.deck_clicked = False
-        self.deck_action_taken = False
-        self.font = pygame.font.Font(None, 50)
+        self.message = None
+        self.table = TableRenderer("blue")
+        self.font = get_font(None, 50)
         self.screen = pygame.display.get_surface()
         self.screen_rect = self.screen.get_rect()
         self.card_width, self.card_height, self.card_gap = self.get_card_measurements()
-        self.selected_stack_card = None
-        self.first_to_finish = None
-        self.stack = Stack()
-        self.deck = Deck(assets=self.assets)
-        self.last_turn_active = None
-        self.last_turn_player = None
-        self.turn_counter = 0
         self.player_names = []
 
     def resize(self, width, height):
@@ -54,6 +39,8 @@ class Gameplay_Automated(State):
         self.screen_rect = pygame.Rect(0, 0, width, height)
         self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
         self.card_width, self.card_height, self.card_gap = self.get_card_measurements()
+        self.assets.resize_card_cache(self.card_width, self.card_height)
+        self.table.reset(self.screen)
 
     def get_card_measurements(self):
         """
@@ -77,72 +64,97 @@ class Gameplay_Automated(State):
         - persistent: Ein Dictionary mit persistierten Daten.
         """
         self.persist = persistent
-        self.last_turn_active = False
         self.player_count = self.persist.get('player_count', 1)
-        self.current_player = 0
         self.assets = self.persist.get('assets', GameAssets())
         self.bot_difficulties = self.persist.get('bot_difficulties', ["Medium"] * 4)
         self.player_names = [self.persist.get('player_name', 'Player 1')]
         self.bot_names = self.persist.get('bot_names', [])
-        print(f"Debug: Player names retrieved from persistent: {self.player_names}, Bot names retrieved from persistent: {self.bot_names}")
+        STATES.debug("Player names retrieved from persistent: %s, Bot names retrieved from persistent: %s",
+                     self.player_names, self.bot_names)
         self.GameStart()
 
     def GameStart(self):
         """
         Bereitet alles für den Spielstart vor, einschließlich des Kartendeals und des Decks.
         """
-        self.deck = Deck(assets=self.assets)
-        self.stack = Stack()
-        self.players_hands = self.deck.deal(self.player_count)
-        self.deck.turn_top_card(self.stack)
+        self.round = Round(self.player_count, rng=self.get_match_rng())
+        self.card_width, self.card_height, self.card_gap = self.get_card_measurements()
+        self.assets.resize_card_cache(self.card_width, self.card_height)
+        self.table = TableRenderer("blue")
+        self.table.reset(self.screen)
+        self.stack_clicked = False
+        self.message = None
 
-        for i, hand in enumerate(self.players_hands):
-            print(f"Spieler {i + 1}: {[card.value for card in hand]}")
+        if enabled(STATES):
+            for i, hand in enumerate(self.round.hands):
+                STATES.debug("Spieler %d: %s", i + 1, [card.value for card in hand])
 
-        self.cards_turned = 0
-        self.initial_round = True
+    @property
+    def current_player(self):
+        """Index des Spielers, der am Zug ist."""
+        return self.round.current_player
 
-    def determine_starting_player(self):
+    def apply_move(self, move):
         """
-        Bestimmt den Spieler, der beginnt, basierend auf der höchsten Summe der ersten zwei aufgedeckten Karten.
+        Führt einen Zug des menschlichen Spielers aus, sofern er erlaubt ist.
+
+        Input:
+        - move: Der auszuführende Zug (Move).
         """
-        highest_sum = -1
-        starting_player = 0
+        if move not in self.round.legal_moves():
+            return
+        self.run_round_step(self.round.apply, move)
 
-        for i in range(self.player_count):
-            visible_cards = [card for card in self.players_hands[i] if card.visible]
-            if len(visible_cards) >= 2:
-                card_sum = visible_cards[0].value + visible_cards[1].value
-                if card_sum > highest_sum:
-                    highest_sum = card_sum
-                    starting_player = i
-        self.draw(self.screen)
-        self.current_player = starting_player
+    def run_round_step(self, step, *args):
+        """
+        Führt einen Schritt der Runde aus und reagiert auf Phasenwechsel.
 
-        self.show_starting_player_message(starting_player + 1)
+        Input:
+        - step: Funktion, die die Runde verändert (Zug oder Bot-Zug).
+        - args: Argumente für step.
+        """
+        phase = self.round.phase
+        step(*args)
+
+        if phase == PHASE_INITIAL and self.round.phase == PHASE_TURN:
+            self.determine_starting_player()
+        elif self.round.phase == PHASE_OVER:
+            self.round_over()
+
+    def determine_starting_player(self):
+        """
+        Zeigt den Spieler an, der beginnt. Die Runde bestimmt ihn anhand der höchsten
+        Summe der ersten zwei aufgedeckten Karten.
+        """
+        self.show_starting_player_message(self.round.starting_player + 1)
 
     def show_starting_player_message(self, player_number):
         """
-        Zeigt eine Nachricht an, welcher Spieler beginnt, und wartet 5 Sekunden.
+        Zeigt 5 Sekunden lang an, welcher Spieler beginnt. Die Frame-Schleife läuft weiter,
+        Bots und Klicks pausieren währenddessen.
 
         Input:
         - player_number: Die Nummer des Spielers, der beginnt.
         """
-        message = f"Spieler {player_number} beginnt!"
-        text_surface = self.font.render(message, True, pygame.Color("yellow"))
-        text_rect = text_surface.get_rect(center=self.screen_rect.center)
+        self.message = f"Spieler {player_number} beginnt!"
+        self.schedule(5, self.hide_message)
 
-        background_rect = pygame.Rect(
-            text_rect.left - 10,
-            text_rect.top - 5,
-            text_rect.width + 20,
-            text_rect.height + 10
-        )
+    def hide_message(self):
+        """
+        Blendet die aktuelle Nachricht wieder aus.
+        """
+        self.message = None
 
-        pygame.draw.rect(self.screen, pygame.Color("black"), background_rect)
-        self.screen.blit(text_surface, text_rect)
-        pygame.display.flip()
-        pygame.time.wait(5000)
+    def draw_message(self):
+        """
+        Zeigt die aktuelle Nachricht mittig auf einem schwarzen Hintergrundrechteck an
+        oder blendet sie aus, wenn es keine Nachricht gibt.
+        """
+        if self.message is None:
+            self.table.hide("message")
+            return
+        self.table.set_text("message", self.message, self.font, "yellow", self.screen_rect.center,
+                            layer=2, center=True, background="black")
 
     def get_event(self, event=None):
         """
@@ -151,13 +163,15 @@ class Gameplay_Automated(State):
         Input:
         - event: Das aktuelle Ereignis, das verarbeitet werden soll.
         """
-        if self.initial_round:
+        if self.message is not None:
+            return
+        if self.round.phase == PHASE_INITIAL:
             if self.current_player == 0:
                 if event and event.type == pygame.MOUSEBUTTONDOWN:
                     self.handle_initial_turn(event)
             else:
                 self.automated_initial_turn()
-        else:
+        elif self.round.phase == PHASE_TURN:
             if self.current_player == 0:
                 if event and event.type == pygame.MOUSEBUTTONDOWN:
                     self.gameLogic(event)
@@ -172,25 +186,15 @@ class Gameplay_Automated(State):
         - event: Das aktuelle Ereignis, das verarbeitet werden soll.
         """
         if self.current_player == 0 and event is not None:
-            mouse_pos = event.pos
-            selected_card = self.get_card_at_pos(self.current_player, mouse_pos)
+            selected_card = self.get_card_at_pos(self.current_player, event.pos)
             if selected_card is not None:
-                card = self.players_hands[self.current_player][selected_card]
-                if not card.visible:
-                    self.deck.turn_card(card)
-                    self.cards_turned += 1
-                    if self.cards_turned >= 2:
-                        self.end_turn()
-                        self.cards_turned = 0
-                        if self.current_player == 0:
-                            self.initial_round = False
-                            self.determine_starting_player()
+                self.apply_move(Move(FLIP, selected_card))
         elif self.current_player != 0:
             self.automated_initial_turn()
 
     def gameLogic(self, event):
         """
-        Führt die Spiellogik basierend auf dem Ereignis aus und ruft die entsprechenden Methoden auf.
+        Übersetzt einen Mausklick des menschlichen Spielers in einen Zug der Runde.
 
         Input:
         - event: Das aktuelle Ereignis, das verarbeitet werden soll.
@@ -202,424 +206,53 @@ class Gameplay_Automated(State):
         elif self.is_over_stack(mouse_pos):
             self.handle_stack_click()
         else:
-            if self.selected_stack_card:
-                selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
-                if selected_card_index is not None:
-                    self.swap_with_stack(selected_card_index)
-                    self.selected_stack_card = None
-                    self.stack_clicked = False
-
-                    if self.check_all_cards_visible(self.current_player):
-                        self.start_last_turn()
-                    else:
-                        self.end_turn()
-
-                else:
-                    self.selected_stack_card = None
-                    self.stack_clicked = False
-
-            else:
-                selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
+            selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
+            if self.stack_clicked:
+                self.stack_clicked = False
                 if selected_card_index is not None:
-                    card = self.players_hands[self.current_player][selected_card_index]
-                    if not card.visible:
-                        self.deck.turn_card(card)
-                        self.check_three_in_a_row(self.current_player)
-
-                    if self.check_all_cards_visible(self.current_player):
-                        self.start_last_turn()
-                    else:
-                        self.end_turn()
+                    self.apply_move(Move(SWAP, selected_card_index))
 
-    def start_last_turn(self):
-        """
-        Aktiviert den letzten Zug für alle Spieler, wenn er noch nicht aktiv ist.
-
-        Input:
-        - Keine.
-
-        Output:
-        - Keine.
-        """
-        if not self.last_turn_active:
-            self.last_turn_active = True
-            self.last_turn_player = self.current_player
-            self.turn_counter = 0
-            print(f"Spieler {self.last_turn_player + 1} hat alle Karten umgedreht. Letzte Runde beginnt!")
-
-        # Setze den Zug fort
-        self.end_turn()
+            elif selected_card_index is not None:
+                self.apply_move(Move(FLIP, selected_card_index))
 
     def handle_deck_click(self):
         """
         Behandelt das Ereignis, wenn das Deck angeklickt wird.
         """
-        top_card = self.deck.draw(self.stack)
-        if top_card:
-            top_card.visible = True
-            self.save_top_card_value()
+        self.apply_move(Move(DRAW))
 
     def handle_stack_click(self):
         """
-        Wählt die oberste Karte des Stacks aus oder tauscht Karten, wenn eine Handkarte ausgewählt wird.
+        Wählt die oberste Karte des Stacks aus oder hebt die Auswahl wieder auf.
         """
-        if not self.stack_clicked:
-            self.stack_clicked = True
-            self.selected_stack_card = self.stack.peek()
-        else:
-            mouse_pos = pygame.mouse.get_pos()
-            selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
-            if selected_card_index is not None:
-                player_card = self.players_hands[self.current_player][selected_card_index]
-                self.players_hands[self.current_player][selected_card_index] = self.selected_stack_card
-                self.stack.add_card(player_card)
-                self.selected_stack_card = None
-                self.stack_clicked = False
-                self.deck_action_taken = True
-            else:
-                self.selected_stack_card = None
-                self.stack_clicked = False
-
-    def swap_with_stack(self, selected_card_index):
-        """
-        Tauscht die ausgewählte Karte des Spielers mit der obersten Karte des Stacks.
-
-        Input:
-        - selected_card_index: Der Index der ausgewählten Karte in der Hand des Spielers.
-        """
-        player_card = self.players_hands[self.current_player][selected_card_index]
-        top_stack_card = self.stack.draw()
-        if top_stack_card:
-            top_stack_card.visible = True
-        if player_card:
-            player_card.visible = True
-            self.stack.add_card(player_card)
-        self.players_hands[self.current_player][selected_card_index] = top_stack_card
-        self.check_three_in_a_row(self.current_player)
-
-    def turn_top_card(self):
-        """
-        Zieht die oberste Karte vom Deck und legt sie auf den Stack.
-        """
-        top_card = self.deck.draw(self.stack)
-        if top_card:
-            top_card.visible = True
-            self.save_top_card_value()
-
-    def save_top_card_value(self):
-        """
-        Aktualisiert den gespeicherten Wert der obersten Karte auf dem Stack.
-        """
-        top_card = self.stack.peek()
-        if top_card:
-            self.saved_value = top_card.value
-        else:
-            self.saved_value = None
+        self.stack_clicked = not self.stack_clicked
 
     def automated_initial_turn(self):
         """
         Automatische Aufdeckung von zwei Karten durch einen KI-Spieler in der Anfangsrunde.
         """
-        visible_cards = [card for card in self.players_hands[self.current_player] if card.visible]
-        if len(visible_cards) < 2:
-            hidden_cards = [index for index, card in enumerate(self.players_hands[self.current_player]) if
-                            not card.visible]
-            selected_indices = random.sample(hidden_cards, k=2)
-            for index in selected_indices:
-                card = self.players_hands[self.current_player][index]
-                if not card.visible:
-                    self.deck.turn_card(card)
-                    self.cards_turned += 1
-            self.end_turn()
-            self.cards_turned = 0
-            if self.current_player == 0:
-                self.initial_round = False
-                self.determine_starting_player()
+        self.run_round_step(bots.automated_initial_turn, self.round)
 
     def automated_player_turn_easy(self):
         """
         Einfache Automatisierung für den Zug eines Bots.
         """
         if self.current_player != 0:
-            hand = self.players_hands[self.current_player]
-            hidden_cards = [index for index, card in enumerate(hand) if not card.visible]
-            visible_cards = [card for card in hand if card.visible]
-
-            value_top_card = self.stack.peek().value if self.stack.peek() else None
-
-            if value_top_card is not None:
-                if -2 <= value_top_card <= 4:
-                    self.select_stack = True
-
-                    open_cards = [index for index, card in enumerate(hand) if card.visible and 5 <= card.value <= 12]
-
-                    if open_cards:
-                        selected_card_index = random.choice(open_cards)
-                        self.swap_with_stack(selected_card_index)
-                    else:
-                        if hidden_cards:
-                            selected_card_index = random.choice(hidden_cards)
-                            self.swap_with_stack(selected_card_index)
-
-                elif 5 <= value_top_card <= 12:
-                    self.select_deck = True
-                    self.turn_top_card()
-                    self.deck_action_taken = True
-
-                    value_top_card = self.stack.peek().value if self.stack.peek() else None
-
-                    if value_top_card is not None:
-                        if -2 <= value_top_card <= 4:
-                            self.select_stack = True
-
-                            open_cards = [index for index, card in enumerate(hand) if
-                                          card.visible and 5 <= card.value <= 12]
-
-                            if open_cards:
-                                selected_card_index = random.choice(open_cards)
-                                self.swap_with_stack(selected_card_index)
-                            else:
-                                if hidden_cards:
-                                    selected_card_index = random.choice(hidden_cards)
-                                    self.swap_with_stack(selected_card_index)
-                        elif 5 <= value_top_card <= 12:
-                            if hidden_cards:
-                                card_to_turn_index = random.choice(hidden_cards)
-                                card_to_turn = hand[card_to_turn_index]
-                                self.deck.turn_card(card_to_turn)
-
-            self.check_three_in_a_row(self.current_player)
-
-            if self.check_all_cards_visible(self.current_player):
-                self.start_last_turn()
-            else:
-                self.end_turn()
-            print(f"Automated player {self.current_player} ends turn")
+            self.run_round_step(bots.automated_player_turn_easy, self.round)
 
     def automated_player_turn_medium(self):
         """
         Automatisierung für den Zug eines Bots im Medium-Schwierigkeitsgrad.
-
-        Input:
-        - Keine.
-
-        Output:
-        - Keine.
         """
         if self.current_player != 0:
-            hand = self.players_hands[self.current_player]
-            hidden_cards = [index for index, card in enumerate(hand) if not card.visible]
-            visible_cards = [card for card in hand if card.visible]
-
-            value_top_card = self.stack.peek().value if self.stack.peek() else None
-
-            if value_top_card is not None:
-                if -2 <= value_top_card <= 4:
-                    self.select_stack = True
-
-                    # Überprüft, ob sichtbare Karten im Handbereich einen bestimmten Wertebereich haben
-                    open_cards = [index for index, card in enumerate(hand) if card.visible and 5 <= card.value <= 12]
-
-                    if open_cards:
-                        selected_card_index = random.choice(open_cards)
-                        self.swap_with_stack(selected_card_index)
-                    else:
-                        if hidden_cards:
-                            selected_card_index = random.choice(hidden_cards)
-                            self.swap_with_stack(selected_card_index)
-
-                    column_values = [card.value for card in visible_cards]
-                    # Entfernt Karten aus der Spalte, wenn bereits zwei Karten mit bestimmten negativen Werten vorhanden sind
-                    if column_values.count(-2) >= 2 or column_values.count(-1) >= 2:
-                        self.remove_card_from_column_with_value(column_values, -2, -1)
-
-                elif 5 <= value_top_card <= 12:
-                    self.select_deck = True
-                    self.turn_top_card()
-                    self.deck_action_taken = True
-
-                    value_top_card = self.stack.peek().value if self.stack.peek() else None
-
-                    if value_top_card is not None:
-                        if -2 <= value_top_card <= 4:
-                            self.select_stack = True
-
-                            open_cards = [index for index, card in enumerate(hand) if
-                                          card.visible and 5 <= card.value <= 12]
-
-                            if open_cards:
-                                selected_card_index = random.choice(open_cards)
-                                self.swap_with_stack(selected_card_index)
-                            else:
-                                if hidden_cards:
-                                    selected_card_index = random.choice(hidden_cards)
-                                    self.swap_with_stack(selected_card_index)
-                        elif 5 <= value_top_card <= 12:
-                            open_cards = [card for card in hand if card.visible]
-                            column_values = [card.value for card in open_cards]
-
-                            prev_player = (self.current_player - 1) % self.player_count
-                            prev_open_cards = [card for card in self.players_hands[prev_player] if card.visible]
-                            prev_column_values = [card.value for card in prev_open_cards]
-
-                            # Überprüft, ob der Wert der obersten Karte des Stacks in den offenen Karten vorhanden ist
-                            if any(card.value == value_top_card for card in open_cards):
-                                if not any(v in column_values for v in [-2, -1, -3]):
-                                    if any(card.value == value_top_card for card in prev_open_cards):
-                                        self.select_stack = True
-                                        self.swap_with_stack(self.get_card_index_to_swap(hand, value_top_card))
-                                    else:
-                                        self.open_random_hidden_card()
-                            else:
-                                self.open_random_hidden_card()
-
-                            # Tauscht die Karte mit dem höchsten Wert, wenn der Spieler mindestens 11 Karten aufgedeckt hat
-                            if len(open_cards) >= 11:
-                                self.swap_with_highest_value_card_if_needed()
-
-            self.check_three_in_a_row(self.current_player)
-
-            if self.check_all_cards_visible(self.current_player):
-                self.start_last_turn()
-            else:
-                self.end_turn()
-            print(f"Automated player {self.current_player} ends turn")
+            self.run_round_step(bots.automated_player_turn_medium, self.round)
 
     def automated_player_turn_hard(self):
         """
         Automatisierung für den Zug eines Bots im Hard-Schwierigkeitsgrad mit Priorisierung des Tauschs höherer Karten.
         """
         if self.current_player != 0:
-            hand = self.players_hands[self.current_player]
-            hidden_cards = [index for index, card in enumerate(hand) if not card.visible]
-            visible_cards = [card for card in hand if card.visible]
-
-            print(
-                f"Player {self.current_player} Hand: {[card.value for card in hand]} (Visible: {[card.value for card in visible_cards]})")
-
-            value_top_card = self.stack.peek().value if self.stack.peek() else None
-            print(f"Player {self.current_player} Top Stack Card: {value_top_card}")
-
-            if value_top_card is not None:
-                if -2 <= value_top_card <= 4:
-                    self.select_stack = True
-                    print(f"Player {self.current_player} chooses stack (Card: {value_top_card})")
-
-                    highest_card_index = self.get_highest_visible_card_index(hand)
-                    print(
-                        f"Player {self.current_player} swaps card at index {highest_card_index} with value {hand[highest_card_index].value}")
-                    self.swap_with_stack(highest_card_index)
-
-                elif 5 <= value_top_card <= 12:
-                    self.select_deck = True
-                    print(f"Player {self.current_player} chooses to draw from the deck")
-
-                    self.turn_top_card()
-                    self.deck_action_taken = True
-
-                    value_top_card = self.stack.peek().value if self.stack.peek() else None
-                    print(f"Player {self.current_player} new top card from deck: {value_top_card}")
-
-                    if value_top_card is not None and -2 <= value_top_card <= 4:
-                        self.select_stack = True
-                        highest_card_index = self.get_highest_visible_card_index(hand)
-                        print(
-                            f"Player {self.current_player} swaps card at index {highest_card_index} with value {hand[highest_card_index].value}")
-                        self.swap_with_stack(highest_card_index)
-                    else:
-                        print(f"Player {self.current_player} reveals a hidden card as no match found")
-                        self.open_random_hidden_card()
-
-            self.check_three_in_a_row(self.current_player)
-
-            if self.check_all_cards_visible(self.current_player):
-                print(f"Player {self.current_player} has revealed all cards, ending round")
-                self.start_last_turn()
-            else:
-                print(f"Player {self.current_player} ends turn")
-                self.end_turn()
-
-    def remove_card_from_column_with_value(self, column_values, *values):
-        """
-        Entfernt eine Karte aus einer Spalte, wenn bereits zwei Karten mit den gleichen negativen Werten vorhanden sind.
-
-        Input:
-        - column_values: Liste der Werte aller Karten in der Spalte.
-        - values: Die negativen Werte, die überprüft werden sollen.
-        """
-        for value in values:
-            if column_values.count(value) >= 2:
-                for index, card in enumerate(column_values):
-                    if card == value:
-                        column_values.pop(index)
-                        break
-
-    def get_card_index_to_swap(self, hand, value_top_card):
-        """
-        Findet den besten Kartenindex in der Hand, um ihn mit der obersten Karte des Stapels zu tauschen.
-
-        Input:
-        - hand: Die Liste der Karten in der Hand des Spielers.
-        - value_top_card: Der Wert der obersten Karte des Stapels.
-
-        Output:
-        - Der Index der besten Karte zum Tauschen.
-        """
-        visible_cards = [index for index, card in enumerate(hand) if card.visible]
-        if visible_cards:
-            # Wähle die Karte mit dem größten Unterschied zur Stapelkarte, um hohe Punktwerte zu minimieren
-            best_card_index = min(visible_cards, key=lambda i: abs(hand[i].value - value_top_card))
-            return best_card_index
-        else:
-            # Wenn keine Karten aufgedeckt sind, zufällig eine verdeckte Karte wählen
-            return random.choice(range(len(hand)))
-
-    def open_random_hidden_card(self):
-        """
-        Deckt eine zufällige versteckte Karte in der Hand auf.
-        """
-        hand = self.players_hands[self.current_player]
-        hidden_cards = [index for index, card in enumerate(hand) if not card.visible]
-        if hidden_cards:
-            selected_card_index = random.choice(hidden_cards)
-            hand[selected_card_index].visible = True
-            print(
-                f"Automated player {self.current_player} reveals card at index {selected_card_index} with value {hand[selected_card_index].value}")
-
-    def swap_with_highest_value_card_if_needed(self):
-        """
-        Tauscht die Karte mit dem höchsten Wert, wenn der Spieler in einer kritischen Phase ist (z.B. 11 Karten aufgedeckt).
-        """
-        hand = self.players_hands[self.current_player]
-        visible_cards = [card for card in hand if card.visible]
-
-        # Wenn alle Karten aufgedeckt sind, finde die Karte mit dem höchsten Wert
-        if len(visible_cards) >= 11:
-            highest_value_card = max(visible_cards, key=lambda card: card.value)
-            highest_value_index = hand.index(highest_value_card)
-
-            # Tausche die höchste Karte mit der Stapelkarte
-            self.swap_with_stack(highest_value_index)
-            print(
-                f"Automated player {self.current_player} swaps card at index {highest_value_index} with value {highest_value_card.value}")
-
-    def select_best_card_for_swap(self, hand, value_top_card):
-        """
-        Wählt die beste Karte zum Tauschen basierend auf dem Wert der obersten Karte vom Stapel.
-
-        Parameter:
-        - hand: Liste von Karten, die die Hand des Spielers repräsentiert
-        - value_top_card: Wert der obersten Karte des Stapels
-
-        Rückgabewert:
-        - Index der besten Karte zum Tauschen
-        """
-        visible_cards = [index for index, card in enumerate(hand) if card.visible]
-        if visible_cards:
-            best_card_index = min(visible_cards, key=lambda i: abs(hand[i].value - value_top_card))
-            return best_card_index
-        else:
-            return random.choice(range(len(hand)))
+            self.run_round_step(bots.automated_player_turn_hard, self.round)
 
     def player_has_lowest_score(self, player_index):
         """
@@ -632,26 +265,10 @@ class Gameplay_Automated(State):
         - Wahrheitswert: True, wenn der Spieler den niedrigsten Punktestand hat, sonst False
         """
         current_player_score = self.Calculate_player_score(player_index)
-        other_players_scores = [self.Calculate_player_score(hand) for i, hand in enumerate(self.players_hands) if
+        other_players_scores = [self.Calculate_player_score(i) for i in range(self.player_count) if
                                 i != player_index]
         return current_player_score <= min(other_players_scores)
 
-    def get_highest_visible_card_index(self, hand):
-        """
-        Ermittelt den Index der höchsten sichtbaren Karte in der Hand des Spielers.
-
-        Parameter:
-        - hand: Liste von Karten, die die Hand des Spielers repräsentiert
-
-        Rückgabewert:
-        - Index der höchsten sichtbaren Karte
-        """
-        visible_cards = [card for card in hand if card.visible]
-        highest_value = max(visible_cards, key=lambda card: card.value).value
-        for index, card in enumerate(hand):
-            if card.value == highest_value and card.visible:
-                return index
-
     def automated_player_turn(self):
         """
         Ruft die entsprechende Funktion für den aktuellen Schwierigkeitsgrad des Bots auf.
@@ -739,119 +356,63 @@ class Gameplay_Automated(State):
         stack_rect = pygame.Rect(x, y, card_width, card_height)
         return stack_rect.collidepoint(pos)
 
-    def end_turn(self):
-        """
-        Wechselt zum nächsten Spieler und überprüft, ob die Runde endet.
-
-        Wenn der letzte Zug abgeschlossen ist und alle Spieler einmal dran waren, endet die Runde.
-        Ansonsten wird der nächste Spieler aktiviert und der Zugstatus zurückgesetzt.
-        """
-        if self.last_turn_active:
-            self.turn_counter += 1
-            print(f"Spieler {self.current_player + 1} hat seinen letzten Zug gemacht.")
-
-            if self.turn_counter >= self.player_count:
-                print("Letzter Zug abgeschlossen. Runde endet.")
-                self.round_over()
-                return
-
-        self.current_player = (self.current_player + 1) % self.player_count
-        self.stack_clicked = False
-        self.deck_clicked = False
-        self.deck_action_taken = False
-
-    def check_all_cards_visible(self, player_index):
-        """
-        Überprüft, ob alle Karten des aktuellen Spielers aufgedeckt sind.
-
-        Parameter:
-        - player_index: Index des Spielers
-
-        Rückgabewert:
-        - Wahrheitswert: True, wenn alle Karten aufgedeckt sind, sonst False
-        """
-        all_visible = all(card.visible for card in self.players_hands[player_index])
-
-        if all_visible and self.first_to_finish is None:
-            self.first_to_finish = player_index + 1
-            self.persist['first_to_finish'] = self.first_to_finish
-
-        return all_visible
-
-    def check_three_in_a_row(self, player_index):
-        """
-        Überprüft, ob der angegebene Spieler drei gleiche Karten in einer vertikalen Reihe hat,
-        die alle sichtbar sind.
-
-        Parameter:
-        - player_index: Index des Spielers
-        """
-        hand = self.players_hands[player_index]
-        rows = 3
-        cols = 4
-
-        for col in range(cols):
-            for row in range(rows - 2):
-                index1 = row * cols + col
-                index2 = (row + 1) * cols + col
-                index3 = (row + 2) * cols + col
-
-                if (0 <= index1 < len(hand) and
-                        0 <= index2 < len(hand) and
-                        0 <= index3 < len(hand)):
-
-                    card1 = hand[index1]
-                    card2 = hand[index2]
-                    card3 = hand[index3]
-
-                    if card1.value == card2.value == card3.value and -2 <= card1.value and card1.visible and card2.visible and card3.visible:
-                        remove_three_in_a_row([card1, card2, card3])
-
     def draw(self, surface):
         """
-        Zeichnet das Spielfeld, den Stapel, das Deck und die Karten der Spieler auf den Bildschirm.
+        Aktualisiert die Sprites für Spielfeld, Stapel, Deck und Karten der Spieler und zeichnet
+        nur die geänderten Bereiche neu.
 
         Parameter:
         - surface: Pygame-Oberfläche, auf der gezeichnet wird
-        """
-        surface.fill(pygame.Color("blue"))
 
+        Rückgabewert:
+        - Liste der geänderten Rechtecke für pygame.display.update
+        """
         for i in range(self.player_count):
             self.draw_player_hand(i)
 
         self.draw_deck()
         self.draw_stack()
         self.draw_player_score()
-        pygame.display.flip()
+        self.draw_message()
+        return self.table.draw(surface)
+
+    def repaint(self, rect):
+        """
+        Zeichnet einen Bereich des Tisches beim nächsten draw() neu, z.B. nach dem Ausblenden eines Overlays.
+
+        Input:
+        - rect: Der neu zu zeichnende Bereich.
+        """
+        self.table.repaint(rect)
 
     def draw_deck(self):
         """
-        Zeichnet das Deck auf den Bildschirm.
+        Aktualisiert das Sprite des Decks.
         """
         card_width, card_height, card_gap = self.get_card_measurements()
         x = self.screen.get_width() / 2 - (card_width + card_gap / 2)
         y = self.screen.get_height() / 2 - card_height / 2
 
-        card_surface = pygame.transform.scale(self.assets.CardBack, (int(card_width), int(card_height)))
-        self.screen.blit(card_surface, (x, y))
+        card_surface = self.assets.get_scaled_card(None, False, card_width, card_height)
+        self.table.set_image("deck", card_surface, (x, y))
 
     def draw_stack(self):
         """
-        Zeichnet den Stapel auf den Bildschirm.
+        Aktualisiert das Sprite der obersten Stapelkarte.
         """
         card_width, card_height, card_gap = self.get_card_measurements()
         x = self.screen.get_width() / 2 + card_gap / 2
         y = self.screen.get_height() / 2 - card_height / 2
 
-        if self.stack.cards:
-            card = self.stack.cards[-1]
-            card_image = card.get_image()
-            card_surface = pygame.transform.scale(card_image, (int(card_width), int(card_height)))
-            self.screen.blit(card_surface, (x, y))
+        if self.round.stack_top is not None:
+            card_surface = self.assets.get_scaled_card(self.round.stack_top, True, card_width, card_height)
+            self.table.set_image("stack", card_surface, (x, y))
+        else:
+            self.table.hide("stack")
 
     def draw_player_hand(self, player_index):
         """
-        Zeichnet die Kartenhand des Spielers auf den Bildschirm.
+        Aktualisiert die Sprites der Kartenhand des Spielers.
 
         Parameter:
         - player_index: Index des Spielers
@@ -881,26 +442,21 @@ class Gameplay_Automated(State):
         for row in range(rows):
             for col in range(cols):
                 index = row * cols + col
-                card = self.players_hands[player_index][index]
+                card = self.round.hands[player_index][index]
 
                 if card.elim:
+                    self.table.hide(("hand", player_index, index))
                     continue
 
                 if player_index == 0 or player_index == 1 or player_index == 2 or player_index == 3:
                     x = start_x + col * (card_width + card_gap)
                     y = start_y + row * (card_height + card_gap)
 
-                card_image = card.get_image()
-
-                scale = 1.1 if card.highlighted else 1.0
-                card_width_scaled = int(card_width * scale)
-                card_height_scaled = int(card_height * scale)
-
-                card_surface = pygame.transform.scale(card_image, (card_width_scaled, card_height_scaled))
-                if rotation_angle != 0:
-                    card_surface = pygame.transform.rotate(card_surface, rotation_angle)
+                # Skalierte (und ggf. gedrehte) Karte aus dem Cache, hervorgehobene Karten sind größer
+                card_surface = self.assets.get_scaled_card(card.value, card.visible, card_width, card_height,
+                                                           card.highlighted, rotation_angle)
 
-                self.screen.blit(card_surface, (x, y))
+                self.table.set_image(("hand", player_index, index), card_surface, (x, y))
 
     def Calculate_player_score(self, player_index):
         """
@@ -912,15 +468,12 @@ class Gameplay_Automated(State):
         Rückgabewert:
         - Punktzahl des Spielers
         """
-        player_score = 0
-        for card in self.players_hands[player_index]:
-            if card.visible and not card.elim:
-                player_score += card.value
-        return player_score
+        return self.round.hands[player_index].score()
 
     def draw_player_score(self):
         """
         Zeigt dauerhaft die Punktzahl aller Spieler rechts neben der Spielerhand an.
+        Texte werden nur neu gerendert, wenn sich Name oder Punktzahl ändern.
         """
         for i in range(self.player_count):
 
@@ -930,56 +483,40 @@ class Gameplay_Automated(State):
             else:
                 player_name = self.bot_names[i - 1] if i - 1 < len(self.bot_names) else f"Bot {i}"
 
-            score_text = self.font.render(f"Score: {player_score}", True, pygame.Color("white"))
-            name_text = self.font.render(player_name, True, pygame.Color("yellow"))
-
             if i == 0:  # Spieler unten
                 x = self.screen.get_width() / 2 + 2 * (self.card_width + self.card_gap)
                 y = self.screen.get_height() - 2 * (self.card_height + self.card_gap)
-                rotated_score_text = score_text
-                rotated_name_text = name_text
             elif i == 1:  # Spieler links
                 x = self.card_width * 1 + 5 * self.card_gap
                 y = self.screen.get_height() / 2 - 3 * (self.card_width + self.card_gap) + self.card_gap
-                rotated_score_text = score_text
-                rotated_name_text = name_text
             elif i == 2:  # Spieler oben
                 x = self.screen.get_width() / 2 + 2 * (self.card_width + self.card_gap)
                 y = 2 * self.card_height
-                rotated_score_text = score_text
-                rotated_name_text = name_text
             elif i == 3:  # Spieler rechts
                 x = self.screen.get_width() - 3 * (self.card_height + self.card_gap)
                 y = self.screen.get_height() / 2 - 3 * (self.card_width + self.card_gap) + self.card_gap
-                rotated_score_text = score_text
-                rotated_name_text = name_text
 
-            self.screen.blit(rotated_name_text, (x, y - 30))
-            self.screen.blit(rotated_score_text, (x, y))
+            self.table.set_text(("name", i), player_name, self.font, "yellow", (x, y - 30))
+            self.table.set_text(("score", i), f"Score: {player_score}", self.font, "white", (x, y))
 
     def round_over(self):
         """
-        Wechselt den Spielzustand zu 'Round Summary' und berechnet die Punkte.
+        Wechselt den Spielzustand zu 'Round Summary' und übernimmt die Punkte.
 
         Ablauf:
-        1. Alle noch nicht aufgedeckten Karten aller Spieler aufdecken
-        2. Bildschirm aktualisieren und 5 Sekunden pausieren
-        3. Punkte berechnen und Zustand auf 'A_SCOREBOARD' setzen
+        1. Die Runde hat alle noch nicht aufgedeckten Karten bereits aufgedeckt
+        2. Punkte übernehmen
+        3. Die aufgedeckten Karten 5 Sekunden lang zeigen, dann Zustand auf 'A_SCOREBOARD' setzen
         """
-        for i in range(self.player_count):
-            for card in self.players_hands[i]:
-                if not card.visible:
-                    self.deck.turn_card(card)
-
-        self.draw(self.screen)
-        time.sleep(5)
-
-        current_round_score = []
-        for i in range(self.player_count):
-            score = self.Calculate_player_score(i)
-            current_round_score.append(score)
-
-        self.persist['current_round_score'] = current_round_score
+        first_to_finish = self.round.first_to_finish
+        self.persist['current_round_score'] = self.round.scores()
+        self.persist['first_to_finish'] = first_to_finish + 1 if first_to_finish is not None else None
         self.persist['player_names'] = self.player_names
+        self.schedule(5, self.show_scoreboard)
+
+    def show_scoreboard(self):
+        """
+        Wechselt zum Scoreboard.
+        """
         self.next_state = "A_SCOREBOARD"
         self.done = True
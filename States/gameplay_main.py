@@ -1,18 +1,8 @@
 from States.base import State
 from GameAssets import *
-import time
-
-
-def remove_three_in_a_row(cards):
-    """
-    Setzt das 'elim'-Attribut für alle Karten in der Liste auf True.
-
-    Input:
-    - cards: Eine Liste von Kartenobjekten, deren 'elim'-Attribut gesetzt werden soll.
-
-    """
-    for card in cards:
-        card.elim = True
+from GameLog import STATES, enabled
+from Engine.rules import Round, Move, FLIP, DRAW, SWAP, PHASE_INITIAL, PHASE_TURN, PHASE_OVER
+from TableRenderer import TableRenderer
 
 
 class Gameplay(State):
@@ -27,21 +17,14 @@ class Gameplay(State):
         super(Gameplay, self).__init__()
         self.assets = assets
         self.player_count = 1
-        self.current_player = 0
-        self.cards_turned = 0
-        self.initial_round = True
+        self.round = None
         self.stack_clicked = False
-        self.deck_clicked = False
-        self.deck_action_taken = False
-        self.font = pygame.font.Font(None, 50)
+        self.message = None  # Nachricht, die über dem Spielfeld angezeigt wird
+        self.table = TableRenderer("blue")  # Sprites des Spieltisches, gezeichnet werden nur Änderungen
+        self.font = get_font(None, 50)
         self.screen = pygame.display.get_surface()
         self.screen_rect = self.screen.get_rect()
         self.card_width, self.card_height, self.card_gap = self.get_card_measurements()
-        self.selected_stack_card = None
-        self.first_to_finish = None
-        self.last_turn_active = None
-        self.last_turn_player = None
-        self.turn_counter = 0
         self.player_names = []  # Liste der Spielernamen
 
     def resize(self, width, height):
@@ -58,6 +41,8 @@ class Gameplay(State):
 
         # Aktualisiere die Kartenmaße basierend auf der neuen Fenstergröße
         self.card_width, self.card_height, self.card_gap = self.get_card_measurements()
+        self.assets.resize_card_cache(self.card_width, self.card_height)  # Karten für die neue Größe skalieren
+        self.table.reset(self.screen)  # Tisch beim nächsten Zeichnen komplett neu aufbauen
 
     def get_card_measurements(self):
         """
@@ -82,12 +67,10 @@ class Gameplay(State):
 
         """
         self.persist = persistent
-        self.last_turn_active = False
         self.player_count = self.persist.get('player_count', 1)
-        self.current_player = 0
         self.assets = self.persist.get('assets', GameAssets())
         self.player_names = self.persist.get('player_names', [])  # Setzt die Spielernamen
-        print(f"Debug: Player names retrieved from persistent: {self.player_names}")
+        STATES.debug("Player names retrieved from persistent: %s", self.player_names)
         self.GameStart()
 
     def GameStart(self):
@@ -95,67 +78,80 @@ class Gameplay(State):
         Bereitet alle erforderlichen Elemente für den Spielstart vor.
 
         """
-        # Initialisiere Deck und Stapel
-        self.deck = Deck(assets=self.assets)
-        self.stack = Stack()
-        self.players_hands = self.deck.deal(self.player_count)
-        self.deck.turn_top_card(self.stack)
+        # Neue Runde: Deck mischen, austeilen und erste Karte auf den Stack legen
+        self.round = Round(self.player_count, rng=self.get_match_rng())
+        self.card_width, self.card_height, self.card_gap = self.get_card_measurements()
+        self.assets.resize_card_cache(self.card_width, self.card_height)
+        self.table = TableRenderer("blue")
+        self.table.reset(self.screen)
+        self.stack_clicked = False
+        self.message = None
+
+        # Debug-Ausgabe der verteilten Karten; die Listen werden nur gebaut, wenn sie ausgegeben werden
+        if enabled(STATES):
+            for i, hand in enumerate(self.round.hands):
+                STATES.debug("Spieler %d: %s", i + 1, [card.value for card in hand])
+
+    @property
+    def current_player(self):
+        """Index des Spielers, der am Zug ist."""
+        return self.round.current_player
+
+    def apply_move(self, move):
+        """
+        Führt einen Zug in der Runde aus und reagiert auf Phasenwechsel.
+
+        Input:
+        - move: Der auszuführende Zug (Move).
+        """
+        if move not in self.round.legal_moves():
+            return
 
-        # Debug-Ausgabe der verteilten Karten
-        for i, hand in enumerate(self.players_hands):
-            print(f"Spieler {i + 1}: {[card.value for card in hand]}")
+        phase = self.round.phase
+        self.round.apply(move)
 
-        self.cards_turned = 0
-        self.initial_round = True
+        if phase == PHASE_INITIAL and self.round.phase == PHASE_TURN:
+            self.determine_starting_player()  # Bestimme den Startspieler
+        elif self.round.phase == PHASE_OVER:
+            self.round_over()  # Beende die Runde
 
     def determine_starting_player(self):
         """
-        Bestimmt den Startspieler basierend auf der höchsten Summe der ersten zwei aufgedeckten Karten.
+        Zeigt den Startspieler an, den die Runde anhand der höchsten Summe der ersten zwei
+        aufgedeckten Karten bestimmt hat.
 
         Output:
-        - Keine. Setzt self.current_player auf den Index des Startspielers.
+        - Keine.
         """
-        highest_sum = -1
-        starting_player = 0
-
-        # Durchlaufe alle Spieler und berechne die Summe der ersten zwei aufgedeckten Karten
-        for i in range(self.player_count):
-            visible_cards = [card for card in self.players_hands[i] if card.visible]
-            if len(visible_cards) >= 2:
-                card_sum = visible_cards[0].value + visible_cards[1].value
-                if card_sum > highest_sum:
-                    highest_sum = card_sum
-                    starting_player = i
-
-        # Aktualisiere den aktuellen Spieler und zeige eine Nachricht an
-        self.draw(self.screen)
-        self.current_player = starting_player
-        self.show_starting_player_message(starting_player + 1)
+        self.show_starting_player_message(self.round.starting_player + 1)
 
     def show_starting_player_message(self, player_number):
         """
-        Zeigt eine Nachricht an, welcher Spieler beginnt, und wartet 5 Sekunden.
+        Zeigt 5 Sekunden lang an, welcher Spieler beginnt. Die Frame-Schleife läuft weiter,
+        Klicks werden währenddessen ignoriert.
 
         Input:
         - player_number: Die Nummer des Startspielers.
         """
-        message = f"Spieler {player_number} beginnt!"
-        text_surface = self.font.render(message, True, pygame.Color("yellow"))
-        text_rect = text_surface.get_rect(center=self.screen_rect.center)
+        self.message = f"Spieler {player_number} beginnt!"
+        self.schedule(5, self.hide_message)
 
-        # Erstelle und zeichne ein Hintergrundrechteck hinter dem Text
-        background_rect = pygame.Rect(
-            text_rect.left - 10,
-            text_rect.top - 5,
-            text_rect.width + 20,
-            text_rect.height + 10
-        )
-        pygame.draw.rect(self.screen, pygame.Color("black"), background_rect)
-        self.screen.blit(text_surface, text_rect)
-        pygame.display.flip()
+    def hide_message(self):
+        """
+        Blendet die aktuelle Nachricht wieder aus.
+        """
+        self.message = None
 
-        # Warte 5 Sekunden, bevor der Bildschirm aktualisiert wird
-        pygame.time.wait(5000)
+    def draw_message(self):
+        """
+        Zeigt die aktuelle Nachricht mittig auf einem schwarzen Hintergrundrechteck über dem Tisch an
+        oder blendet sie aus, wenn es keine Nachricht gibt.
+        """
+        if self.message is None:
+            self.table.hide("message")
+            return
+        self.table.set_text("message", self.message, self.font, "yellow", self.screen_rect.center,
+                            layer=2, center=True, background="black")
 
     def get_event(self, event):
         """
@@ -164,15 +160,17 @@ class Gameplay(State):
         Input:
         - event: Das Pygame-Ereignis, das verarbeitet werden soll.
         """
+        if self.message is not None:
+            return
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.initial_round:
+            if self.round.phase == PHASE_INITIAL:
                 self.handle_initial_turn(event)
-            else:
+            elif self.round.phase == PHASE_TURN:
                 self.gameLogic(event)
 
     def gameLogic(self, event):
         """
-        Verarbeitet die Spiellogik basierend auf einem Mausklick-Ereignis.
+        Übersetzt einen Mausklick in einen Zug der Runde.
 
         Input:
         - event: Ein Pygame-Ereignis, das Informationen über die Mausposition enthält.
@@ -184,42 +182,17 @@ class Gameplay(State):
         elif self.is_over_stack(mouse_pos):
             self.handle_stack_click()
         else:
-            if self.selected_stack_card:
-                # Prüfe, ob eine Karte an der Position des Mausklicks ausgewählt wurde
-                selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
+            # Prüfe, ob eine Karte an der Position des Mausklicks ausgewählt wurde
+            selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
 
+            if self.stack_clicked:
+                # Rücksetzen des Stack-Klick-Status, getauscht wird nur bei einem Treffer
+                self.stack_clicked = False
                 if selected_card_index is not None:
-                    self.swap_with_stack(selected_card_index)
-
-                    # Rücksetzen der ausgewählten Stack-Karte und Stack-Klick-Status
-                    self.selected_stack_card = None
-                    self.stack_clicked = False
-
-                    # Überprüfe den Status des Spiels nach dem Zug
-                    if self.check_all_cards_visible(self.current_player):
-                        self.start_last_turn()  # Letzten Zug starten, wenn alle Karten sichtbar sind
-                    else:
-                        self.end_turn()
-
-                else:
-                    # Rücksetzen der ausgewählten Stack-Karte und Stack-Klick-Status
-                    self.selected_stack_card = None
-                    self.stack_clicked = False
-
-            else:
-                # Prüfe, ob eine Karte an der Position des Mausklicks ausgewählt wurde
-                selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
-                if selected_card_index is not None:
-                    card = self.players_hands[self.current_player][selected_card_index]
-                    if not card.visible:
-                        self.deck.turn_card(card)
-                        self.check_three_in_a_row(self.current_player)
+                    self.apply_move(Move(SWAP, selected_card_index))
 
-                    # Überprüfe den Status des Spiels nach dem Zug
-                    if self.check_all_cards_visible(self.current_player):
-                        self.start_last_turn()  # Letzten Zug starten, wenn alle Karten sichtbar sind
-                    else:
-                        self.end_turn()
+            elif selected_card_index is not None:
+                self.apply_move(Move(FLIP, selected_card_index))
 
     def handle_initial_turn(self, event):
         """
@@ -228,89 +201,22 @@ class Gameplay(State):
         Input:
         - event: Ein Pygame-Ereignis, das Informationen über die Mausposition enthält.
         """
-        mouse_pos = event.pos
-        selected_card = self.get_card_at_pos(self.current_player, mouse_pos)
+        selected_card = self.get_card_at_pos(self.current_player, event.pos)
         if selected_card is not None:
-            card = self.players_hands[self.current_player][selected_card]
-            if not card.visible:
-                self.deck.turn_card(card)
-                self.cards_turned += 1
-                if self.cards_turned >= 2:  # Zwei Karten aufgedeckt
-                    self.end_turn()
-                    self.cards_turned = 0  # Zähler zurücksetzen
-                    if self.current_player == 0:  # Nach der letzten Runde des letzten Spielers
-                        self.initial_round = False  # Reguläre Spielrunde starten
-                        self.determine_starting_player()  # Bestimme den Startspieler
+            self.apply_move(Move(FLIP, selected_card))
 
     def handle_deck_click(self):
         """
-        Legt die oberste Karte des Decks auf den Stack und markiert die Deck-Aktion als durchgeführt.
+        Legt die oberste Karte des Decks offen auf den Stack, sofern in diesem Zug noch nicht gezogen wurde.
         """
-        if not self.deck_action_taken:
-            top_card = self.deck.draw(self.stack)  # Ziehe die oberste Karte vom Deck
-            if top_card:
-                top_card.visible = True  # Setze die Karte sichtbar
-                self.stack.add_card(top_card)  # Lege sie auf den Stack
-            self.deck_action_taken = True  # Markiere die Deck-Aktion als abgeschlossen
+        self.apply_move(Move(DRAW))
 
     def handle_stack_click(self):
         """
-        Wählt die oberste Karte des Stacks aus oder tauscht Karten, wenn eine Handkarte ausgewählt wird.
-
-        Input:
-        - Keine.
-
-        Output:
-        - Keine.
+        Wählt die oberste Karte des Stacks aus oder hebt die Auswahl wieder auf.
+        Getauscht wird beim anschließenden Klick auf eine Handkarte.
         """
-        if not self.stack_clicked:
-            # Erster Klick auf den Stack
-            self.stack_clicked = True
-            self.selected_stack_card = self.stack.peek()  # Wählt die oberste Karte des Stacks aus
-        else:
-            # Zweiter Klick auf den Stack
-            mouse_pos = pygame.mouse.get_pos()
-            selected_card_index = self.get_card_at_pos(self.current_player, mouse_pos)
-            if selected_card_index is not None:
-                player_card = self.players_hands[self.current_player][selected_card_index]
-
-                # Tauscht die Handkarte mit der ausgewählten Stack-Karte
-                self.players_hands[self.current_player][selected_card_index] = self.selected_stack_card
-                self.stack.add_card(player_card)  # Lege die Handkarte auf den Stack
-
-                # Rücksetzen der ausgewählten Stack-Karte und Stack-Klick-Status
-                self.selected_stack_card = None
-                self.stack_clicked = False
-                self.deck_action_taken = True  # Markiert, dass eine Deck-Aktion stattgefunden hat
-            else:
-                # Kein Klick auf eine Handkarte, daher wird die Auswahl aufgehoben
-                self.selected_stack_card = None
-                self.stack_clicked = False
-
-    def swap_with_stack(self, selected_card_index):
-        """
-        Tauscht die ausgewählte Karte des Spielers mit der obersten Karte des Stacks.
-
-        Input:
-        - selected_card_index: Der Index der Karte in der Hand des Spielers, die getauscht werden soll.
-        """
-        player_card = self.players_hands[self.current_player][selected_card_index]
-        top_stack_card = self.stack.draw()  # Entfernt die oberste Karte vom Stack
-
-        # Setze die Sichtbarkeit der Stack-Karte auf True
-        if top_stack_card:
-            top_stack_card.visible = True
-
-        # Lege die Spielerkarte auf den Stack
-        if player_card:
-            player_card.visible = True
-            self.stack.add_card(player_card)
-
-        # Ersetze die Spielerkarte durch die Stack-Karte
-        self.players_hands[self.current_player][selected_card_index] = top_stack_card
-
-        # Überprüfe, ob der aktuelle Spieler drei gleiche Karten in einer Reihe hat
-        self.check_three_in_a_row(self.current_player)
+        self.stack_clicked = not self.stack_clicked
 
     def get_card_at_pos(self, player_index, pos):
         """
@@ -389,104 +295,64 @@ class Gameplay(State):
         stack_rect = pygame.Rect(x, y, card_width, card_height)
         return stack_rect.collidepoint(pos)
 
-    def start_last_turn(self):
-        """
-        Aktiviert den letzten Zug für alle Spieler und setzt die nötigen Statusvariablen.
-        """
-        if not self.last_turn_active:
-            self.last_turn_active = True
-            self.last_turn_player = self.current_player  # Speichere den Spieler, der als erstes fertig war
-            self.turn_counter = 0  # Zähler für die Anzahl der Spieler, die ihren letzten Zug gemacht haben
-            print(f"Spieler {self.last_turn_player + 1} hat alle Karten umgedreht. Letzte Runde beginnt!")
-
-        self.end_turn()  # Beendet den aktuellen Zug und wechselt zum nächsten Spieler
-
-    def end_turn(self):
-        """
-        Wechselt zum nächsten Spieler und überprüft, ob die Runde endet.
-        """
-        if self.last_turn_active:
-            self.turn_counter += 1
-            print(f"Spieler {self.current_player + 1} hat seinen letzten Zug gemacht.")
-
-            # Überprüfe, ob alle Spieler ihren letzten Zug gemacht haben
-            if self.turn_counter >= self.player_count:
-                print("Letzter Zug abgeschlossen. Runde endet.")
-                self.round_over()  # Beende die Runde
-                return
-
-        # Wechsle zum nächsten Spieler
-        self.current_player = (self.current_player + 1) % self.player_count
-        self.stack_clicked = False
-        self.deck_clicked = False
-        self.deck_action_taken = False  # Zurücksetzen der Status für den nächsten Zug
-
-    def check_all_cards_visible(self, player_index):
+    def draw(self, surface):
         """
-        Überprüft, ob alle Karten des angegebenen Spielers aufgedeckt sind.
+        Aktualisiert die Sprites für Spielfeld, Stapel, Deck und Karten der Spieler und zeichnet
+        nur die geänderten Bereiche neu.
 
         Input:
-        - player_index: Der Index des Spielers, dessen Karten überprüft werden sollen.
+        - surface: Die Oberfläche, auf der gezeichnet werden soll.
 
         Output:
-        - True, wenn alle Karten sichtbar sind.
-        - False, wenn nicht alle Karten sichtbar sind.
+        - Liste der geänderten Rechtecke, die Main.run mit pygame.display.update anzeigt.
         """
-        all_visible = all(card.visible for card in self.players_hands[player_index])
-
-        if all_visible and self.first_to_finish is None:
-            # Speichere den ersten Spieler, der alle Karten umgedreht hat
-            self.first_to_finish = player_index + 1  # +1, um den Spieler 1-basiert anzugeben
-            self.persist['first_to_finish'] = self.first_to_finish  # Speichere dies in self.persist
+        # Aktualisiere die Kartenhand jedes Spielers
+        for i in range(self.player_count):
+            self.draw_player_hand(i)
 
-        return all_visible
+        self.draw_deck()  # Aktualisiere das Deck
+        self.draw_stack()  # Aktualisiere den Stapel
+        self.draw_player_score()  # Aktualisiere die Punktzahl der Spieler
+        self.draw_message()  # Nachricht über dem Spielfeld ein- oder ausblenden
+        return self.table.draw(surface)
 
-    def draw(self, surface):
+    def repaint(self, rect):
         """
-        Zeichnet das gesamte Spielfeld, den Stapel, das Deck und die Karten der Spieler.
+        Zeichnet einen Bereich des Tisches beim nächsten draw() neu, z.B. nach dem Ausblenden eines Overlays.
 
         Input:
-        - surface: Die Oberfläche, auf der gezeichnet werden soll.
+        - rect: Der neu zu zeichnende Bereich.
         """
-        surface.fill(pygame.Color("blue"))  # Setzt den Hintergrund auf Blau
-
-        # Zeichne die Kartenhand jedes Spielers
-        for i in range(self.player_count):
-            self.draw_player_hand(i)
-
-        self.draw_deck()  # Zeichne das Deck
-        self.draw_stack()  # Zeichne den Stapel
-        self.draw_player_score()  # Zeichne die Punktzahl der Spieler
-        pygame.display.flip()  # Aktualisiere die Anzeige
+        self.table.repaint(rect)
 
     def draw_stack(self):
         """
-        Zeichnet den Stapel auf den Bildschirm.
+        Aktualisiert das Sprite der obersten Stapelkarte.
         """
         card_width, card_height, card_gap = self.get_card_measurements()
         x = self.screen.get_width() / 2 + card_gap / 2
         y = self.screen.get_height() / 2 - card_height / 2
 
-        if self.stack.cards:
-            card = self.stack.cards[-1]  # Wähle die oberste Karte des Stapels
-            card_image = card.get_image()
-            card_surface = pygame.transform.scale(card_image, (int(card_width), int(card_height)))
-            self.screen.blit(card_surface, (x, y))  # Zeichne die Karte auf der Oberfläche
+        if self.round.stack_top is not None:
+            card_surface = self.assets.get_scaled_card(self.round.stack_top, True, card_width, card_height)  # Oberste Karte des Stapels
+            self.table.set_image("stack", card_surface, (x, y))
+        else:
+            self.table.hide("stack")
 
     def draw_deck(self):
         """
-        Zeichnet das Deck auf den Bildschirm.
+        Aktualisiert das Sprite des Decks.
         """
         card_width, card_height, card_gap = self.get_card_measurements()
         x = self.screen.get_width() / 2 - (card_width + card_gap / 2)
         y = self.screen.get_height() / 2 - card_height / 2
 
-        card_surface = pygame.transform.scale(self.assets.CardBack, (int(card_width), int(card_height)))
-        self.screen.blit(card_surface, (x, y))  # Zeichne die Rückseite der Deckkarte
+        card_surface = self.assets.get_scaled_card(None, False, card_width, card_height)
+        self.table.set_image("deck", card_surface, (x, y))  # Rückseite der Deckkarte
 
     def draw_player_hand(self, player_index):
         """
-        Zeichnet die Kartenhand des angegebenen Spielers auf den Bildschirm.
+        Aktualisiert die Sprites der Kartenhand des angegebenen Spielers.
 
         Input:
         - player_index: Der Index des Spielers, dessen Kartenhand gezeichnet werden soll.
@@ -518,62 +384,20 @@ class Gameplay(State):
         for row in range(rows):
             for col in range(cols):
                 index = row * cols + col
-                card = self.players_hands[player_index][index]
+                card = self.round.hands[player_index][index]
 
                 if card.elim:
-                    continue  # Überspringe eliminierte Karten
+                    self.table.hide(("hand", player_index, index))  # Eliminierte Karten ausblenden
+                    continue
 
                 x = start_x + col * (card_width + card_gap)
                 y = start_y + row * (card_height + card_gap)
 
-                card_image = card.get_image()
+                # Skalierte (und ggf. gedrehte) Karte aus dem Cache, hervorgehobene Karten sind größer
+                card_surface = self.assets.get_scaled_card(card.value, card.visible, card_width, card_height,
+                                                           card.highlighted, rotation_angle)
 
-                # Anpassung der Skalierung, wenn die Karte markiert ist
-                scale = 1.1 if card.highlighted else 1.0
-                card_width_scaled = int(card_width * scale)
-                card_height_scaled = int(card_height * scale)
-
-                card_surface = pygame.transform.scale(card_image, (card_width_scaled, card_height_scaled))
-                if rotation_angle != 0:
-                    card_surface = pygame.transform.rotate(card_surface, rotation_angle)
-
-                self.screen.blit(card_surface, (x, y))  # Zeichne die Karte auf der Oberfläche
-
-    def check_three_in_a_row(self, player_index):
-        """
-        Überprüft, ob der angegebene Spieler drei gleiche, hervorgehobene Karten in einer vertikalen Reihe hat.
-
-        Input:
-        - player_index: Der Index des Spielers, dessen Karten überprüft werden sollen.
-
-        Output:
-        - Keine.
-        """
-        hand = self.players_hands[player_index]
-        rows = 3
-        cols = 4
-
-        # Überprüfe alle möglichen 3er-Reihen vertikal
-        for col in range(cols):
-            for row in range(rows - 2):  # Es gibt nur rows - 2 Möglichkeiten, eine 3er-Reihe zu beginnen
-                index1 = row * cols + col
-                index2 = (row + 1) * cols + col
-                index3 = (row + 2) * cols + col
-
-                if (0 <= index1 < len(hand) and
-                        0 <= index2 < len(hand) and
-                        0 <= index3 < len(hand)):
-
-                    card1 = hand[index1]
-                    card2 = hand[index2]
-                    card3 = hand[index3]
-
-                    if (card1.value == card2.value == card3.value and
-                            -2 <= card1.value and
-                            card1.visible and
-                            card2.visible and
-                            card3.visible):
-                        remove_three_in_a_row([card1, card2, card3])
+                self.table.set_image(("hand", player_index, index), card_surface, (x, y))
 
     def Calculate_player_score(self, player_index):
         """
@@ -585,25 +409,18 @@ class Gameplay(State):
         Output:
         - player_score: Die berechnete Punktzahl des Spielers.
         """
-        player_score = 0
-        for card in self.players_hands[player_index]:
-            if card.visible and not card.elim:
-                player_score += card.value
-        return player_score
+        return self.round.hands[player_index].score()
 
     def draw_player_score(self):
         """
-        Zeichnet die Punktzahl aller Spieler rechts neben der Spielerhand auf den Bildschirm.
+        Zeigt die Punktzahl aller Spieler rechts neben der Spielerhand an. Neu gerendert wird
+        ein Text nur, wenn sich Name oder Punktzahl ändern.
 
         """
         for i in range(self.player_count):
             player_score = self.Calculate_player_score(i)
             player_name = self.player_names[i] if i < len(self.player_names) else f"Player {i + 1}"
 
-            # Render den Text für Punktzahl und Namen
-            score_text = self.font.render(f"Score: {player_score}", True, pygame.Color("white"))
-            name_text = self.font.render(player_name, True, pygame.Color("yellow"))
-
             # Berechne die Position des Textes basierend auf der Spielerposition
             if i == 0:  # Spieler unten
                 x = self.screen.get_width() / 2 + 2 * (self.card_width + self.card_gap)
@@ -618,40 +435,31 @@ class Gameplay(State):
                 x = self.screen.get_width() - 3 * (self.card_height + self.card_gap)
                 y = self.screen.get_height() / 2 - 3 * (self.card_width + self.card_gap) + self.card_gap
 
-            # Zeichne den Namen oberhalb der Punktzahl
-            self.screen.blit(name_text, (x, y - 30))  # Position des Namens anpassen
-            self.screen.blit(score_text, (x, y))  # Position der Punktzahl
+            # Zeige den Namen oberhalb der Punktzahl an
+            self.table.set_text(("name", i), player_name, self.font, "yellow", (x, y - 30))
+            self.table.set_text(("score", i), f"Score: {player_score}", self.font, "white", (x, y))
 
     def round_over(self):
         """
-        Wechselt den Spielzustand zu 'Round Summary', deckt alle verdeckten Karten auf, berechnet die Punktzahlen
-        und wechselt zum nächsten Zustand.
+        Übernimmt die Punktzahlen der Runde und wechselt nach 5 Sekunden zum Scoreboard.
+        Bis dahin zeigt draw() die aufgedeckten Karten aller Spieler weiter an.
 
         """
-        # 1. Decke alle verdeckten Karten aller Spieler auf
-        for i in range(self.player_count):
-            for card in self.players_hands[i]:
-                if not card.visible:
-                    self.deck.turn_card(card)
-
-        # 2. Warte 5 Sekunden
-        self.draw(self.screen)  # Aktualisiere den Bildschirm, damit die Spieler die aufgedeckten Karten sehen können
-        time.sleep(5)
+        # 1. Übernimm die Punktzahlen der Spieler
+        self.persist['current_round_score'] = self.round.scores()
 
-        # 3. Berechne die Punktzahlen der Spieler
-        current_round_score = []
-        for i in range(self.player_count):
-            score = self.Calculate_player_score(i)
-            current_round_score.append(score)
+        # Speichere den ersten Spieler, der alle Karten umgedreht hat (1-basiert)
+        first_to_finish = self.round.first_to_finish
+        self.persist['first_to_finish'] = first_to_finish + 1 if first_to_finish is not None else None
+        if first_to_finish is not None:
+            STATES.debug("Player %d was the first to flip all their cards!", first_to_finish + 1)
 
-        self.persist['current_round_score'] = current_round_score
+        # 2. Wechsel nach 5 Sekunden zum nächsten Zustand
+        self.schedule(5, self.show_scoreboard)
 
-        # Prüfen, ob der erste Spieler, der alle Karten umgedreht hat, gespeichert wurde
-        if self.first_to_finish is not None:
-            print(f"Player {self.first_to_finish} was the first to flip all their cards!")
-
-        # Wechsel zum nächsten Zustand
+    def show_scoreboard(self):
+        """
+        Wechselt zum Scoreboard.
+        """
         self.next_state = "SCOREBOARD"
         self.done = True
-
-
@@ -1,5 +1,6 @@
 import pygame
 from States.base import State
+from GameAssets import get_font
 
 class Local(State):
     def __init__(self, assets=None):
@@ -15,12 +16,12 @@ class Local(State):
         self.options = ["Multi-player", "Single-player", "Quit Game"]
         self.next_state = "PLAYER_SELECT"
         self.active_index = 0
-        self.font = pygame.font.Font(None, 50)
-        self.button_font = pygame.font.Font(None, 40)
+        self.font = get_font(None, 50)
+        self.button_font = get_font(None, 40)
 
         self.screen_rect = pygame.display.get_surface().get_rect()
 
-        self.button_text = self.button_font.render("Main Menu", True, pygame.Color("white"))
+        self.button_text = self.assets.render_text(self.button_font, "Main Menu", pygame.Color("white"))
         self.button_rect = self.button_text.get_rect(topleft=(10, self.screen_rect.height - self.button_text.get_height() - 30))
 
         self.update_text_positions()
@@ -36,7 +37,7 @@ class Local(State):
         - Ein gerendertes Text-Objekt für die Menüoption.
         """
         color = pygame.Color("red") if index == self.active_index else pygame.Color("white")
-        return self.font.render(self.options[index], True, color)
+        return self.assets.render_text(self.font, self.options[index], color)
 
     def get_text_position(self, text, index):
         """
@@ -1,5 +1,6 @@
 import pygame
 from States.base import State
+from GameAssets import get_font
 
 class Menu(State):
     def __init__(self, assets=None):
@@ -8,7 +9,7 @@ class Menu(State):
         self.options = ["Start Game", "Rules", "Options", "Quit Game"]  # Neuer Button für "Rules"
         self.next_state = "PLAYER_SELECT"  # Dies wird durch handle_action angepasst
         self.active_index = 0
-        self.font = pygame.font.Font(None, 50)
+        self.font = get_font(None, 50)
         self.screen_rect = pygame.display.get_surface().get_rect()
         self.update_text_positions()  # Initial Positionen setzen
 
@@ -21,7 +22,7 @@ class Menu(State):
 
     def render_text(self, index):
         color = pygame.Color("red") if index == self.active_index else pygame.Color("white")
-        return self.font.render(self.options[index], True, color)
+        return self.assets.render_text(self.font, self.options[index], color)
 
     def get_text_position(self, text, index):
         # Berechnet die Position der Textelemente basierend auf der aktuellen Bildschirmgröße
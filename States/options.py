@@ -1,5 +1,6 @@
 import pygame
 from States.base import State
+from GameAssets import get_font
 
 
 class Options(State):
@@ -14,7 +15,7 @@ class Options(State):
         super(Options, self).__init__()
         self.assets = assets
         self.screen_rect = pygame.display.get_surface().get_rect()
-        self.font = pygame.font.Font(None, 50)
+        self.font = get_font(None, 50)
 
         # Initiale Lautstärkewerte aus den GameAssets
         self.music_volume = self.assets.music_volume
@@ -27,7 +28,7 @@ class Options(State):
                                  self.sfx_volume)
 
         # Erstellen des "Main Menu"-Buttons
-        self.button_font = pygame.font.Font(None, 40)
+        self.button_font = get_font(None, 40)
         self.button_text = self.button_font.render("Main Menu", True, pygame.Color("white"))
         self.button_rect = self.button_text.get_rect(
             topleft=(10, self.screen_rect.height - self.button_text.get_height() - 30))
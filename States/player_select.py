@@ -1,5 +1,7 @@
 from States.base import State
 import pygame
+from GameAssets import get_font
+from GameLog import STATES
 
 class PlayerSelect(State):
 
@@ -21,8 +23,8 @@ class PlayerSelect(State):
         self.warn_message = None
 
         self.next_state = "GAMEPLAY"
-        self.font = pygame.font.Font(None, 50)
-        self.button_font = pygame.font.Font(None, 40)
+        self.font = get_font(None, 50)
+        self.button_font = get_font(None, 40)
 
         self.screen_rect = pygame.display.get_surface().get_rect()
 
@@ -167,6 +169,6 @@ class PlayerSelect(State):
 
         self.persist['player_count'] = len(active_players)
         self.persist['player_names'] = active_players
-        print(f"Debug: Spieleranzahl = {len(active_players)}")
-        print(f"Debug: Spieler-Namen = {active_players}")
+        self.reset_match_rng()
+        STATES.debug("Spieleranzahl = %d, Spieler-Namen = %s", len(active_players), active_players)
         return super(PlayerSelect, self).cleanup()
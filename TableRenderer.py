@@ -0,0 +1,154 @@
+import pygame
+
+
+class TableSprite(pygame.sprite.DirtySprite):
+    def __init__(self, layer=0):
+        """
+        Erstellt ein leeres Sprite für eine Position auf dem Spieltisch (Karte, Text, Nachricht).
+
+        Input:
+        - layer: Ebene des Sprites, höhere Ebenen liegen oben.
+        """
+        super(TableSprite, self).__init__()
+        self._layer = layer
+        self.image = pygame.Surface((0, 0))
+        self.rect = self.image.get_rect()
+        self.text = None  # Zuletzt gerenderter Text (nur bei Text-Sprites)
+        self.visible = 0
+
+
+class TableRenderer:
+    def __init__(self, background_color):
+        """
+        Retained-Mode-Renderer für die Gameplay-Zustände. Der Tisch besteht aus Sprites, die
+        über set_image, set_text und hide aktualisiert werden. Nur Sprites, deren Bild oder
+        Position sich geändert hat, werden neu gezeichnet; draw() gibt die geänderten
+        Rechtecke für pygame.display.update zurück.
+
+        Input:
+        - background_color: Farbe des Tisches.
+        """
+        self.background_color = pygame.Color(background_color)
+        self.background = None
+        self.size = None
+        self.sprites = pygame.sprite.LayeredDirty()
+        self.slots = {}  # Schlüssel (z.B. ("hand", 0, 5), "deck", "stack") -> TableSprite
+
+    def reset(self, surface):
+        """
+        Passt den Hintergrund an die Größe der Oberfläche an und zeichnet beim nächsten
+        draw() den ganzen Tisch neu.
+
+        Input:
+        - surface: Die Oberfläche, auf der gezeichnet wird.
+        """
+        self.size = surface.get_size()
+        self.background = pygame.Surface(self.size).convert()
+        self.background.fill(self.background_color)
+        self.sprites.clear(surface, self.background)
+        self.sprites.repaint_rect(surface.get_rect())
+
+    def repaint(self, rect):
+        """
+        Zeichnet einen Bereich beim nächsten draw() mit Hintergrund und allen Sprites neu.
+
+        Input:
+        - rect: Der neu zu zeichnende Bereich.
+        """
+        self.sprites.repaint_rect(rect)
+
+    def get_sprite(self, slot, layer=0):
+        """
+        Gibt das Sprite einer Position zurück und legt es bei Bedarf an.
+
+        Input:
+        - slot: Schlüssel der Position.
+        - layer: Ebene für ein neu angelegtes Sprite.
+
+        Output:
+        - Das TableSprite der Position.
+        """
+        sprite = self.slots.get(slot)
+        if sprite is None:
+            sprite = TableSprite(layer)
+            self.slots[slot] = sprite
+            self.sprites.add(sprite)
+        return sprite
+
+    def set_image(self, slot, image, pos, layer=0):
+        """
+        Zeigt ein Bild an einer Position. Ist Bild und Position unverändert, passiert nichts.
+
+        Input:
+        - slot: Schlüssel der Position.
+        - image: Die Oberfläche (z.B. aus GameAssets.get_scaled_card).
+        - pos: Linke obere Ecke (x, y).
+        - layer: Ebene des Sprites.
+        """
+        sprite = self.get_sprite(slot, layer)
+        pos = (int(pos[0]), int(pos[1]))
+        if sprite.visible and sprite.image is image and sprite.rect.topleft == pos:
+            return
+        sprite.image = image
+        sprite.rect = image.get_rect(topleft=pos)
+        sprite.visible = 1
+        sprite.dirty = 1
+
+    def set_text(self, slot, text, font, color, pos, layer=0, center=False, background=None, angle=0):
+        """
+        Zeigt einen Text an einer Position. Gerendert wird nur, wenn sich der Text ändert.
+
+        Input:
+        - slot: Schlüssel der Position.
+        - text: Der anzuzeigende Text.
+        - font: Die Schriftart.
+        - color: Die Textfarbe.
+        - pos: Linke obere Ecke oder, mit center=True, Mittelpunkt (x, y).
+        - layer: Ebene des Sprites.
+        - center: Ob pos der Mittelpunkt des Textes ist.
+        - background: Farbe eines Rechtecks hinter dem Text (optional).
+        - angle: Drehung des Textes in Grad.
+        """
+        sprite = self.get_sprite(slot, layer)
+        if sprite.text == text:
+            image = sprite.image
+        else:
+            image = font.render(text, True, pygame.Color(color))
+            if background is not None:
+                boxed = pygame.Surface((image.get_width() + 20, image.get_height() + 10))
+                boxed.fill(pygame.Color(background))
+                boxed.blit(image, (10, 5))
+                image = boxed
+            if angle:
+                image = pygame.transform.rotate(image, angle)
+            sprite.text = text
+            sprite.visible = 0  # Erzwingt das Neuzeichnen in set_image
+        if center:
+            pos = image.get_rect(center=(int(pos[0]), int(pos[1]))).topleft
+        self.set_image(slot, image, pos, layer)
+
+    def hide(self, slot):
+        """
+        Blendet das Sprite einer Position aus.
+
+        Input:
+        - slot: Schlüssel der Position.
+        """
+        sprite = self.slots.get(slot)
+        if sprite is not None and sprite.visible:
+            sprite.visible = 0
+            sprite.dirty = 1
+
+    def draw(self, surface):
+        """
+        Zeichnet alle geänderten Sprites und den dahinterliegenden Hintergrund.
+
+        Input:
+        - surface: Die Oberfläche, auf der gezeichnet wird.
+
+        Output:
+        - Liste der geänderten Rechtecke für pygame.display.update.
+        """
+        if surface.get_size() != self.size:
+            self.reset(surface)
+        return self.sprites.draw(surface)
@@ -0,0 +1,106 @@
+"""
+Tests für das Binärformat in Online/codec.py.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m pytest tests
+"""
+import random
+
+import pytest
+
+from Engine.rules import Round, Move, FLIP, DRAW, SWAP
+from Online.codec import (CODEC_VERSION, HEADER_FORMAT, encode_move, decode_move, encode_round, decode_round,
+                          encode_delta, decode_game_event, public_state, sample_messages)
+from Online.state_sync import CARD, ELIM, STACK, TURN, RESULT, MATCH, capture, empty_state, diff
+
+SEED = 1234
+
+
+@pytest.fixture(scope="module")
+def messages():
+    """Snapshots, Deltas und Züge aus zufällig gespielten Runden mit 2 bis 4 Spielern."""
+    rng = random.Random(SEED)
+    snapshots, deltas, moves = [], [], []
+    for player_count in (2, 3, 4):
+        round_snapshots, round_deltas, round_moves = sample_messages(5, player_count, rng)
+        snapshots += round_snapshots
+        deltas += round_deltas
+        moves += round_moves
+    return snapshots, deltas, moves
+
+
+@pytest.mark.parametrize("move", [Move(FLIP, 0), Move(FLIP, 11), Move(DRAW), Move(SWAP, 5)])
+def test_move_round_trip(move):
+    data = encode_move(move)
+    assert len(data) == 3
+    assert decode_move(data) == move
+
+
+def test_sampled_moves_round_trip(messages):
+    for move in messages[2]:
+        assert decode_move(encode_move(move)) == move
+
+
+def test_delta_round_trip_covers_every_operation():
+    ops = [[CARD, 3, 11, -2], [ELIM, 1, 0b100100100], [STACK, 12], [STACK, None], [TURN, 2, 1, 1],
+           [RESULT, [-4, 0, 130]], [MATCH, 1, [104, -3, 250]]]
+    event = decode_game_event(encode_delta(ops))
+    assert event == {'event': 'delta', 'ops': ops}
+
+
+def test_sampled_deltas_round_trip(messages):
+    for ops in messages[1]:
+        assert decode_game_event(encode_delta(ops))['ops'] == ops
+
+
+def test_snapshot_round_trip_hides_covered_cards(messages):
+    for seats, state in messages[0]:
+        decoded_seats, decoded_state = decode_round(encode_round(seats, state), HEADER_FORMAT.size)
+        assert decoded_seats == seats
+        assert decoded_state == public_state(state)
+
+
+def test_snapshot_event_rebuilds_the_table(messages):
+    seats, state = messages[0][-1]
+    event = decode_game_event(encode_round(seats, state))
+    assert event == {'event': 'round', 'seats': seats, 'ops': diff(empty_state(len(seats)), public_state(state))}
+
+
+def test_move_with_other_version_is_rejected():
+    data = bytes([CODEC_VERSION + 1]) + encode_move(Move(DRAW))[1:]
+    with pytest.raises(ValueError, match="version"):
+        decode_move(data)
+
+
+@pytest.mark.parametrize("data", [encode_delta([[STACK, 3]]),
+                                  encode_round(["1", "2"], capture(Round(2, rng=random.Random(SEED))))])
+def test_game_event_with_other_version_is_rejected(data):
+    with pytest.raises(ValueError, match="version"):
+        decode_game_event(bytes([CODEC_VERSION + 1]) + data[1:])
+
+
+def test_truncated_move_is_rejected():
+    with pytest.raises(ValueError):
+        decode_move(encode_move(Move(SWAP, 4))[:2])
+
+
+@pytest.mark.parametrize("ops", [[[CARD, 0, 1, 5]], [[ELIM, 0, 7]], [[TURN, 1, 1, 0]], [[RESULT, [10, 20]]],
+                                 [[MATCH, 0, [40, 101]]]])
+def test_truncated_delta_is_rejected(ops):
+    data = encode_delta(ops)
+    for length in range(HEADER_FORMAT.size + 1, len(data)):
+        with pytest.raises(ValueError):
+            decode_game_event(data[:length])
+
+
+def test_truncated_snapshot_is_rejected(messages):
+    seats, state = messages[0][0]
+    data = encode_round(seats, state)
+    for length in range(HEADER_FORMAT.size, len(data)):
+        with pytest.raises(ValueError):
+            decode_game_event(data[:length])
+
+
+def test_truncated_header_is_rejected():
+    with pytest.raises(ValueError):
+        decode_game_event(bytes([CODEC_VERSION]))
@@ -0,0 +1,112 @@
+"""
+Tests für die Frames mit Längenpräfix in Online/protocol.py. TCP darf Nachrichten beliebig
+zerteilen und zusammenfassen; FrameReader muss daraus wieder dieselben Frames machen.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m pytest tests
+"""
+import socket
+
+import pytest
+
+from Online.protocol import (HEADER, MAX_FRAME_SIZE, REQUEST, REPLY, MOVE, GAME, HEARTBEAT, FrameReader,
+                             encode_frame, encode_frames, read_frames)
+from Online.server import MAX_REQUEST_SIZE
+
+FRAMES = [(REQUEST, b"lobby"), (HEARTBEAT, b""), (MOVE, bytes([1, 2, 11])), (REPLY, "Größe".encode("utf-8")),
+          (GAME, bytes(range(256)) * 3)]
+
+
+def encoded(frames):
+    """Alle Frames hintereinander, so wie sie über die Verbindung gehen."""
+    return b"".join(encode_frame(payload, kind) for kind, payload in frames)
+
+
+def test_frame_round_trip():
+    reader = FrameReader()
+    for kind, payload in FRAMES:
+        assert reader.feed(encode_frame(payload, kind)) == [(kind, payload)]
+    assert reader.buffer == bytearray()
+
+
+def test_frame_fed_one_byte_at_a_time():
+    reader = FrameReader()
+    data = encode_frame(b"name:Anna", REQUEST)
+    for byte in data[:-1]:
+        assert reader.feed(bytes([byte])) == []
+    assert reader.feed(data[-1:]) == [(REQUEST, b"name:Anna")]
+    assert reader.buffer == bytearray()
+
+
+def test_all_frames_fed_one_byte_at_a_time():
+    reader = FrameReader()
+    received = []
+    for byte in encoded(FRAMES):
+        received += reader.feed(bytes([byte]))
+    assert received == FRAMES
+
+
+def test_several_frames_in_one_feed():
+    reader = FrameReader()
+    assert reader.feed(encoded(FRAMES)) == FRAMES
+    assert reader.buffer == bytearray()
+
+
+def test_encode_frames_matches_single_frames():
+    payloads = [b"lobby", "check_host", b""]
+    assert encode_frames(payloads, REPLY) == b"".join(encode_frame(payload, REPLY) for payload in payloads)
+    assert FrameReader().feed(encode_frames(payloads, REPLY)) == [(REPLY, b"lobby"), (REPLY, b"check_host"),
+                                                                  (REPLY, b"")]
+
+
+@pytest.mark.parametrize("split", range(1, HEADER.size))
+def test_header_split_across_two_feeds(split):
+    reader = FrameReader()
+    data = encode_frame(b"check_host", REQUEST)
+    assert reader.feed(data[:split]) == []
+    assert reader.feed(data[split:]) == [(REQUEST, b"check_host")]
+
+
+def test_complete_frames_are_returned_before_a_partial_one():
+    reader = FrameReader()
+    data = encoded(FRAMES)
+    cut = len(data) - 10
+    assert reader.feed(data[:cut]) == FRAMES[:-1]
+    assert reader.feed(data[cut:]) == FRAMES[-1:]
+
+
+def test_frame_over_limit_raises_instead_of_buffering():
+    reader = FrameReader(MAX_REQUEST_SIZE)
+    with pytest.raises(ValueError, match="too large"):
+        reader.feed(HEADER.pack(MAX_REQUEST_SIZE + 1, REQUEST))  # Der Kopf allein genügt
+
+
+def test_frame_at_limit_is_accepted():
+    reader = FrameReader(MAX_REQUEST_SIZE)
+    payload = b"x" * MAX_REQUEST_SIZE
+    assert reader.feed(encode_frame(payload, REQUEST)) == [(REQUEST, payload)]
+
+
+def test_default_limit_is_max_frame_size():
+    with pytest.raises(ValueError, match="too large"):
+        FrameReader().feed(HEADER.pack(MAX_FRAME_SIZE + 1, GAME))
+
+
+def test_encode_frame_rejects_payload_over_max_frame_size():
+    with pytest.raises(ValueError, match="too large"):
+        encode_frame(bytes(MAX_FRAME_SIZE + 1))
+
+
+def test_read_frames_waits_for_a_complete_frame():
+    client, server = socket.socketpair()
+    with client, server:
+        data = encoded(FRAMES[:2])
+        client.sendall(data[:3])
+        client.sendall(data[3:])
+        reader = FrameReader()
+        received = []
+        while len(received) < 2:
+            received += read_frames(server, reader)
+        assert received == FRAMES[:2]
+        client.shutdown(socket.SHUT_WR)
+        assert read_frames(server, reader) == []
@@ -0,0 +1,125 @@
+"""
+Tests für die Hand der Regel-Engine in Engine/rules.py: die mitgeführte Punktzahl (Hand.total)
+und die Dreierreihen-Prüfung, die nur geänderte Spalten ansieht.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m pytest tests
+"""
+import random
+
+import pytest
+
+from Engine.rules import Round, Hand, Move, HAND_SIZE, COLS, COLUMN_MASKS, SWAP, PHASE_TURN, PHASE_OVER
+
+SEED = 1234
+ROUNDS = 60  # Zufällig gespielte Runden je Spieleranzahl
+
+
+def recomputed_total(hand):
+    """Punktzahl aus allen offenen, nicht eliminierten Karten, ohne die mitgeführte Summe."""
+    return sum(hand.values[index] for index in range(HAND_SIZE) if hand.visible >> index & 1
+               and not hand.elim >> index & 1)
+
+
+def equal_open_columns(hand):
+    """Spalten mit drei gleichen, offenen und nicht eliminierten Karten."""
+    open_bits = hand.visible & ~hand.elim
+    return [col for col, mask in enumerate(COLUMN_MASKS) if open_bits & mask == mask
+            and hand.values[col] == hand.values[col + COLS] == hand.values[col + 2 * COLS]]
+
+
+@pytest.mark.parametrize("player_count", [2, 3, 4])
+def test_random_rounds_keep_total_and_eliminate_every_column(player_count):
+    rng = random.Random(SEED + player_count)
+    for _ in range(ROUNDS):
+        game_round = Round(player_count, rng=random.Random(rng.getrandbits(64)))
+        while game_round.phase != PHASE_OVER:
+            game_round.apply(rng.choice(game_round.legal_moves()))
+            for hand in game_round.hands:
+                assert hand.total == recomputed_total(hand)
+                if game_round.phase != PHASE_OVER:
+                    assert equal_open_columns(hand) == []
+        assert all(hand.all_visible() for hand in game_round.hands)
+        assert game_round.scores() == [recomputed_total(hand) for hand in game_round.hands]
+
+
+def test_swap_into_visible_slot_replaces_its_value():
+    hand = Hand([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8])
+    hand.flip(0)
+    hand.flip(5)
+    assert hand.total == 12
+    assert hand.swap(0, -2) == 3
+    assert hand.total == 7
+    assert hand.swap(0, 10) == -2
+    assert hand.total == 19 == recomputed_total(hand)
+
+
+def test_swap_into_hidden_slot_opens_it():
+    hand = Hand([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8])
+    assert hand.swap(7, 0) == 6
+    assert hand.visible == 1 << 7
+    assert hand.total == 0
+
+
+def test_swap_completing_a_column_eliminates_it():
+    hand = Hand([7, 1, 4, 1, 7, 9, 2, 6, 5, 3, 5, 8])
+    for index in (0, 4, 1):
+        hand.flip(index)
+    assert hand.check_three_in_a_row() == []
+    hand.swap(8, 7)
+    assert hand.check_three_in_a_row() == [0]
+    assert hand.elim == COLUMN_MASKS[0]
+    assert hand.total == 1 == recomputed_total(hand)
+
+
+def test_unchanged_column_is_not_checked_again():
+    hand = Hand([2, 1, 4, 1, 2, 9, 2, 6, 2, 3, 5, 8])
+    for index in (0, 4, 8):
+        hand.flip(index)
+    assert hand.check_three_in_a_row() == [0]
+    hand.flip(1)
+    assert hand.check_three_in_a_row() == []
+    assert hand.changed_columns == 0
+
+
+def test_round_swap_into_visible_slot_keeps_total():
+    game_round = Round(2, rng=random.Random(SEED))
+    while game_round.phase != PHASE_TURN:
+        game_round.apply(game_round.legal_moves()[0])
+    hand = game_round.current_hand
+    index = hand.open_indices()[0]
+    old_value, new_value = hand.values[index], game_round.stack_top
+    game_round.apply(Move(SWAP, index))
+    assert hand.values[index] == new_value
+    assert game_round.stack_top == old_value
+    assert hand.total == recomputed_total(hand)
+
+
+def test_reveal_all_at_round_end_counts_hidden_cards():
+    game_round = Round(3, rng=random.Random(SEED))
+    hand = game_round.hands[1]
+    hand.flip(2)
+    hand.flip(6)
+    game_round.round_over()
+    assert game_round.phase == PHASE_OVER
+    assert all(other.all_visible() for other in game_round.hands)
+    assert hand.total == sum(hand.values) == recomputed_total(hand)
+
+
+def test_reveal_all_skips_eliminated_column():
+    hand = Hand([4, 1, 2, 3, 4, 5, 6, 7, 4, 9, 10, 11])
+    for index in (0, 4, 8):
+        hand.flip(index)
+    hand.check_three_in_a_row()
+    hand.reveal_all()
+    assert hand.total == sum(hand.values) - 12 == recomputed_total(hand)
+
+
+def test_eliminate_from_server_state_updates_total():
+    hand = Hand([6, 1, 2, 3, 6, 5, 6, 7, 6, 9, 10, 11])
+    for index in (0, 4, 8, 1):
+        hand.flip(index)
+    hand.eliminate(COLUMN_MASKS[0])
+    assert hand.total == 1 == recomputed_total(hand)
+    hand.eliminate(COLUMN_MASKS[0])
+    assert hand.total == 1